@@ -0,0 +1,254 @@
+"""
+Common interface for LLM providers and a router that picks between them.
+
+Each provider (OpenRouter, Gemini, Groq) only has to implement a
+non-blocking ``complete``; the higher-level flows and prompts are shared.
+``ProviderRouter`` is itself an ``AIProvider`` that forwards each call to
+the provider with the best recent latency / error record and falls back
+to the next one when a call fails.
+"""
+import asyncio
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from models import Resume
+from prompts import Messages, build_parse_resume_messages, strip_code_fences
+
+logger = logging.getLogger(__name__)
+
+
+class AIProvider(ABC):
+    """Base class for chat-completion providers."""
+
+    name: str = "provider"
+    model: str = ""
+
+    @abstractmethod
+    async def complete(
+        self,
+        messages: Messages,
+        temperature: float,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """Run a chat completion and return the message text.
+
+        Implementations must not block the event loop and must let
+        ``asyncio.CancelledError`` propagate so cancelled requests free
+        their connection.
+        """
+
+    async def stream(
+        self,
+        messages: Messages,
+        temperature: float,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        """Yield the completion text in chunks as the provider produces it.
+
+        ``timeout`` bounds the wait for each chunk. Providers without native
+        streaming yield the whole completion as a single chunk.
+        """
+        yield await self.complete(messages, temperature, timeout)
+
+    async def aclose(self) -> None:
+        """Release any pooled connections held by the provider."""
+
+    async def parse_resume(
+        self, resume_text: str, pre_processed_hints: Dict[str, Any] = None
+    ) -> Resume:
+        """Parse resume text and extract structured information
+
+        Args:
+            resume_text: The raw text extracted from the resume
+            pre_processed_hints: Pre-processed structured data to help guide the AI parsing
+
+        Raises on provider or JSON errors; callers decide on a fallback.
+        """
+        content = await self.complete(
+            build_parse_resume_messages(resume_text, pre_processed_hints),
+            temperature=0.1,
+            timeout=30,
+        )
+        parsed_data = json.loads(strip_code_fences(content))
+        logger.debug(f"AI parsed data ({self.name}): {parsed_data}")
+        return Resume(**parsed_data)
+
+
+class ProviderStats:
+    """Exponentially weighted latency and error rate for one provider."""
+
+    def __init__(self, alpha: float = 0.2) -> None:
+        self.alpha = alpha
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.calls = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+
+    def record(self, latency: float, ok: bool) -> None:
+        self.calls += 1
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self.alpha * (latency - self.latency)
+        self.error_rate += self.alpha * ((0.0 if ok else 1.0) - self.error_rate)
+        if ok:
+            self.consecutive_failures = 0
+        else:
+            self.failures += 1
+            self.consecutive_failures += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+            "error_rate": round(self.error_rate, 3),
+            "calls": self.calls,
+            "failures": self.failures,
+            "cooling_down": self.cooldown_until > time.monotonic(),
+        }
+
+
+class ProviderRouter(AIProvider):
+    """Routes each completion to the currently best-performing provider.
+
+    Providers are ranked by ``latency * (1 + error_penalty * error_rate)``.
+    Providers without measurements use ``initial_latency`` so they get
+    tried, and a provider that fails ``max_consecutive_failures`` times in
+    a row is skipped for ``cooldown_seconds`` unless nothing else is left.
+
+    ``timeout`` (``default_timeout`` when not given) bounds the whole call,
+    fallbacks included: each provider only gets the time the ones before it
+    left over.
+    """
+
+    name = "router"
+
+    def __init__(
+        self,
+        providers: List[AIProvider],
+        initial_latency: float = 5.0,
+        error_penalty: float = 4.0,
+        max_consecutive_failures: int = 3,
+        cooldown_seconds: float = 60.0,
+        default_timeout: float = 60.0,
+    ) -> None:
+        if not providers:
+            raise ValueError("ProviderRouter needs at least one provider")
+        self.providers = providers
+        self.initial_latency = initial_latency
+        self.error_penalty = error_penalty
+        self.max_consecutive_failures = max_consecutive_failures
+        self.cooldown_seconds = cooldown_seconds
+        self.default_timeout = default_timeout
+        self.stats: Dict[str, ProviderStats] = {p.name: ProviderStats() for p in providers}
+
+    @property
+    def model(self) -> str:  # type: ignore[override]
+        return ",".join(f"{p.name}:{p.model}" for p in self.providers)
+
+    def _score(self, provider: AIProvider) -> float:
+        stats = self.stats[provider.name]
+        latency = stats.latency if stats.latency is not None else self.initial_latency
+        return latency * (1 + self.error_penalty * stats.error_rate)
+
+    def ranked(self) -> List[AIProvider]:
+        """Providers in the order they should be tried for the next call."""
+        now = time.monotonic()
+        order = {p.name: i for i, p in enumerate(self.providers)}
+        return sorted(
+            self.providers,
+            key=lambda p: (
+                self.stats[p.name].cooldown_until > now,
+                self._score(p),
+                order[p.name],
+            ),
+        )
+
+    def _record(self, provider: AIProvider, started: float, ok: bool) -> None:
+        stats = self.stats[provider.name]
+        stats.record(time.monotonic() - started, ok)
+        if not ok and stats.consecutive_failures >= self.max_consecutive_failures:
+            stats.cooldown_until = time.monotonic() + self.cooldown_seconds
+            logger.warning(
+                f"AI provider {provider.name} failed {stats.consecutive_failures} times in a row; "
+                f"cooling down for {self.cooldown_seconds}s"
+            )
+
+    async def complete(
+        self,
+        messages: Messages,
+        temperature: float,
+        timeout: Optional[float] = None,
+    ) -> str:
+        last_error: Optional[Exception] = None
+        deadline = time.monotonic() + (timeout or self.default_timeout)
+        for provider in self.ranked():
+            started = time.monotonic()
+            remaining = deadline - started
+            if remaining <= 0:
+                last_error = asyncio.TimeoutError("AI call deadline exceeded")
+                break
+            try:
+                content = await asyncio.wait_for(provider.complete(messages, temperature, remaining), remaining)
+            except Exception as e:
+                self._record(provider, started, ok=False)
+                logger.warning(f"AI provider {provider.name} failed: {e}")
+                last_error = e
+                continue
+            self._record(provider, started, ok=True)
+            return content
+        raise RuntimeError(f"All AI providers failed: {last_error}") from last_error
+
+    async def stream(
+        self,
+        messages: Messages,
+        temperature: float,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        """Stream from the best provider.
+
+        Falls back to the next provider only if one fails before producing
+        its first chunk; a stream cannot be switched once text was sent.
+        Each fallback gets what is left of ``timeout`` as its chunk timeout.
+        """
+        last_error: Optional[Exception] = None
+        deadline = time.monotonic() + (timeout or self.default_timeout)
+        for provider in self.ranked():
+            started = time.monotonic()
+            remaining = deadline - started
+            if remaining <= 0:
+                last_error = asyncio.TimeoutError("AI call deadline exceeded")
+                break
+            produced = False
+            try:
+                async for chunk in provider.stream(messages, temperature, remaining):
+                    produced = True
+                    yield chunk
+            except Exception as e:
+                self._record(provider, started, ok=False)
+                if produced:
+                    raise
+                logger.warning(f"AI provider {provider.name} failed to stream: {e}")
+                last_error = e
+                continue
+            self._record(provider, started, ok=True)
+            return
+        raise RuntimeError(f"All AI providers failed: {last_error}") from last_error
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-provider routing statistics, for health/debug endpoints."""
+        return {
+            p.name: {"model": p.model, **self.stats[p.name].to_dict()}
+            for p in self.providers
+        }
+
+    async def aclose(self) -> None:
+        for provider in self.providers:
+            try:
+                await provider.aclose()
+            except Exception as e:
+                logger.error(f"Error closing AI provider {provider.name}: {e}")
@@ -30,6 +30,73 @@ class Settings(BaseSettings):
     redis_cache_ttl: int = 3600  # 1 hour default
     redis_user_cache_ttl: int = 1800  # 30 minutes for user data
     redis_ai_cache_ttl: int = 7200  # 2 hours for AI responses
+
+    # In-process L1 cache in front of Redis (kept coherent via Redis pub/sub)
+    local_cache_enabled: bool = True
+    local_cache_max_entries: int = 2048
+    local_cache_ttl: int = 60  # seconds; caps how long an entry lives in L1
+
+    # Cross-worker lock held while one worker computes a coalesced AI call;
+    # must exceed the longest AI call timeout (the router's fallbacks share
+    # one call's timeout, so the number of providers doesn't matter)
+    single_flight_lock_ttl: int = 150
+
+    # Background job queue (resume parsing); Redis-backed when Redis is up
+    job_queue_concurrency: int = 4
+    job_ttl: int = 3600  # how long job status/results are kept, seconds
+    job_max_attempts: int = 2  # runs before a job whose worker died is failed
+    job_heartbeat_interval: float = 15.0  # seconds; a worker silent for 3x this is presumed dead
+
+    # PDF/DOCX text extraction process pool
+    extraction_workers: int = 0  # 0 = one per available core
+    extraction_timeout: float = 20.0  # per document, seconds
+    extraction_memory_limit_mb: int = 512  # address space cap per worker
+
+    # PDF extraction budget; pages past it are noise for the LLM
+    pdf_max_pages: int = 6
+    pdf_max_chars: int = 30000
+    pdf_min_page_quality: float = 0.6  # below this a page is retried with pdfminer
+
+    # Extracted text / AI parse results for uploaded files, by content hash
+    upload_cache_ttl: int = 604800  # 7 days
+
+    # In-memory job posting index; oldest postings are evicted past the cap
+    job_index_max_postings: int = 50000
+
+    # Resume version history: every Nth version is a full snapshot, the
+    # versions in between are JSON patches against the previous version
+    resume_version_keyframe_interval: int = 20
+    # Autosaves take a version at most once per window, unless the change
+    # since the last version is at least this large (JSON patch bytes)
+    resume_version_window: int = 300  # seconds
+    resume_version_min_diff_bytes: int = 2000
+    # Bulk resume operations are sent to MongoDB in unordered batches of this size
+    resume_bulk_batch_size: int = 500
+
+    # Job postings store: sources are scraped in the background and searches
+    # read the stored postings. Sources are "name:ttl_seconds"; use "fixture"
+    # to serve the bundled fixture postings offline.
+    job_sources: str = "indeed:3600,linkedin:3600,glassdoor:7200"
+    job_refresh_skills: str = "Python,JavaScript,TypeScript,React,Node.js,Java,Go,SQL,AWS,Docker,Kubernetes,Machine Learning"
+    job_refresh_limit: int = 50  # postings requested per source refresh
+    job_refresh_tick: float = 60.0  # seconds between schedule checks and index syncs
+    job_refresh_retry: float = 300.0  # seconds before retrying a source whose refresh failed
+    job_posting_retention: int = 259200  # postings not scraped again expire after 3 days
+    job_fixture_path: str = ""  # defaults to fixtures/job_postings.json
+
+    # Job scraping HTTP client (one pool per worker) and per-source limits
+    scraper_timeout: float = 15.0
+    scraper_connect_timeout: float = 5.0
+    scraper_max_connections: int = 20
+    scraper_max_keepalive_connections: int = 10
+    scraper_source_concurrency: int = 2  # requests in flight per source
+    scraper_source_rate: float = 1.0  # sustained requests per second per source
+    scraper_source_burst: int = 3
+    scraper_max_retries: int = 3
+    scraper_backoff_base: float = 0.5  # seconds; doubled per retry, fully jittered
+    scraper_backoff_max: float = 10.0
+    scraper_breaker_failures: int = 5  # consecutive failed calls before a source is skipped
+    scraper_breaker_reset: float = 300.0  # seconds before a skipped source is tried again
     
     # OpenAI
     openai_api_key: str
@@ -38,6 +105,27 @@ class Settings(BaseSettings):
     # OpenRouter
     open_router_key: str
     open_router_model: str = "openai/gpt-oss-20b:free"
+    open_router_base_url: str = "https://openrouter.ai/api/v1"
+
+    # AI HTTP client pool (shared by all LLM calls in a worker)
+    ai_request_timeout: float = 60.0  # upper bound for a single LLM call, seconds
+    ai_connect_timeout: float = 10.0
+    ai_max_connections: int = 100
+    ai_max_keepalive_connections: int = 20
+    ai_max_retries: int = 2
+    # Providers the AI router may use, in order of preference; providers
+    # without an API key or installed SDK are skipped.
+    ai_providers: str = "openrouter,groq,gemini"
+
+    # Prompt token budgets for variable content (estimated locally)
+    ai_resume_text_token_budget: int = 6000  # raw text sent for parsing
+    ai_resume_token_budget: int = 3000  # structured resume JSON
+    ai_job_description_token_budget: int = 1500
+
+    # Batch scoring: job descriptions packed per LLM call and calls in flight
+    ai_batch_score_token_budget: int = 8000
+    ai_batch_score_max_items: int = 5
+    ai_batch_score_concurrency: int = 4
 
     # Groq
     groq_api_key: str
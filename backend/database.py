@@ -1,6 +1,7 @@
-from beanie import Document, init_beanie
+from beanie import Document, PydanticObjectId, init_beanie
 from pydantic import BaseModel, EmailStr, Field
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 import logging
@@ -93,6 +94,13 @@ class Resume(Document):
     font_family: str = "font-sans"
     accent_color: str = "#2563eb"
     
+    # Bumped by every content write, for optimistic concurrency
+    revision: int = 0
+    
+    # Version history bookkeeping
+    version_counter: int = 0  # last allocated version number
+    versioned_at: Optional[datetime] = None  # when the last version was taken
+    
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
@@ -102,37 +110,102 @@ class Resume(Document):
             "user_id",
             "created_at",
             "updated_at",
-            ("user_id", "is_default")
+            ("user_id", "is_default"),
+            IndexModel([("user_id", ASCENDING), ("updated_at", DESCENDING)])
         ]
 
+class ResumeSummary(BaseModel):
+    """Projection of Resume for list views: no resume content is read"""
+    id: PydanticObjectId = Field(alias="_id")
+    title: str = "My Resume"
+    is_default: bool = False
+    template_id: str = "basic"
+    created_at: datetime
+    updated_at: datetime
+
+class ResumeRef(BaseModel):
+    """Projection of Resume for stats and default lookups"""
+    id: PydanticObjectId = Field(alias="_id")
+    updated_at: datetime
+
+class ResumeSkills(BaseModel):
+    """Projection of Resume for skill-based job matching"""
+    id: PydanticObjectId = Field(alias="_id")
+    skills: List[str] = []
+
 class ResumeVersion(Document):
-    """Resume version history for tracking changes"""
+    """Resume version history for tracking changes
+
+    Keyframes hold a full snapshot of the resume; delta versions hold only
+    a JSON patch from the previous version, and are restored by applying
+    the patches after their keyframe in order. Fields a version does not
+    use are left out of the stored document.
+    """
     resume_id: str = Field(index=True)  # Reference to Resume._id
     user_id: str = Field(index=True)    # Reference to User._id
     version_number: int
     title: str
+    kind: str = "keyframe"  # "keyframe" or "delta"
+    keyframe_version: Optional[int] = None  # keyframe this version is rebuilt from
+    base_version: Optional[int] = None  # deltas: version the patch applies to
+    patch: Optional[List[Dict[str, Any]]] = None  # deltas: JSON patch from the previous version
     
-    # Snapshot of resume data at this version
-    personal_info: PersonalInfo
-    professional_summary: str = ""
-    skills: List[str] = []
-    experience: List[Experience] = []
-    education: List[Education] = []
-    projects: List[Project] = []
-    certifications: List[Certification] = []
-    template_id: str = "basic"
-    font_family: str = "font-sans"
-    accent_color: str = "#2563eb"
+    # Snapshot of resume data at this version (keyframes only)
+    personal_info: Optional[PersonalInfo] = None
+    professional_summary: Optional[str] = None
+    skills: Optional[List[str]] = None
+    experience: Optional[List[Experience]] = None
+    education: Optional[List[Education]] = None
+    projects: Optional[List[Project]] = None
+    certifications: Optional[List[Certification]] = None
+    template_id: Optional[str] = None
+    font_family: Optional[str] = None
+    accent_color: Optional[str] = None
     
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
     class Settings:
         name = "resume_versions"
+        keep_nulls = False
         indexes = [
             "resume_id",
             "user_id",
             "version_number",
-            "created_at"
+            "created_at",
+            ("resume_id", "version_number")
+        ]
+
+class JobPostingDocument(Document):
+    """Scraped job posting, refreshed in the background and read by job search"""
+    posting_key: str  # "<title>|<company>", lowercased; one document per posting
+    posting_id: str
+    title: str
+    company: str
+    location: str = ""
+    description: str = ""
+    requirements: List[str] = []
+    skills: List[str] = []
+    skill_keys: List[str] = []  # normalized skill names, for skill queries
+    salary_range: Optional[str] = None
+    job_type: str = ""
+    experience_level: str = ""
+    posted_date: datetime
+    application_url: str = ""
+    source: str
+    remote: bool = False
+
+    scraped_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: datetime  # removed by MongoDB's TTL monitor once passed
+
+    class Settings:
+        name = "job_postings"
+        indexes = [
+            IndexModel([("posting_key", ASCENDING)], unique=True),
+            IndexModel([("scraped_at", ASCENDING)]),
+            IndexModel([("source", ASCENDING), ("scraped_at", DESCENDING)]),
+            IndexModel([("skill_keys", ASCENDING)]),
+            IndexModel([("job_type", ASCENDING), ("experience_level", ASCENDING), ("remote", ASCENDING)]),
+            IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
         ]
 
 async def init_database(retry_count: int = 5, retry_delay: int = 5):
@@ -162,7 +235,7 @@ async def init_database(retry_count: int = 5, retry_delay: int = 5):
             # Initialize beanie with the User and Resume models
             await init_beanie(
                 database=mongodb_client[settings.database_name],
-                document_models=[User, Resume, ResumeVersion]
+                document_models=[User, Resume, ResumeVersion, JobPostingDocument]
             )
             
             logger.info("Database initialized successfully")
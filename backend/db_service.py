@@ -1,12 +1,39 @@
-from database import User, Resume, ResumeVersion, PersonalInfo
-from typing import Optional, List, Dict, Any, Union
+from database import User, Resume, ResumeVersion, PersonalInfo, ResumeRef, ResumeSkills, ResumeSummary
+from typing import Optional, List, Dict, Any, Callable, Union
 from datetime import datetime
+from beanie import UpdateResponse
+from beanie.odm.utils.dump import get_dict
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import DeleteOne, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
 import bcrypt
+import json
 import logging
 
+from core.config import settings
+from core.exceptions import ConflictError, ValidationError
+from utils.field_updates import FieldUpdateError, apply_operations, build_update
+from utils.json_patch import Patch, apply_patch, make_patch
+from utils.local_cache import LocalCache
+
 logger = logging.getLogger(__name__)
 
+# Resume fields captured by a version
+VERSIONED_FIELDS = (
+    "title", "personal_info", "professional_summary", "skills", "experience",
+    "education", "projects", "certifications", "template_id", "font_family", "accent_color",
+)
+
+# Resume fields updates may not set directly
+PROTECTED_FIELDS = {
+    "id", "revision_id", "user_id", "created_at", "updated_at", "revision", "version_counter", "versioned_at"
+}
+
+# resume_id -> (version_number, keyframe_version, content) of the latest
+# version built in this worker, so the next delta doesn't have to rebuild it
+_latest_version_content = LocalCache(max_entries=1024, default_ttl=3600)
+
 class UserService:
     """Service class for user-related database operations"""
     
@@ -131,6 +158,52 @@ def convert_dates_for_database(data: Any) -> Any:
     else:
         return data
 
+def resume_version_content(document: Union[Resume, ResumeVersion]) -> Dict[str, Any]:
+    """JSON-ready versioned fields of a resume or keyframe."""
+    return document.model_dump(mode="json", include=set(VERSIONED_FIELDS))
+
+class VersioningPolicy:
+    """Decides whether an autosave should take a version.
+    
+    Edits are coalesced: a version is taken when ``window`` seconds have
+    passed since the last one, or when the change since the last version
+    reaches ``min_diff_bytes`` of JSON patch.
+    """
+    
+    def __init__(self, window: float, min_diff_bytes: int):
+        self.window = window
+        self.min_diff_bytes = min_diff_bytes
+    
+    def should_version(self, versioned_at: Optional[datetime], now: datetime, patch: Patch) -> bool:
+        if not patch:
+            return False
+        if versioned_at is None or (now - versioned_at).total_seconds() >= self.window:
+            return True
+        return len(json.dumps(patch)) >= self.min_diff_bytes
+
+versioning_policy = VersioningPolicy(settings.resume_version_window, settings.resume_version_min_diff_bytes)
+
+def _bulk_result(index: int, resume_id: Optional[str], status: str, error: Optional[str] = None, **extra: Any) -> Dict[str, Any]:
+    result = {"index": index, "id": resume_id, "status": status, **extra}
+    if error:
+        result["error"] = error
+    return result
+
+async def _bulk_write(collection: Any, operations: List[Any]) -> Dict[int, str]:
+    """Run ``operations`` as unordered bulk writes, in batches
+    
+    Returns the error message of each failed operation, by index.
+    """
+    errors: Dict[int, str] = {}
+    batch_size = settings.resume_bulk_batch_size
+    for start in range(0, len(operations), batch_size):
+        try:
+            await collection.bulk_write(operations[start:start + batch_size], ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                errors[start + error["index"]] = error.get("errmsg", "Write failed")
+    return errors
+
 class ResumeService:
     """Service class for resume-related database operations"""
     
@@ -142,46 +215,13 @@ class ResumeService:
     ) -> Resume:
         """Create a new resume for a user"""
         try:
-            if resume_data is None:
-                resume_data = {}
-            
-            # Handle case where resume_data is already a Resume object
-            if hasattr(resume_data, 'model_dump'):
-                # It's a Resume object, convert to dict
-                cleaned_data = resume_data.model_dump()
-            else:
-                # It's a dictionary, clean it
-                cleaned_data = clean_resume_data(resume_data)
-            
-            # Convert dates to strings for database storage
-            cleaned_data = convert_dates_for_database(cleaned_data)
-
-            # Convert personal_info dict to PersonalInfo object if needed
-            personal_info_data = cleaned_data.get('personal_info', {})
-            if isinstance(personal_info_data, dict):
-                personal_info = PersonalInfo(**personal_info_data)
-            else:
-                personal_info = personal_info_data
-            
-            resume = Resume(
-                user_id=user_id,
-                title=title,
-                personal_info=personal_info,
-                professional_summary=cleaned_data.get('professional_summary', ''),
-                skills=convert_skills_for_database(cleaned_data.get('skills', [])),
-                experience=cleaned_data.get('experience', []),
-                education=cleaned_data.get('education', []),
-                projects=cleaned_data.get('projects', []),
-                certifications=cleaned_data.get('certifications', []),
-                template_id=cleaned_data.get('template_id', 'basic'),
-                font_family=cleaned_data.get('font_family', 'font-sans'),
-                accent_color=cleaned_data.get('accent_color', '#2563eb')
-            )
-            
+            resume = ResumeService._build_resume(user_id, title, resume_data)
             await resume.save()
             
             # Create initial version
-            await ResumeService.create_resume_version(str(resume.id), user_id)
+            now = datetime.utcnow()
+            version = await ResumeService._take_version(resume, now=now, force=True)
+            ResumeService._mark_versioned(resume, version, now)
             
             logger.info(f"Created new resume for user {user_id}: {title}")
             return resume
@@ -190,6 +230,49 @@ class ResumeService:
             logger.error(f"Error creating resume for user {user_id}: {e}")
             raise
     
+    @staticmethod
+    def _build_resume(
+        user_id: str,
+        title: str,
+        resume_data: Union[Dict[str, Any], 'Resume', None]
+    ) -> Resume:
+        """Validate resume data from the API or the parser into an unsaved Resume"""
+        if resume_data is None:
+            resume_data = {}
+        
+        # Handle case where resume_data is already a Resume object
+        if hasattr(resume_data, 'model_dump'):
+            # It's a Resume object, convert to dict
+            cleaned_data = resume_data.model_dump()
+        else:
+            # It's a dictionary, clean it
+            cleaned_data = clean_resume_data(resume_data)
+        
+        # Convert dates to strings for database storage
+        cleaned_data = convert_dates_for_database(cleaned_data)
+
+        # Convert personal_info dict to PersonalInfo object if needed
+        personal_info_data = cleaned_data.get('personal_info', {})
+        if isinstance(personal_info_data, dict):
+            personal_info = PersonalInfo(**personal_info_data)
+        else:
+            personal_info = personal_info_data
+        
+        return Resume(
+            user_id=user_id,
+            title=title,
+            personal_info=personal_info,
+            professional_summary=cleaned_data.get('professional_summary', ''),
+            skills=convert_skills_for_database(cleaned_data.get('skills', [])),
+            experience=cleaned_data.get('experience', []),
+            education=cleaned_data.get('education', []),
+            projects=cleaned_data.get('projects', []),
+            certifications=cleaned_data.get('certifications', []),
+            template_id=cleaned_data.get('template_id', 'basic'),
+            font_family=cleaned_data.get('font_family', 'font-sans'),
+            accent_color=cleaned_data.get('accent_color', '#2563eb')
+        )
+    
     @staticmethod
     async def get_user_resumes(user_id: str, limit: int = 50, offset: int = 0) -> List[Resume]:
         """Get paginated resumes for a user"""
@@ -197,6 +280,20 @@ class ResumeService:
             Resume.user_id == user_id
         ).sort(-Resume.updated_at).skip(offset).limit(limit).to_list()
     
+    @staticmethod
+    async def get_user_resume_summaries(user_id: str, limit: int = 50, offset: int = 0) -> List[ResumeSummary]:
+        """Get paginated list rows for a user's resumes, without their content"""
+        return await Resume.find(
+            Resume.user_id == user_id
+        ).sort(-Resume.updated_at).skip(offset).limit(limit).project(ResumeSummary).to_list()
+    
+    @staticmethod
+    async def get_latest_resume_skills(user_id: str) -> Optional[ResumeSkills]:
+        """Get the skills of the user's most recently updated resume"""
+        return await Resume.find(
+            Resume.user_id == user_id
+        ).sort(-Resume.updated_at).project(ResumeSkills).first_or_none()
+    
     @staticmethod
     async def get_resume_by_id(resume_id: str, user_id: str = None) -> Optional[Resume]:
         """Get resume by ID, optionally filtered by user"""
@@ -213,46 +310,173 @@ class ResumeService:
         except Exception:
             return None
     
+    @staticmethod
+    def _validated_updates(updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate ``updates`` against the resume schema and return them in storage form"""
+        fields = {
+            field: value for field, value in updates.items()
+            if field in Resume.model_fields and field not in PROTECTED_FIELDS
+        }
+        fields = convert_dates_for_database(clean_resume_data(fields))
+        if "skills" in fields:
+            fields["skills"] = convert_skills_for_database(fields["skills"])
+        partial = Resume.model_validate({"user_id": "", **fields})
+        return partial.model_dump(include=set(fields))
+    
+    @staticmethod
+    def _resume_filter(
+        resume_id: str,
+        user_id: str,
+        expected_revision: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Query for one of the user's resumes, optionally at a given revision"""
+        query: Dict[str, Any] = {"_id": ObjectId(resume_id), "user_id": user_id}
+        if expected_revision is not None:
+            # Resumes written before revisions existed have no field yet
+            query["revision"] = expected_revision if expected_revision else {"$in": [0, None]}
+        return query
+    
+    @staticmethod
+    async def _check_revision(resume_id: str, user_id: str, expected_revision: Optional[int]) -> bool:
+        """After a write matched nothing: False if the resume doesn't exist,
+        ``ConflictError`` if it has moved past ``expected_revision``"""
+        current = await Resume.find_one(Resume.id == ObjectId(resume_id), Resume.user_id == user_id)
+        if current is None:
+            return False
+        if expected_revision is not None and current.revision != expected_revision:
+            error = ConflictError(
+                f"Resume {resume_id} was modified: revision {current.revision}, expected {expected_revision}"
+            )
+            error.details = {"revision": current.revision}
+            raise error
+        return True
+    
+    @staticmethod
+    async def _update_one(
+        query: Any,
+        update: Dict[str, Any],
+        apply: Callable[[Dict[str, Any]], Dict[str, Any]],
+        create_version: bool,
+        **find_kwargs: Any
+    ) -> Optional[Resume]:
+        """Apply ``update`` to the resume matching ``query`` in one write
+        
+        The write bumps the revision and returns the previous state, which
+        ``apply`` turns into the updated one and which is versioned if the
+        versioning policy says so. Returns the updated resume.
+        """
+        now = datetime.utcnow()
+        update = {
+            **update,
+            "$set": {**update.get("$set", {}), "updated_at": now},
+            "$inc": {"revision": 1},
+        }
+        previous = await query.update(update, response_type=UpdateResponse.OLD_DOCUMENT, **find_kwargs)
+        if previous is None:
+            return None
+        
+        state = apply(previous.model_dump())
+        resume = Resume.model_validate({**state, "updated_at": now, "revision": previous.revision + 1})
+        if create_version:
+            version = await ResumeService._take_version(previous, now=now)
+            ResumeService._mark_versioned(resume, version, now)
+        return resume
+    
     @staticmethod
     async def update_resume(
         resume_id: str, 
         user_id: str, 
         updates: Dict[str, Any],
-        create_version: bool = True
+        create_version: bool = True,
+        expected_revision: Optional[int] = None
     ) -> Optional[Resume]:
-        """Update an existing resume"""
+        """Update an existing resume
+        
+        Autosaves are a single write; the previous state is versioned only
+        when ``versioning_policy`` says a version is due. With
+        ``expected_revision``, raises ``ConflictError`` if the resume has
+        been written since.
+        """
         try:
-            resume = await Resume.find_one(
-                Resume.id == ObjectId(resume_id),
-                Resume.user_id == user_id
+            fields = ResumeService._validated_updates(updates)
+            resume = await ResumeService._update_one(
+                Resume.find_one(ResumeService._resume_filter(resume_id, user_id, expected_revision)),
+                {"$set": fields},
+                lambda state: {**state, **fields},
+                create_version
             )
-            
-            if not resume:
+            if resume is None:
+                await ResumeService._check_revision(resume_id, user_id, expected_revision)
                 return None
             
-            # Create version before updating if requested
-            if create_version:
-                await ResumeService.create_resume_version(resume_id, user_id)
-            
-            # Update fields
-            for field, value in updates.items():
-                if hasattr(resume, field):
-                    # Handle PersonalInfo separately
-                    if field == 'personal_info' and isinstance(value, dict):
-                        resume.personal_info = PersonalInfo(**value)
-                    else:
-                        setattr(resume, field, value)
-            
-            resume.updated_at = datetime.utcnow()
-            await resume.save()
-            
             logger.info(f"Updated resume {resume_id} for user {user_id}")
             return resume
             
+        except ConflictError:
+            raise
         except Exception as e:
             logger.error(f"Error updating resume {resume_id}: {e}")
             raise
     
+    @staticmethod
+    async def patch_resume(
+        resume_id: str,
+        user_id: str,
+        operations: List[Dict[str, Any]],
+        expected_revision: Optional[int] = None,
+        create_version: bool = True
+    ) -> Optional[Resume]:
+        """Apply field-level ``set`` / ``push`` / ``pull`` operations to a resume
+        
+        Only the targeted sections and array items are written, so edits to
+        different parts of a resume don't overwrite each other. Raises
+        ``ValidationError`` for invalid operations and ``ConflictError`` if
+        ``expected_revision`` is given and stale.
+        """
+        try:
+            field_update = build_update(Resume, operations, PROTECTED_FIELDS)
+        except FieldUpdateError as e:
+            raise ValidationError(str(e))
+        
+        query = {**ResumeService._resume_filter(resume_id, user_id, expected_revision), **field_update.guards}
+        resume = await ResumeService._update_one(
+            Resume.find_one(query),
+            field_update.update,
+            lambda state: apply_operations(state, field_update.operations),
+            create_version
+        )
+        if resume is None:
+            if not await ResumeService._check_revision(resume_id, user_id, expected_revision):
+                return None
+            raise ValidationError("Array index out of range")
+        
+        logger.info(f"Patched resume {resume_id} for user {user_id} ({len(field_update.operations)} operations)")
+        return resume
+    
+    @staticmethod
+    async def update_latest_resume(
+        user_id: str,
+        updates: Dict[str, Any],
+        create_version: bool = True
+    ) -> Optional[Resume]:
+        """Update the user's most recently updated resume"""
+        try:
+            fields = ResumeService._validated_updates(updates)
+            resume = await ResumeService._update_one(
+                Resume.find_one(Resume.user_id == user_id),
+                {"$set": fields},
+                lambda state: {**state, **fields},
+                create_version,
+                sort=[("updated_at", -1)]
+            )
+            if resume:
+                logger.info(f"Updated resume {resume.id} for user {user_id}")
+            return resume
+            
+        except Exception as e:
+            logger.error(f"Error updating latest resume for user {user_id}: {e}")
+            raise
+    
     @staticmethod
     async def delete_resume(resume_id: str, user_id: str) -> bool:
         """Delete a resume"""
@@ -287,6 +511,14 @@ class ResumeService:
             Resume.is_default == True
         )
     
+    @staticmethod
+    async def get_user_default_resume_ref(user_id: str) -> Optional[ResumeRef]:
+        """Get the ID and update time of the user's default resume"""
+        return await Resume.find_one(
+            Resume.user_id == user_id,
+            Resume.is_default == True
+        ).project(ResumeRef)
+    
     @staticmethod
     async def set_default_resume(resume_id: str, user_id: str) -> bool:
         """Set a resume as the user's default"""
@@ -298,14 +530,11 @@ class ResumeService:
             resume = await Resume.find_one(
                 Resume.id == ObjectId(resume_id),
                 Resume.user_id == user_id
-            )
+            ).update({"$set": {"is_default": True}}, response_type=UpdateResponse.NEW_DOCUMENT)
             
             if not resume:
                 return False
             
-            resume.is_default = True
-            await resume.save()
-            
             logger.info(f"Set resume {resume_id} as default for user {user_id}")
             return True
             
@@ -315,45 +544,150 @@ class ResumeService:
     
     @staticmethod
     async def create_resume_version(resume_id: str, user_id: str) -> Optional[ResumeVersion]:
-        """Create a version snapshot of a resume"""
+        """Create a version of a resume now, regardless of the versioning policy"""
         try:
             resume = await ResumeService.get_resume_by_id(resume_id, user_id)
             if not resume:
                 return None
+            return await ResumeService._take_version(resume, force=True)
+        except Exception as e:
+            logger.error(f"Error creating resume version: {e}")
+            return None
+    
+    @staticmethod
+    async def _take_version(
+        resume: Resume,
+        now: Optional[datetime] = None,
+        force: bool = False
+    ) -> Optional[ResumeVersion]:
+        """Version ``resume`` as given: a keyframe snapshot or a delta
+        
+        A delta stores only the JSON patch from the resume's latest version.
+        A keyframe is written every ``resume_version_keyframe_interval``
+        versions, or when the patch would be at least half the snapshot
+        size. Unless ``force``, nothing is written when the versioning
+        policy doesn't call for a version.
+        """
+        try:
+            now = now or datetime.utcnow()
+            resume_id = str(resume.id)
+            content = resume_version_content(resume)
+            
+            base = None
+            if resume.version_counter:
+                base = await ResumeService._version_content(resume_id, resume.version_counter)
+            patch = make_patch(base[1], content) if base else None
+            if not force and base and not versioning_policy.should_version(resume.versioned_at, now, patch):
+                return None
             
-            # Get latest version number
-            latest_version = await ResumeVersion.find(
-                ResumeVersion.resume_id == resume_id
-            ).sort(-ResumeVersion.version_number).first_or_none()
-            
-            version_number = (latest_version.version_number + 1) if latest_version else 1
-            
-            version = ResumeVersion(
-                resume_id=resume_id,
-                user_id=user_id,
-                version_number=version_number,
-                title=resume.title,
-                personal_info=resume.personal_info,
-                professional_summary=resume.professional_summary,
-                skills=resume.skills,
-                experience=resume.experience,
-                education=resume.education,
-                projects=resume.projects,
-                certifications=resume.certifications,
-                template_id=resume.template_id,
-                font_family=resume.font_family,
-                accent_color=resume.accent_color
-            )
+            version_number = await ResumeService._allocate_version_number(resume, now)
+            
+            version = None
+            if base:
+                base_keyframe, base_content = base
+                if (
+                    version_number - base_keyframe < settings.resume_version_keyframe_interval
+                    and len(json.dumps(patch)) * 2 < len(json.dumps(content))
+                ):
+                    version = ResumeVersion(
+                        resume_id=resume_id,
+                        user_id=resume.user_id,
+                        version_number=version_number,
+                        title=resume.title,
+                        kind="delta",
+                        keyframe_version=base_keyframe,
+                        base_version=resume.version_counter,
+                        patch=patch
+                    )
+            
+            if version is None:
+                version = ResumeVersion(
+                    resume_id=resume_id,
+                    user_id=resume.user_id,
+                    version_number=version_number,
+                    kind="keyframe",
+                    keyframe_version=version_number,
+                    **content
+                )
             
-            await version.save()
+            await version.insert()
+            _latest_version_content.set(resume_id, (version_number, version.keyframe_version, content))
             
-            logger.info(f"Created version {version_number} for resume {resume_id}")
+            logger.info(f"Created {version.kind} version {version_number} for resume {resume_id}")
             return version
             
         except Exception as e:
             logger.error(f"Error creating resume version: {e}")
             return None
     
+    @staticmethod
+    def _mark_versioned(resume: Resume, version: Optional[ResumeVersion], now: datetime) -> None:
+        """Carry the counter written by ``_take_version`` over to an in-memory ``resume``"""
+        if version is not None:
+            resume.version_counter = version.version_number
+            resume.versioned_at = now
+    
+    @staticmethod
+    async def _allocate_version_number(resume: Resume, now: datetime) -> int:
+        """Atomically take the resume's next version number"""
+        if not resume.version_counter:
+            # Resumes versioned before the counter existed: start after their last version
+            latest = await ResumeVersion.find(
+                ResumeVersion.resume_id == str(resume.id)
+            ).sort(-ResumeVersion.version_number).first_or_none()
+            if latest:
+                await Resume.find_one(Resume.id == resume.id).update(
+                    {"$max": {"version_counter": latest.version_number}}
+                )
+        
+        updated = await Resume.find_one(Resume.id == resume.id).update(
+            {"$inc": {"version_counter": 1}, "$set": {"versioned_at": now}},
+            response_type=UpdateResponse.NEW_DOCUMENT
+        )
+        return updated.version_counter
+    
+    @staticmethod
+    async def _version_content(resume_id: str, version_number: int) -> Optional[tuple]:
+        """``(keyframe_version, content)`` of a version, from the worker cache if possible"""
+        cached = _latest_version_content.get(resume_id)
+        if cached and cached[0] == version_number:
+            return cached[1], cached[2]
+        version = await ResumeVersion.find_one(
+            ResumeVersion.resume_id == resume_id,
+            ResumeVersion.version_number == version_number
+        )
+        if version is None:
+            return None
+        return version.keyframe_version or version.version_number, await ResumeService.get_version_content(version)
+    
+    @staticmethod
+    async def get_version_content(version: ResumeVersion) -> Dict[str, Any]:
+        """Rebuild a version's resume fields from its keyframe and the deltas before it"""
+        if version.kind != "delta":
+            return resume_version_content(version)
+        
+        chain = await ResumeVersion.find(
+            ResumeVersion.resume_id == version.resume_id,
+            ResumeVersion.version_number >= version.keyframe_version,
+            ResumeVersion.version_number < version.version_number
+        ).to_list()
+        by_number = {v.version_number: v for v in chain}
+        
+        # Walk back to the keyframe; concurrent saves can leave gaps in numbering
+        deltas = []
+        current = version
+        while current.kind == "delta":
+            deltas.append(current)
+            base_number = current.base_version or current.version_number - 1
+            current = by_number.get(base_number)
+            if current is None:
+                raise ValueError(f"Version {base_number} of resume {version.resume_id} is missing")
+        
+        content = resume_version_content(current)
+        for delta in reversed(deltas):
+            content = apply_patch(content, delta.patch or [])
+        return content
+    
     @staticmethod
     async def get_resume_versions(resume_id: str, user_id: str) -> List[ResumeVersion]:
         """Get all versions of a resume"""
@@ -381,24 +715,17 @@ class ResumeService:
             if not resume:
                 return False
             
+            content = await ResumeService.get_version_content(version)
+            
             # Create a backup version before restoring
-            await ResumeService.create_resume_version(resume_id, user_id)
-            
-            # Restore data from version
-            resume.title = version.title
-            resume.personal_info = version.personal_info
-            resume.professional_summary = version.professional_summary
-            resume.skills = version.skills
-            resume.experience = version.experience
-            resume.education = version.education
-            resume.projects = version.projects
-            resume.certifications = version.certifications
-            resume.template_id = version.template_id
-            resume.font_family = version.font_family
-            resume.accent_color = version.accent_color
-            resume.updated_at = datetime.utcnow()
+            await ResumeService._take_version(resume, force=True)
             
-            await resume.save()
+            # Restore data from version; only versioned fields are written, so
+            # the version counter just advanced is left alone
+            await Resume.find_one(Resume.id == resume.id).update({
+                "$set": {**ResumeService._validated_updates(content), "updated_at": datetime.utcnow()},
+                "$inc": {"revision": 1}
+            })
             
             logger.info(f"Restored resume {resume_id} to version {version.version_number}")
             return True
@@ -425,13 +752,10 @@ class ResumeService:
             # Get most recent resume
             recent_resume = await Resume.find(
                 Resume.user_id == user_id
-            ).sort(-Resume.updated_at).first_or_none()
+            ).sort(-Resume.updated_at).project(ResumeRef).first_or_none()
             
             # Get default resume separately for efficiency
-            default_resume = await Resume.find_one(
-                Resume.user_id == user_id,
-                Resume.is_default == True
-            )
+            default_resume = await ResumeService.get_user_default_resume_ref(user_id)
             
             stats = {
                 "total_resumes": total_resumes,
@@ -444,3 +768,178 @@ class ResumeService:
         except Exception as e:
             logger.error(f"Error getting resume stats for user {user_id}: {e}")
             return {"total_resumes": 0, "last_updated": None, "default_resume_id": None}
+
+    @staticmethod
+    def _unique_ids(resume_ids: List[str]) -> List[str]:
+        """Drop repeated IDs, keeping first-seen order, so each resume gets one result"""
+        return list(dict.fromkeys(resume_ids))
+    
+    @staticmethod
+    async def _owned_resume_ids(user_id: str, resume_ids: List[str]) -> Dict[str, Optional[ObjectId]]:
+        """Map each requested ID to its ObjectId if the user owns that resume, else None"""
+        parsed: Dict[str, ObjectId] = {}
+        for resume_id in resume_ids:
+            try:
+                parsed[resume_id] = ObjectId(resume_id)
+            except (InvalidId, TypeError):
+                pass
+        owned = set()
+        if parsed:
+            cursor = Resume.get_motor_collection().find(
+                {"_id": {"$in": list(parsed.values())}, "user_id": user_id}, {"_id": 1}
+            )
+            owned = {document["_id"] async for document in cursor}
+        return {
+            resume_id: parsed[resume_id] if parsed.get(resume_id) in owned else None
+            for resume_id in resume_ids
+        }
+
+    @staticmethod
+    async def bulk_create_resumes(user_id: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create many resumes, each with its initial version, in unordered batches
+        
+        ``items`` hold a ``title`` and ``resume_data``. Returns one result per
+        item, in order; an invalid or failed item doesn't stop the others.
+        """
+        now = datetime.utcnow()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        pending: List[tuple] = []
+        for index, item in enumerate(items):
+            try:
+                resume = ResumeService._build_resume(
+                    user_id, item.get("title") or "My Resume", item.get("resume_data")
+                )
+            except Exception as e:
+                results[index] = _bulk_result(index, None, "failed", str(e))
+                continue
+            resume.id = ObjectId()
+            resume.version_counter = 1
+            resume.versioned_at = now
+            pending.append((index, resume))
+        
+        errors = await _bulk_write(
+            Resume.get_motor_collection(),
+            [InsertOne(get_dict(resume, to_db=True)) for _, resume in pending]
+        )
+        
+        versions = []
+        for position, (index, resume) in enumerate(pending):
+            if position in errors:
+                results[index] = _bulk_result(index, None, "failed", errors[position])
+                continue
+            results[index] = _bulk_result(index, str(resume.id), "created")
+            content = resume_version_content(resume)
+            versions.append(ResumeVersion(
+                resume_id=str(resume.id),
+                user_id=user_id,
+                version_number=1,
+                kind="keyframe",
+                keyframe_version=1,
+                created_at=now,
+                **content
+            ))
+            _latest_version_content.set(str(resume.id), (1, 1, content))
+        
+        version_errors = await _bulk_write(
+            ResumeVersion.get_motor_collection(),
+            [InsertOne(get_dict(version, to_db=True, keep_nulls=False)) for version in versions]
+        )
+        if version_errors:
+            logger.error(f"Failed to write {len(version_errors)} initial resume versions for user {user_id}")
+        
+        logger.info(f"Bulk created {len(versions)} of {len(items)} resumes for user {user_id}")
+        return results
+
+    @staticmethod
+    async def bulk_delete_resumes(user_id: str, resume_ids: List[str]) -> List[Dict[str, Any]]:
+        """Delete many of the user's resumes and their versions"""
+        resume_ids = ResumeService._unique_ids(resume_ids)
+        owned = await ResumeService._owned_resume_ids(user_id, resume_ids)
+        targets = [(index, resume_id) for index, resume_id in enumerate(resume_ids) if owned[resume_id]]
+        errors = await _bulk_write(
+            Resume.get_motor_collection(),
+            [DeleteOne({"_id": owned[resume_id], "user_id": user_id}) for _, resume_id in targets]
+        )
+        
+        results = [_bulk_result(index, resume_id, "not_found") for index, resume_id in enumerate(resume_ids)]
+        deleted = []
+        for position, (index, resume_id) in enumerate(targets):
+            if position in errors:
+                results[index] = _bulk_result(index, resume_id, "failed", errors[position])
+            else:
+                results[index] = _bulk_result(index, resume_id, "deleted")
+                deleted.append(str(owned[resume_id]))
+        
+        if deleted:
+            await ResumeVersion.get_motor_collection().delete_many({"resume_id": {"$in": deleted}})
+            _latest_version_content.delete(deleted)
+        
+        logger.info(f"Bulk deleted {len(deleted)} of {len(resume_ids)} resumes for user {user_id}")
+        return results
+
+    @staticmethod
+    async def bulk_update_template(
+        user_id: str,
+        resume_ids: List[str],
+        template_id: str,
+        font_family: Optional[str] = None,
+        accent_color: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Switch many of the user's resumes to a template
+        
+        A styling migration, so no versions are taken; each resume's
+        revision is still bumped.
+        """
+        fields = {"template_id": template_id}
+        if font_family is not None:
+            fields["font_family"] = font_family
+        if accent_color is not None:
+            fields["accent_color"] = accent_color
+        now = datetime.utcnow()
+        
+        resume_ids = ResumeService._unique_ids(resume_ids)
+        owned = await ResumeService._owned_resume_ids(user_id, resume_ids)
+        targets = [(index, resume_id) for index, resume_id in enumerate(resume_ids) if owned[resume_id]]
+        errors = await _bulk_write(
+            Resume.get_motor_collection(),
+            [
+                UpdateOne(
+                    {"_id": owned[resume_id], "user_id": user_id},
+                    {"$set": {**fields, "updated_at": now}, "$inc": {"revision": 1}}
+                )
+                for _, resume_id in targets
+            ]
+        )
+        
+        results = [_bulk_result(index, resume_id, "not_found") for index, resume_id in enumerate(resume_ids)]
+        for position, (index, resume_id) in enumerate(targets):
+            if position in errors:
+                results[index] = _bulk_result(index, resume_id, "failed", errors[position])
+            else:
+                results[index] = _bulk_result(index, resume_id, "updated")
+        
+        logger.info(f"Bulk set template {template_id} on {len(targets) - len(errors)} resumes for user {user_id}")
+        return results
+
+    @staticmethod
+    async def bulk_export_resumes(user_id: str, resume_ids: List[str]) -> List[Dict[str, Any]]:
+        """Full data of many of the user's resumes, read in one query"""
+        resume_ids = ResumeService._unique_ids(resume_ids)
+        owned = await ResumeService._owned_resume_ids(user_id, resume_ids)
+        found = {
+            resume.id: resume
+            for resume in await Resume.find(
+                {"_id": {"$in": [oid for oid in owned.values() if oid]}, "user_id": user_id}
+            ).to_list()
+        }
+        results = []
+        for index, resume_id in enumerate(resume_ids):
+            resume = found.get(owned[resume_id])
+            if resume is None:
+                results.append(_bulk_result(index, resume_id, "not_found"))
+            else:
+                results.append(_bulk_result(
+                    index, resume_id, "exported",
+                    resume=resume.model_dump(mode="json", exclude={"id", "revision_id", "version_counter", "versioned_at"})
+                ))
+        return results
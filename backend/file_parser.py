@@ -1,49 +1,197 @@
 import PyPDF2
 from docx import Document
 from io import BytesIO
-from typing import Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Set, Tuple
+import asyncio
+import logging
+import multiprocessing
+import os
 import re
 import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from concurrent.futures.process import BrokenProcessPool
 from pdfminer.high_level import extract_text as pdfminer_extract_text
 
+from core.config import settings
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+def _init_extraction_worker(memory_limit_mb: int) -> None:
+    """Cap the address space of an extraction worker process."""
+    if resource is None or memory_limit_mb <= 0:
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError) as e:
+        logger.warning(f"Could not set extraction worker memory limit: {e}")
+
+
+def _available_cores() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+class ExtractionPool:
+    """Runs CPU-bound document extraction in a bounded set of worker processes.
+
+    Each worker is a single-process executor that runs one document at a
+    time, and at most ``max_workers`` are busy at once, so ``timeout``
+    covers extraction only and not time spent waiting for a free worker.
+    A worker that times out or dies is killed on its own; documents being
+    extracted by the other workers are not affected. Healthy workers are
+    kept for reuse.
+    """
+
+    def __init__(self, max_workers: int, timeout: float, memory_limit_mb: int) -> None:
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self._idle: List[ProcessPoolExecutor] = []
+        self._busy: Set[ProcessPoolExecutor] = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=1,
+            # Don't fork the server process with its event loop and sockets
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_extraction_worker,
+            initargs=(self.memory_limit_mb,),
+        )
+
+    async def run(self, func, *args):
+        """Run ``func(*args)`` in a worker process, bounded by ``timeout``."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        async with self._semaphore:
+            executor = self._idle.pop() if self._idle else self._new_executor()
+            self._busy.add(executor)
+            loop = asyncio.get_running_loop()
+            try:
+                result = await asyncio.wait_for(
+                    loop.run_in_executor(executor, func, *args), self.timeout
+                )
+            except (asyncio.TimeoutError, asyncio.CancelledError, BrokenProcessPool):
+                # The worker may still be busy with (or dead from) this document
+                self._busy.discard(executor)
+                self._kill(executor)
+                raise
+            except BaseException:
+                self._release(executor)
+                raise
+            self._release(executor)
+            return result
+
+    def _release(self, executor: ProcessPoolExecutor) -> None:
+        self._busy.discard(executor)
+        self._idle.append(executor)
+
+    @staticmethod
+    def _kill(executor: ProcessPoolExecutor) -> None:
+        """Kill the worker of ``executor`` so a stuck extraction stops."""
+        terminate = getattr(executor, "terminate_workers", None)
+        if terminate is not None:
+            terminate()
+        else:
+            for process in list((getattr(executor, "_processes", None) or {}).values()):
+                process.terminate()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        for executor in self._idle + list(self._busy):
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._idle = []
+        self._busy = set()
+
 
 class FileParser:
+    @staticmethod
+    def page_quality(text: str) -> float:
+        """Score extracted page text from 0 (garbage/empty) to 1 (clean prose).
+
+        Penalises unprintable characters, words glued together by missing
+        spaces and pdfminer/PyPDF2 ``(cid:NN)`` glyph placeholders.
+        """
+        stripped = text.strip()
+        if len(stripped) < 20:
+            return 0.0
+        words = stripped.split()
+        printable = sum(1 for c in stripped if c.isprintable() or c.isspace())
+        glued = sum(1 for w in words if len(w) > 25)
+        score = (printable / len(stripped)) * (1 - glued / len(words))
+        if "(cid:" in stripped:
+            score *= 0.5
+        return score
+
+    @staticmethod
+    def iter_pdf_pages(
+        file_content: bytes,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        min_quality: Optional[float] = None,
+    ) -> Iterator[str]:
+        """Yield the text of each PDF page, stopping at the page/character budget.
+
+        Pages are read with PyPDF2; a page scoring below ``min_quality`` is
+        re-extracted on its own with pdfminer and the better of the two kept.
+        """
+        max_pages = settings.pdf_max_pages if max_pages is None else max_pages
+        max_chars = settings.pdf_max_chars if max_chars is None else max_chars
+        min_quality = settings.pdf_min_page_quality if min_quality is None else min_quality
+
+        pdf_reader = PyPDF2.PdfReader(BytesIO(file_content))
+        total_chars = 0
+        for page_number, page in enumerate(pdf_reader.pages):
+            if page_number >= max_pages or total_chars >= max_chars:
+                break
+
+            try:
+                text = page.extract_text() or ""
+            except Exception as e:
+                logger.warning(f"PyPDF2 failed on page {page_number}: {e}")
+                text = ""
+
+            quality = FileParser.page_quality(text)
+            if quality < min_quality:
+                try:
+                    fallback = pdfminer_extract_text(BytesIO(file_content), page_numbers=[page_number])
+                    if FileParser.page_quality(fallback) > quality:
+                        text = fallback
+                except Exception as e:
+                    logger.warning(f"pdfminer failed on page {page_number}: {e}")
+
+            text = text[:max_chars - total_chars]
+            total_chars += len(text)
+            yield text
+
     @staticmethod
     def parse_pdf(file_content: bytes) -> str:
-        """Extract text from PDF file using multiple libraries for better results"""
+        """Extract text from PDF file page by page within the page/character budget"""
         try:
-            # First try with PyPDF2
-            pdf_file = BytesIO(file_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            
-            # If PyPDF2 extraction is poor (common with complex PDFs), try pdfminer
-            if len(text.strip()) < 100 or text.count('\n') < 5:
-                try:
-                    pdf_file = BytesIO(file_content)
-                    text = pdfminer_extract_text(pdf_file)
-                except Exception as inner_e:
-                    print(f"Error with pdfminer extraction: {inner_e}")
-            
-            # Clean up the text
-            text = FileParser.clean_extracted_text(text)
-            
-            return text.strip()
-            
+            text = "\n".join(FileParser.iter_pdf_pages(file_content))
         except Exception as e:
-            print(f"Error parsing PDF: {e}")
-            # Fallback to pdfminer if PyPDF2 fails completely
+            logger.error(f"Error parsing PDF: {e}")
+            # Fallback to pdfminer if PyPDF2 can't read the document at all
             try:
-                pdf_file = BytesIO(file_content)
-                text = pdfminer_extract_text(pdf_file)
-                text = FileParser.clean_extracted_text(text)
-                return text.strip()
+                text = pdfminer_extract_text(BytesIO(file_content), maxpages=settings.pdf_max_pages)
+                text = text[:settings.pdf_max_chars]
             except Exception as fallback_e:
-                print(f"Error with fallback PDF parsing: {fallback_e}")
+                logger.error(f"Error with fallback PDF parsing: {fallback_e}")
                 return ""
+
+        # Clean up the text
+        text = FileParser.clean_extracted_text(text)
+        return text.strip()
     
     @staticmethod
     def parse_docx(file_content: bytes) -> str:
@@ -76,6 +224,26 @@ class FileParser:
         else:
             return None
 
+    @staticmethod
+    async def parse_file_async(filename: str, file_content: bytes) -> Optional[str]:
+        """Parse file in the extraction process pool, off the event loop.
+
+        Returns an empty string if extraction times out or its worker dies.
+        """
+        filename_lower = filename.lower()
+        if filename_lower.endswith('.txt'):
+            return file_content.decode('utf-8')
+        if not (filename_lower.endswith('.pdf') or filename_lower.endswith('.docx')):
+            return None
+
+        try:
+            return await extraction_pool.run(FileParser.parse_file, filename, file_content)
+        except asyncio.TimeoutError:
+            logger.error(f"Text extraction for {filename} timed out after {extraction_pool.timeout}s")
+        except (BrokenProcessPool, MemoryError) as e:
+            logger.error(f"Text extraction for {filename} failed: {e!r}")
+        return ""
+
     @staticmethod
     def clean_extracted_text(text: str) -> str:
         """Clean up extracted text to improve parsing quality"""
@@ -97,70 +265,139 @@ class FileParser:
         return text
     
     @staticmethod
-    def pre_process_resume(text: str) -> Dict[str, Any]:
-        """Attempt to extract structured information from resume text"""
-        result = {
-            "sections": {},
-            "detected_sections": []
-        }
-        
-        # Common resume section headers
-        section_patterns = {
-            "contact": r"(?:CONTACT|PERSONAL)\s*(?:INFORMATION|INFO|DETAILS)",
-            "summary": r"(?:PROFESSIONAL\s*)?SUMMARY|PROFILE|OBJECTIVE|ABOUT\s*ME",
-            "experience": r"(?:WORK|PROFESSIONAL)\s*EXPERIENCE|EMPLOYMENT\s*HISTORY",
-            "education": r"EDUCATION(?:AL)?\s*(?:BACKGROUND|HISTORY)?",
-            "skills": r"(?:TECHNICAL\s*)?SKILLS|EXPERTISE|COMPETENCIES",
-            "projects": r"PROJECTS|PROJECT\s*EXPERIENCE",
-            "certifications": r"CERTIFICATIONS|CERTIFICATES|ACCREDITATIONS"
-        }
-        
-        # Try to identify sections
-        lines = text.split('\n')
-        current_section = None
-        section_content = {}
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Check if this line is a section header
-            found_section = False
-            for section_name, pattern in section_patterns.items():
-                if re.search(pattern, line.upper()):
-                    current_section = section_name
-                    section_content[current_section] = []
-                    result["detected_sections"].append(current_section)
-                    found_section = True
+    def scan_resume(text: str) -> "ResumeScan":
+        """Classify section headers and locate contact details.
+
+        The text is upper-cased once and scanned for the literal keywords
+        every header must contain; only lines with a keyword hit are run
+        through the precompiled header patterns. Returns offsets into
+        ``text``; nothing is copied until ``ResumeScan.materialize``.
+        """
+        upper = text.upper()
+        if len(upper) != len(text):
+            # Case mapping changed the length (e.g. "ß"); offsets must line up
+            upper = "".join(c.upper() if len(c.upper()) == 1 else c for c in text)
+
+        candidate_lines = set()
+        for keyword in SECTION_KEYWORDS:
+            pos = upper.find(keyword)
+            while pos >= 0:
+                line_start = upper.rfind("\n", 0, pos) + 1
+                candidate_lines.add(line_start)
+                line_end = upper.find("\n", pos)
+                if line_end < 0:
                     break
-            
-            if not found_section and current_section:
-                section_content[current_section].append(line)
-        
-        # Process each section's content
-        for section, content in section_content.items():
-            result["sections"][section] = "\n".join(content)
-        
-        # Try to extract contact information
-        if "contact" in section_content or not section_content:  # If no sections found, try whole document
-            contact_text = section_content.get("contact", []) if section_content else text
-            contact_text = "\n".join(contact_text) if isinstance(contact_text, list) else contact_text
-            
-            # Extract email
-            email_match = re.search(r'[\w.+-]+@[\w-]+\.[\w.-]+', contact_text or text)
+                pos = upper.find(keyword, line_end)
+
+        headers: List[Tuple[str, int, int]] = []
+        for line_start in sorted(candidate_lines):
+            line_end = upper.find("\n", line_start)
+            line_end = len(upper) if line_end < 0 else line_end
+            # First pattern in priority order wins
+            for name, pattern in _SECTION_REGEXES:
+                if pattern.search(upper, line_start, line_end):
+                    headers.append((name, line_start, line_end))
+                    break
+
+        scan = ResumeScan(text=text, detected_sections=[name for name, _, _ in headers])
+
+        # Content runs from the end of a header line to the next header; a
+        # repeated header replaces the earlier section
+        for i, (name, _, line_end) in enumerate(headers):
+            content_end = headers[i + 1][1] if i + 1 < len(headers) else len(text)
+            scan.sections[name] = (min(line_end + 1, content_end), content_end)
+
+        # Contact details come from the contact section, or the whole
+        # document if no sections were found
+        if "contact" in scan.sections or not scan.sections:
+            start, end = scan.sections.get("contact", (0, len(text)))
+            if not text[start:end].strip():
+                start, end = 0, len(text)
+            email_match = _EMAIL_RE.search(text, start, end)
             if email_match:
-                result["email"] = email_match.group(0)
-                
-            # Extract phone
-            phone_match = re.search(r'\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}', contact_text or text)
+                scan.email = email_match.span()
+            phone_match = _PHONE_RE.search(text, start, end)
             if phone_match:
-                result["phone"] = phone_match.group(0)
-                
+                scan.phone = phone_match.span()
+
             # Try to extract name (usually at the top)
-            if lines and len(lines[0].split()) <= 4:  # Names are usually short
-                result["name"] = lines[0].strip()
-        
+            first_line_end = text.find("\n")
+            first_line = text if first_line_end < 0 else text[:first_line_end]
+            if len(first_line.split()) <= 4:  # Names are usually short
+                scan.name = (len(first_line) - len(first_line.lstrip()), len(first_line.rstrip()))
+
+        return scan
+
+    @staticmethod
+    def pre_process_resume(text: str) -> Dict[str, Any]:
+        """Attempt to extract structured information from resume text"""
+        return FileParser.scan_resume(text).materialize()
+
+
+# Common resume section headers, checked in priority order
+SECTION_PATTERNS = {
+    "contact": r"(?:CONTACT|PERSONAL)\s*(?:INFORMATION|INFO|DETAILS)",
+    "summary": r"(?:PROFESSIONAL\s*)?SUMMARY|PROFILE|OBJECTIVE|ABOUT\s*ME",
+    "experience": r"(?:WORK|PROFESSIONAL)\s*EXPERIENCE|EMPLOYMENT\s*HISTORY",
+    "education": r"EDUCATION(?:AL)?\s*(?:BACKGROUND|HISTORY)?",
+    "skills": r"(?:TECHNICAL\s*)?SKILLS|EXPERTISE|COMPETENCIES",
+    "projects": r"PROJECTS|PROJECT\s*EXPERIENCE",
+    "certifications": r"CERTIFICATIONS|CERTIFICATES|ACCREDITATIONS"
+}
+
+EMAIL_PATTERN = r"[\w.+-]+@[\w-]+\.[\w.-]+"
+PHONE_PATTERN = r"\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}"
+
+
+# Literal keywords at least one of which appears in any header matched by
+# SECTION_PATTERNS; lines without one are never headers
+SECTION_KEYWORDS = (
+    "INFO", "DETAILS", "SUMMARY", "PROFILE", "OBJECTIVE", "ABOUT", "EXPERIENCE",
+    "HISTORY", "EDUCATION", "SKILLS", "EXPERTISE", "COMPETENCIES", "PROJECT",
+    "CERTIFICA", "ACCREDITATIONS",
+)
+
+# Header patterns in priority order, matched against upper-cased lines
+_SECTION_REGEXES = [
+    (name, re.compile(pattern))
+    for name, pattern in SECTION_PATTERNS.items()
+]
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+_PHONE_RE = re.compile(PHONE_PATTERN)
+
+
+@dataclass
+class ResumeScan:
+    """Offsets found by ``FileParser.scan_resume``; spans are ``(start, end)``."""
+    text: str
+    detected_sections: List[str] = field(default_factory=list)
+    sections: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    email: Optional[Tuple[int, int]] = None
+    phone: Optional[Tuple[int, int]] = None
+    name: Optional[Tuple[int, int]] = None
+
+    def materialize(self) -> Dict[str, Any]:
+        """Build the ``pre_process_resume`` dict from the offsets."""
+        result: Dict[str, Any] = {
+            "sections": {
+                section: "\n".join(
+                    line.strip() for line in self.text[start:end].split("\n") if line.strip()
+                )
+                for section, (start, end) in self.sections.items()
+            },
+            "detected_sections": self.detected_sections,
+        }
+        for key in ("email", "phone", "name"):
+            span = getattr(self, key)
+            if span is not None:
+                result[key] = self.text[span[0]:span[1]]
         return result
 
+
+extraction_pool = ExtractionPool(
+    max_workers=settings.extraction_workers or _available_cores(),
+    timeout=settings.extraction_timeout,
+    memory_limit_mb=settings.extraction_memory_limit_mb,
+)
+
 file_parser = FileParser()
@@ -1,132 +1,67 @@
-import json
-import os
-from typing import Dict, Any
+import asyncio
+from typing import AsyncIterator, Optional
 
-from models import Resume
+from ai_provider import AIProvider
 from core.config import settings
+from prompts import Messages
 
 try:
-    from groq import Groq
+    from groq import AsyncGroq
 except ImportError:
-    Groq = None
+    AsyncGroq = None
+
+class GroqService(AIProvider):
+    """Groq provider using the SDK's ``AsyncGroq`` client."""
+
+    name = "groq"
 
-class GroqService:
     def __init__(self):
-        if Groq is None:
+        if AsyncGroq is None:
             raise ImportError("The 'groq' library is not installed. Please install it with 'pip install groq'")
         
         self.model = settings.groq_model
-        self._client = Groq(api_key=settings.groq_api_key)
-    
-    async def parse_resume(self, resume_text: str, pre_processed_hints: Dict[str, Any] = None) -> Resume:
-        """Parse resume text and extract structured information using Groq
-        
-        Args:
-            resume_text: The raw text extracted from the resume
-            pre_processed_hints: Pre-processed structured data to help guide the AI parsing
-        """
-        
-        hints_text = ""
-        if pre_processed_hints:
-            hints_text = "\nPre-processed information to help with parsing:\n"
-            
-            if "detected_sections" in pre_processed_hints and pre_processed_hints["detected_sections"]:
-                hints_text += f"Detected sections: {', '.join(pre_processed_hints['detected_sections'])}\n"
-            
-            if "email" in pre_processed_hints:
-                hints_text += f"Detected email: {pre_processed_hints['email']}\n"
-            if "phone" in pre_processed_hints:
-                hints_text += f"Detected phone: {pre_processed_hints['phone']}\n"
-            if "name" in pre_processed_hints:
-                hints_text += f"Detected name: {pre_processed_hints['name']}\n"
-            
-            if "sections" in pre_processed_hints:
-                for section_name, content in pre_processed_hints["sections"].items():
-                    content_preview = content[:200] + "..." if len(content) > 200 else content
-                    hints_text += f"\nDetected {section_name} section content preview:\n{content_preview}\n"
-        
-        prompt = f"""
-        Parse the following resume text and extract structured information. Return a JSON object with the following structure:
-        {{
-            "personal_info": {{
-                "full_name": "",
-                "email": "",
-                "phone": "",
-                "location": "",
-                "linkedin": "",
-                "github": "",
-                "website": ""
-            }},
-            "professional_summary": "",
-            "skills": [],
-            "experience": [
-                {{
-                    "company": "",
-                    "position": "",
-                    "start_date": "YYYY-MM-DD or null",
-                    "end_date": "YYYY-MM-DD or null",
-                    "description": [],
-                    "is_current": false
-                }}
-            ],
-            "education": [
-                {{
-                    "institution": "",
-                    "degree": "",
-                    "field_of_study": "",
-                    "start_date": "YYYY-MM-DD or null",
-                    "end_date": "YYYY-MM-DD or null",
-                    "gpa": ""
-                }}
-            ],
-            "projects": [
-                {{
-                    "name": "",
-                    "description": "",
-                    "technologies": [],
-                    "url": ""
-                }}
-            ],
-            "certifications": [
-                {{
-                    "name": "",
-                    "issuing_organization": "",
-                    "issue_date": "YYYY-MM-DD or null",
-                    "expiration_date": "YYYY-MM-DD or null",
-                    "credential_id": ""
-                }}
-            ]
-        }}
+        self._client = AsyncGroq(
+            api_key=settings.groq_api_key,
+            max_retries=settings.ai_max_retries,
+        )
 
-        Resume text:
-        {resume_text}
-        {hints_text}
-        
-        Return only valid JSON without any additional text or formatting.
-        """
-        
-        try:
-            response = self._client.chat.completions.create(
+    async def complete(self, messages: Messages, temperature: float, timeout: Optional[float] = None) -> str:
+        timeout = timeout or settings.ai_request_timeout
+        response = await asyncio.wait_for(
+            self._client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a resume parsing expert. Extract structured information from resumes and return valid JSON. Pay special attention to the pre-processed hints provided, but verify all information against the original text."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                timeout=30,
-            )
+                messages=messages,
+                temperature=temperature,
+                timeout=timeout,
+            ),
+            timeout=timeout,
+        )
+        return (response.choices[0].message.content or "").strip()
 
-            content = response.choices[0].message.content.strip()
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.endswith("```"):
-                content = content[:-3]
-            
-            parsed_data = json.loads(content)
-            return Resume(**parsed_data)
-            
-        except Exception as e:
-            print(f"Error parsing resume with Groq: {e}")
-            return Resume()
+    async def stream(self, messages: Messages, temperature: float, timeout: Optional[float] = None) -> AsyncIterator[str]:
+        timeout = timeout or settings.ai_request_timeout
+        response = await asyncio.wait_for(
+            self._client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                timeout=timeout,
+                stream=True,
+            ),
+            timeout=timeout,
+        )
+        chunks = response.__aiter__()
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(chunks.__anext__(), timeout=timeout)
+                except StopAsyncIteration:
+                    break
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            # Return the connection to the pool even if the consumer stops early
+            await response.response.aclose()
 
-groq_service = GroqService()
+    async def aclose(self) -> None:
+        await self._client.close()
@@ -0,0 +1,238 @@
+"""
+In-memory inverted index over scraped job postings.
+
+Every posting gets a dense slot number. Skills (via the shared skill
+vocabulary) and facet values map to bitmaps of slots, stored as Python
+ints, so filters are a handful of big-integer ANDs. Salary ranges are
+parsed once, when a posting is added.
+
+Ranking uses bit-sliced counters: adding each query skill's bitmap to a
+few counter bitmaps gives, for every slot, how many query skills it has.
+The slots with the most matches are scored first, and lower tiers are
+skipped once they can no longer reach the top ``limit``.
+"""
+import heapq
+import logging
+import re
+from collections import OrderedDict
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.config import settings
+from skill_matcher import SkillVocabulary, match_score, skill_matcher
+
+if TYPE_CHECKING:
+    from job_scraper import JobPosting
+
+logger = logging.getLogger(__name__)
+
+# Posting attributes indexed as exact-match (case-insensitive) facets
+FACETS = ("job_type", "experience_level", "remote", "source")
+
+_SALARY_RE = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*([km])?", re.IGNORECASE)
+_SALARY_UNITS = {"k": 1_000, "m": 1_000_000}
+
+
+def parse_salary_range(salary_range: Optional[str]) -> Optional[Tuple[int, int]]:
+    """``"$60k - $80k"`` -> ``(60000, 80000)``; ``None`` if there is no number."""
+    if not salary_range:
+        return None
+    amounts = []
+    for number, unit in _SALARY_RE.findall(salary_range):
+        try:
+            value = float(number.replace(",", ""))
+        except ValueError:
+            continue
+        amounts.append(int(value * _SALARY_UNITS.get(unit.lower(), 1)))
+    if not amounts:
+        return None
+    low = amounts[0]
+    high = amounts[1] if len(amounts) > 1 else low
+    return low, max(low, high)
+
+
+def iter_slots(bitmap: int) -> Iterator[int]:
+    """Set bit positions of ``bitmap``, highest first."""
+    digits = bin(bitmap)
+    last = len(digits) - 1
+    position = digits.find("1", 2)
+    while position != -1:
+        yield last - position
+        position = digits.find("1", position + 1)
+
+
+def _facet_value(value: Any) -> str:
+    return str(value).strip().lower()
+
+
+class JobIndex:
+    """Skill / facet inverted index with incremental upserts.
+
+    Postings are keyed like ``JobScraperService._deduplicate_jobs`` (title
+    and company), so a posting scraped again replaces the older copy.
+    """
+
+    def __init__(self, vocabulary: SkillVocabulary, max_postings: int = 50000) -> None:
+        self.vocabulary = vocabulary
+        self.max_postings = max_postings
+        self._slots: "OrderedDict[Tuple[str, str], int]" = OrderedDict()  # oldest first
+        self._free: List[int] = []
+        self.postings: List[Optional["JobPosting"]] = []
+        self.skill_bits: List[int] = []  # slot -> skill-id bitset
+        self.skill_counts: List[int] = []
+        self.salaries: List[Optional[Tuple[int, int]]] = []
+        self.live = 0
+        self.skills: Dict[int, int] = {}  # skill id -> slot bitmap
+        self.facets: Dict[str, Dict[str, int]] = {facet: {} for facet in FACETS}
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @staticmethod
+    def _key(job: "JobPosting") -> Tuple[str, str]:
+        return job.title.lower(), job.company.lower()
+
+    def add(self, jobs: Iterable["JobPosting"]) -> None:
+        """Insert or replace ``jobs``, evicting the oldest past ``max_postings``."""
+        for job in jobs:
+            key = self._key(job)
+            if key in self._slots:
+                self._clear(self._slots.pop(key))
+            slot = self._free.pop() if self._free else len(self.postings)
+            if slot == len(self.postings):
+                self.postings.append(None)
+                self.skill_bits.append(0)
+                self.skill_counts.append(0)
+                self.salaries.append(None)
+
+            skill_bits, skill_count = self.vocabulary.encode(job.skills)
+            self.postings[slot] = replace(job, match_score=None)
+            self.skill_bits[slot] = skill_bits
+            self.skill_counts[slot] = skill_count
+            self.salaries[slot] = parse_salary_range(job.salary_range)
+
+            bit = 1 << slot
+            self.live |= bit
+            for skill_id in iter_slots(skill_bits):
+                self.skills[skill_id] = self.skills.get(skill_id, 0) | bit
+            for facet in FACETS:
+                values = self.facets[facet]
+                value = _facet_value(getattr(job, facet))
+                values[value] = values.get(value, 0) | bit
+            self._slots[key] = slot
+
+        while len(self._slots) > self.max_postings:
+            _, slot = self._slots.popitem(last=False)
+            self._clear(slot)
+
+    def remove(self, job: "JobPosting") -> bool:
+        slot = self._slots.pop(self._key(job), None)
+        if slot is None:
+            return False
+        self._clear(slot)
+        return True
+
+    def _clear(self, slot: int) -> None:
+        job = self.postings[slot]
+        mask = ~(1 << slot)
+        self.live &= mask
+        for skill_id in iter_slots(self.skill_bits[slot]):
+            self.skills[skill_id] &= mask
+        for facet in FACETS:
+            value = _facet_value(getattr(job, facet))
+            self.facets[facet][value] &= mask
+        self.postings[slot] = None
+        self.skill_bits[slot] = 0
+        self._free.append(slot)
+
+    def _filter_mask(self, filters: Dict[str, Any]) -> int:
+        mask = self.live
+        for facet in FACETS:
+            wanted = filters.get(facet)
+            if wanted is None or wanted == "":
+                continue
+            mask &= self.facets[facet].get(_facet_value(wanted), 0)
+        return mask
+
+    def _salary_ok(self, slot: int, min_salary: Optional[int], max_salary: Optional[int]) -> bool:
+        # Compares the low end of the range, as the original list filter did
+        salary = self.salaries[slot]
+        if salary is None:
+            return False
+        if min_salary and salary[0] < min_salary:
+            return False
+        if max_salary and salary[0] > max_salary:
+            return False
+        return True
+
+    def search(
+        self, skills: Iterable[str], filters: Optional[Dict[str, Any]] = None, limit: int = 50
+    ) -> List["JobPosting"]:
+        """Top ``limit`` postings for ``skills``, best match first.
+
+        Postings with none of ``skills`` follow the matched ones, newest
+        first, with a ``match_score`` of 0. ``filters`` may hold any of
+        ``FACETS`` plus ``min_salary`` and ``max_salary``; returned postings
+        are copies carrying ``match_score``.
+        """
+        filters = filters or {}
+        min_salary, max_salary = filters.get("min_salary"), filters.get("max_salary")
+        check_salary = bool(min_salary or max_salary)
+        mask = self._filter_mask(filters)
+        if not mask or limit <= 0:
+            return []
+
+        query_bits, resume_count = self.vocabulary.encode_query(skills)
+        query_ids = list(iter_slots(query_bits))
+
+        # counters[i] holds bit i of each slot's matched-skill count
+        counters: List[int] = []
+        for skill_id in query_ids:
+            carry = self.skills.get(skill_id, 0) & mask
+            for level in range(len(counters)):
+                if not carry:
+                    break
+                counters[level], carry = counters[level] ^ carry, counters[level] & carry
+            if carry:
+                counters.append(carry)
+
+        top: List[Tuple[float, float, int]] = []
+        for matches in range(len(query_ids), 0, -1):
+            if len(top) >= limit and top[0][0] > match_score(matches, 1 << 30, resume_count):
+                break  # no posting in this tier can beat the current top
+            tier = mask
+            for level, counter in enumerate(counters):
+                tier &= counter if matches >> level & 1 else ~counter
+            if matches >> len(counters):
+                tier = 0
+            for slot in iter_slots(tier):
+                if check_salary and not self._salary_ok(slot, min_salary, max_salary):
+                    continue
+                score = match_score(matches, self.skill_counts[slot], resume_count)
+                entry = (score, self.postings[slot].posted_date.timestamp(), slot)
+                if len(top) < limit:
+                    heapq.heappush(top, entry)
+                elif entry > top[0]:
+                    heapq.heapreplace(top, entry)
+
+        ranked = [
+            replace(self.postings[slot], match_score=score)
+            for score, _, slot in sorted(top, reverse=True)
+        ]
+        if len(ranked) < limit:
+            unmatched = mask
+            for counter in counters:
+                unmatched &= ~counter
+            newest = heapq.nlargest(
+                limit - len(ranked),
+                (
+                    (self.postings[slot].posted_date.timestamp(), slot)
+                    for slot in iter_slots(unmatched)
+                    if not check_salary or self._salary_ok(slot, min_salary, max_salary)
+                ),
+            )
+            ranked.extend(replace(self.postings[slot], match_score=0.0) for _, slot in newest)
+        return ranked
+
+
+job_index = JobIndex(skill_matcher.vocabulary, max_postings=settings.job_index_max_postings)
@@ -1,12 +1,32 @@
 import asyncio
+import json
 import random
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import Awaitable, Callable, List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import logging
 
+import httpx
+
+from core.config import settings
+from job_index import job_index
+from skill_matcher import skill_matcher
+from utils.resilience import RetryableError, SourceGuard
+
 logger = logging.getLogger(__name__)
 
+# Source key -> name stored on its postings
+SOURCE_NAMES = {
+    "indeed": "Indeed",
+    "linkedin": "LinkedIn",
+    "glassdoor": "Glassdoor",
+    "fixture": "Fixture",
+}
+
+# Upstream responses worth retrying with backoff
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
 @dataclass
 class JobPosting:
     id: str
@@ -26,30 +46,109 @@ class JobPosting:
     match_score: Optional[float] = None
 
 class JobScraperService:
+    """Scrapes job sources through one pooled HTTP client.
+
+    Every upstream request goes through its source's ``SourceGuard``
+    (concurrency cap, token-bucket rate limit, jittered retries and a
+    circuit breaker), so sources can be scraped concurrently without
+    stampeding any one site.
+    """
+
     def __init__(self):
-        self.session = None
+        self.session: Optional[httpx.AsyncClient] = None
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
         ]
-        self.rate_limit_delay = 1.0  # seconds between requests
+        self.guards: Dict[str, SourceGuard] = {}
+        # Source name (lowercase) -> scraper(skills, location, remote, limit)
+        self.sources: Dict[str, Callable[..., Awaitable[List[JobPosting]]]] = {
+            "indeed": self._scrape_indeed,
+            "linkedin": self._scrape_linkedin,
+            "glassdoor": self._scrape_glassdoor,
+            "fixture": self._scrape_fixture,
+        }
         
     async def __aenter__(self):
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        if self.session is not None and not self.session.is_closed:
+            await self.session.aclose()
+        self.session = None
+    
+    def get_session(self) -> httpx.AsyncClient:
+        """Long-lived pooled client shared by every scraper in this worker"""
+        if self.session is None or self.session.is_closed:
+            self.session = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.scraper_max_connections,
+                    max_keepalive_connections=settings.scraper_max_keepalive_connections,
+                ),
+                timeout=httpx.Timeout(settings.scraper_timeout, connect=settings.scraper_connect_timeout),
+                follow_redirects=True,
+            )
+        return self.session
     
-    async def scrape_jobs(self, skills: List[str], location: str = "", remote: bool = True, limit: int = 50) -> List[JobPosting]:
+    def guard(self, source: str) -> SourceGuard:
+        source = source.lower()
+        guard = self.guards.get(source)
+        if guard is None:
+            guard = self.guards[source] = SourceGuard(
+                source,
+                concurrency=settings.scraper_source_concurrency,
+                rate=settings.scraper_source_rate,
+                burst=settings.scraper_source_burst,
+                retries=settings.scraper_max_retries,
+                base_delay=settings.scraper_backoff_base,
+                max_delay=settings.scraper_backoff_max,
+                failure_threshold=settings.scraper_breaker_failures,
+                reset_timeout=settings.scraper_breaker_reset,
+                retry_on=(RetryableError, httpx.TransportError),
+            )
+        return guard
+    
+    async def fetch(self, source: str, url: str, method: str = "GET", **kwargs) -> httpx.Response:
+        """Request ``url`` for ``source`` under its guard; for use by real scrapers"""
+        headers = {"User-Agent": random.choice(self.user_agents), **kwargs.pop("headers", {})}
+        
+        async def send() -> httpx.Response:
+            response = await self.get_session().request(method, url, headers=headers, **kwargs)
+            if response.status_code in RETRY_STATUSES:
+                retry_after = response.headers.get("Retry-After")
+                raise RetryableError(
+                    f"{source} returned {response.status_code}",
+                    retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+                )
+            response.raise_for_status()
+            return response
+        
+        return await self.guard(source).call(send)
+    
+    async def scrape_source(self, source: str, skills: List[str], location: str = "", remote: bool = True, limit: int = 50) -> List[JobPosting]:
+        """Scrape a single source by name (see ``self.sources``)
+
+        Raises ``CircuitOpenError`` without scraping while the source's
+        circuit breaker is open.
+        """
+        scraper = self.sources.get(source.lower())
+        if scraper is None:
+            raise ValueError(f"Unknown job source: {source}")
+        return await scraper(skills, location, remote, limit)
+    
+    async def scrape_jobs(self, skills: List[str], location: str = "", remote: bool = True, limit: int = 50, sources: Optional[List[str]] = None) -> List[JobPosting]:
         """Scrape jobs from multiple sources concurrently"""
         try:
+            sources = sources or ["indeed", "linkedin", "glassdoor"]
+            per_source = max(1, limit // len(sources))
             # Run scraping tasks concurrently
             tasks = [
-                self._scrape_indeed(skills, location, remote, limit // 3),
-                self._scrape_linkedin(skills, location, remote, limit // 3),
-                self._scrape_glassdoor(skills, location, remote, limit // 3)
+                self.scrape_source(source, skills, location, remote, per_source)
+                for source in sources
             ]
             
             results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -63,8 +162,13 @@ class JobScraperService:
                     logger.warning(f"Scraping task failed: {result}")
             
             # Deduplicate and limit results
-            unique_jobs = self._deduplicate_jobs(all_jobs)
-            return unique_jobs[:limit]
+            unique_jobs = self._deduplicate_jobs(all_jobs)[:limit]
+
+            # Score every posting against the searched skills in one batch
+            scores = skill_matcher.match_scores([job.skills for job in unique_jobs], skills)
+            for job, score in zip(unique_jobs, scores):
+                job.match_score = score
+            return unique_jobs
             
         except Exception as e:
             logger.error(f"Error scraping jobs: {e}")
@@ -72,18 +176,32 @@ class JobScraperService:
     
     async def _scrape_indeed(self, skills: List[str], location: str = "", remote: bool = True, limit: int = 20) -> List[JobPosting]:
         """Mock Indeed scraping"""
-        await asyncio.sleep(0.1)  # Simulate network delay
-        return self._create_mock_jobs("Indeed", skills, limit)
+        # Simulated request, under the same limits a real one would get
+        await self.guard("indeed").call(lambda: asyncio.sleep(0.1))
+        return self._create_mock_jobs(SOURCE_NAMES["indeed"], skills, limit)
     
     async def _scrape_linkedin(self, skills: List[str], location: str = "", remote: bool = True, limit: int = 20) -> List[JobPosting]:
         """Mock LinkedIn scraping"""
-        await asyncio.sleep(0.1)  # Simulate network delay
-        return self._create_mock_jobs("LinkedIn", skills, limit)
+        # Simulated request, under the same limits a real one would get
+        await self.guard("linkedin").call(lambda: asyncio.sleep(0.1))
+        return self._create_mock_jobs(SOURCE_NAMES["linkedin"], skills, limit)
     
     async def _scrape_glassdoor(self, skills: List[str], location: str = "", remote: bool = True, limit: int = 20) -> List[JobPosting]:
         """Mock Glassdoor scraping"""
-        await asyncio.sleep(0.1)  # Simulate network delay
-        return self._create_mock_jobs("Glassdoor", skills, limit)
+        # Simulated request, under the same limits a real one would get
+        await self.guard("glassdoor").call(lambda: asyncio.sleep(0.1))
+        return self._create_mock_jobs(SOURCE_NAMES["glassdoor"], skills, limit)
+    
+    async def _scrape_fixture(self, skills: List[str], location: str = "", remote: bool = True, limit: int = 50) -> List[JobPosting]:
+        """Postings from a local JSON fixture, for offline development and tests"""
+        path = Path(settings.job_fixture_path or Path(__file__).parent / "fixtures" / "job_postings.json")
+        records = await asyncio.to_thread(lambda: json.loads(path.read_text(encoding="utf-8")))
+        jobs = []
+        for record in records[:limit]:
+            record = dict(record, source=record.get("source", SOURCE_NAMES["fixture"]))
+            record["posted_date"] = datetime.fromisoformat(record["posted_date"])
+            jobs.append(JobPosting(**record))
+        return jobs
     
     def _create_mock_jobs(self, source: str, skills: List[str], limit: int) -> List[JobPosting]:
         """Generate mock job data"""
@@ -117,9 +235,6 @@ class JobScraperService:
             common_skills = ["Git", "Agile", "Communication", "Problem Solving"]
             job_skills.extend(random.sample(common_skills, random.randint(1, 2)))
             
-            # Calculate match score based on skill overlap
-            match_score = self.calculate_match_score(job_skills, skills)
-            
             job = JobPosting(
                 id=f"{source.lower()}_{i}_{random.randint(1000, 9999)}",
                 title=random.choice(job_titles),
@@ -134,8 +249,7 @@ class JobScraperService:
                 posted_date=datetime.now() - timedelta(days=random.randint(0, 30)),
                 application_url=f"https://{source.lower()}.com/jobs/{random.randint(10000, 99999)}",
                 source=source,
-                remote=random.choice([True, False]),
-                match_score=match_score
+                remote=random.choice([True, False])
             )
             jobs.append(job)
         
@@ -155,76 +269,22 @@ class JobScraperService:
         return unique_jobs
     
     def calculate_match_score(self, job_skills: List[str], resume_skills: List[str]) -> float:
-        """Calculate how well a job matches the resume skills"""
-        if not resume_skills:
-            return 0.0
-        
-        # Convert to lowercase for comparison
-        job_skills_lower = [skill.lower() for skill in job_skills]
-        resume_skills_lower = [skill.lower() for skill in resume_skills]
-        
-        # Find matching skills
-        matches = sum(1 for skill in resume_skills_lower if skill in job_skills_lower)
-        
-        # Calculate score as percentage of resume skills that match
-        score = (matches / len(resume_skills_lower)) * 100
-        
-        # Add bonus for having many relevant skills
-        if len(job_skills) > len(resume_skills):
-            score += min(10, (len(job_skills) - len(resume_skills)) * 2)
-        
-        return min(100, max(0, score))
+        """Calculate how well a job matches the resume skills
+
+        Skills are compared after alias normalization (e.g. "JS" matches
+        "JavaScript"); use ``skill_matcher.match_scores`` for many jobs.
+        """
+        return skill_matcher.match_score(job_skills, resume_skills)
     
     async def search_jobs_by_skills(self, skills: List[str], filters: Dict[str, Any] = None) -> List[JobPosting]:
-        """Search jobs by skills with optional filters"""
+        """Search jobs by skills with optional filters
+
+        Reads the postings indexed from the job store; sources are scraped
+        in the background by ``job_store.job_refresh_scheduler``, never here.
+        """
         if not filters:
             filters = {}
-        
-        # Get base results
-        jobs = await self.scrape_jobs(skills, limit=filters.get('limit', 50))
-        
-        # Apply filters
-        if filters.get('min_salary'):
-            jobs = self._filter_by_salary(jobs, filters['min_salary'], filters.get('max_salary'))
-        
-        if filters.get('job_type'):
-            jobs = [job for job in jobs if job.job_type.lower() == filters['job_type'].lower()]
-        
-        if filters.get('experience_level'):
-            jobs = [job for job in jobs if job.experience_level.lower() == filters['experience_level'].lower()]
-        
-        if filters.get('remote') is not None:
-            jobs = [job for job in jobs if job.remote == filters['remote']]
-        
-        # Sort by match score
-        jobs.sort(key=lambda x: x.match_score or 0, reverse=True)
-        
-        return jobs
-    
-    def _filter_by_salary(self, jobs: List[JobPosting], min_salary: Optional[int], max_salary: Optional[int]) -> List[JobPosting]:
-        """Filter jobs by salary range"""
-        def extract_salary(salary_str: str) -> int:
-            try:
-                # Extract first number from salary string
-                import re
-                numbers = re.findall(r'\d+', salary_str)
-                return int(numbers[0]) if numbers else 0
-            except:
-                return 0
-        
-        filtered_jobs = []
-        for job in jobs:
-            if not job.salary_range:
-                continue
-            
-            job_salary = extract_salary(job.salary_range)
-            if min_salary and job_salary < min_salary:
-                continue
-            if max_salary and job_salary > max_salary:
-                continue
-            filtered_jobs.append(job)
-        
-        return filtered_jobs
+        return job_index.search(skills, filters, limit=filters.get('limit', 50))
 
 # Global instance
 job_scraper_service = JobScraperService()
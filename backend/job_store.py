@@ -0,0 +1,273 @@
+"""
+Persistent job posting store and its background refresh scheduler.
+
+``JobRefreshScheduler`` scrapes each configured source once its TTL has
+passed and upserts the postings into the ``job_postings`` collection.
+Every worker then pulls new and changed documents into ``job_index``, so
+searches read stored postings and never wait on a scrape. With Redis, a
+per-source marker key lets only one worker scrape a due source.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from core.config import settings
+from database import JobPostingDocument
+from job_index import JobIndex, job_index
+from job_scraper import SOURCE_NAMES, JobPosting, job_scraper_service
+from skill_matcher import normalize_skill
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOURCE_TTL = 3600
+REFRESH_KEY_PREFIX = "jobs:refresh:"
+
+# Re-read documents this far behind the sync watermark, so writes from
+# other workers that commit slightly out of order are not missed
+SYNC_OVERLAP = timedelta(seconds=30)
+SYNC_CHUNK = 1000
+
+
+def parse_source_ttls(spec: str) -> Dict[str, int]:
+    """``"indeed:3600,fixture"`` -> ``{"indeed": 3600, "fixture": DEFAULT_SOURCE_TTL}``"""
+    ttls = {}
+    for item in spec.split(","):
+        name, _, ttl = item.strip().partition(":")
+        if name:
+            ttls[name.lower()] = int(ttl) if ttl.strip() else DEFAULT_SOURCE_TTL
+    return ttls
+
+
+def posting_key(job: JobPosting) -> str:
+    return f"{job.title.lower()}|{job.company.lower()}"
+
+
+class JobStore:
+    """Reads and writes postings in the ``job_postings`` collection."""
+
+    async def upsert(self, jobs: List[JobPosting], retention: int) -> int:
+        """Insert or refresh ``jobs``; returns how many documents changed."""
+        if not jobs:
+            return 0
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=retention)
+        operations = []
+        for job in jobs:
+            fields = asdict(job)
+            fields.pop("match_score", None)
+            fields["posting_id"] = fields.pop("id")
+            fields.update(
+                posting_key=posting_key(job),
+                skill_keys=sorted({normalize_skill(skill) for skill in job.skills if skill.strip()}),
+                scraped_at=now,
+                expires_at=expires_at,
+            )
+            operations.append(UpdateOne({"posting_key": fields["posting_key"]}, {"$set": fields}, upsert=True))
+        result = await JobPostingDocument.get_motor_collection().bulk_write(operations, ordered=False)
+        return result.upserted_count + result.modified_count
+
+    async def last_scraped(self, source: str) -> Optional[datetime]:
+        document = await JobPostingDocument.find(
+            JobPostingDocument.source == source
+        ).sort(-JobPostingDocument.scraped_at).first_or_none()
+        return document.scraped_at if document else None
+
+    def changed_since(self, since: datetime):
+        """Documents scraped after ``since``, oldest first (async iterable)."""
+        return JobPostingDocument.find(JobPostingDocument.scraped_at > since).sort(+JobPostingDocument.scraped_at)
+
+    @staticmethod
+    def to_posting(document: JobPostingDocument) -> JobPosting:
+        return JobPosting(
+            id=document.posting_id,
+            title=document.title,
+            company=document.company,
+            location=document.location,
+            description=document.description,
+            requirements=document.requirements,
+            skills=document.skills,
+            salary_range=document.salary_range,
+            job_type=document.job_type,
+            experience_level=document.experience_level,
+            posted_date=document.posted_date,
+            application_url=document.application_url,
+            source=document.source,
+            remote=document.remote,
+        )
+
+
+class JobRefreshScheduler:
+    """Refreshes sources on their TTLs and keeps an index in sync with the store."""
+
+    def __init__(
+        self,
+        store: JobStore,
+        index: JobIndex,
+        source_ttls: Dict[str, int],
+        refresh_skills: List[str],
+        refresh_limit: int = 50,
+        retention: int = 259200,
+        tick: float = 60.0,
+        retry_delay: float = 300.0,
+    ) -> None:
+        self.store = store
+        self.index = index
+        self.source_ttls = source_ttls
+        self.refresh_skills = refresh_skills
+        self.refresh_limit = refresh_limit
+        self.retention = retention
+        self.tick = tick
+        self.retry_delay = retry_delay
+        self._redis: Any = None
+        self._task: Optional[asyncio.Task] = None
+        self._due_at: Dict[str, datetime] = {}
+        self._watermark: Optional[datetime] = None
+        # (expires_at, seq, key, posting) of indexed postings, soonest first
+        self._expiry: List[Tuple[datetime, int, str, JobPosting]] = []
+        self._expires_at: Dict[str, datetime] = {}
+        self._seq = itertools.count()
+
+    async def start(self, redis_client: Any = None) -> None:
+        """Start refreshing sources and syncing the index in the background.
+
+        Startup doesn't wait for any scrape: searches see the postings
+        already stored as soon as the first index sync finishes, and return
+        nothing on a fresh deploy until the first refresh has completed.
+        """
+        if self._task is not None:
+            return
+        self._redis = redis_client
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Job refresh scheduler started for sources: {', '.join(self.source_ttls)}")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        await self._load_schedule()
+        # Index what is already stored before the first, slower, scrape
+        try:
+            await self.sync_index()
+        except Exception as e:
+            logger.error(f"Initial job index sync failed: {e}")
+        while True:
+            await self._cycle()
+            await asyncio.sleep(self.tick)
+
+    async def _cycle(self) -> None:
+        try:
+            await self.refresh_due()
+            await self.sync_index()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Job refresh cycle failed: {e}")
+
+    async def _load_schedule(self) -> None:
+        """Resume each source's schedule from its newest stored posting."""
+        now = datetime.utcnow()
+        for source, ttl in self.source_ttls.items():
+            try:
+                last = await self.store.last_scraped(SOURCE_NAMES.get(source, source))
+            except Exception as e:
+                logger.error(f"Could not read last refresh of {source}: {e}")
+                last = None
+            self._due_at[source] = last + timedelta(seconds=ttl) if last else now
+
+    async def refresh_due(self) -> None:
+        now = datetime.utcnow()
+        due = [source for source in self.source_ttls if self._due_at.get(source, now) <= now]
+        if due:
+            await asyncio.gather(*(self.refresh_source(source) for source in due))
+
+    async def refresh_source(self, source: str) -> int:
+        """Scrape ``source`` and store its postings, unless another worker just did."""
+        ttl = self.source_ttls.get(source, DEFAULT_SOURCE_TTL)
+        self._due_at[source] = datetime.utcnow() + timedelta(seconds=ttl)
+        if not await self._claim(source, ttl):
+            return 0
+        try:
+            jobs = await job_scraper_service.scrape_source(source, self.refresh_skills, limit=self.refresh_limit)
+            changed = await self.store.upsert(jobs, self.retention)
+        except Exception as e:
+            # Let this or any other worker try again soon rather than after a full TTL
+            logger.error(f"Refreshing job source {source} failed, retrying in {self.retry_delay:.0f}s: {e}")
+            self._due_at[source] = datetime.utcnow() + timedelta(seconds=self.retry_delay)
+            await self._release(source)
+            return 0
+        logger.info(f"Refreshed job source {source}: {len(jobs)} postings, {changed} changed")
+        return changed
+
+    async def _claim(self, source: str, ttl: int) -> bool:
+        if self._redis is None:
+            return True
+        try:
+            return bool(await self._redis.set(f"{REFRESH_KEY_PREFIX}{source}", "1", nx=True, ex=ttl))
+        except Exception as e:
+            logger.error(f"Job refresh claim for {source} failed, refreshing anyway: {e}")
+            return True
+
+    async def _release(self, source: str) -> None:
+        if self._redis is None:
+            return
+        try:
+            await self._redis.delete(f"{REFRESH_KEY_PREFIX}{source}")
+        except Exception as e:
+            logger.error(f"Releasing job refresh claim for {source} failed: {e}")
+
+    async def sync_index(self) -> int:
+        """Add documents changed since the last sync to the index and drop expired ones."""
+        synced = 0
+        batch: List[JobPosting] = []
+        since = self._watermark - SYNC_OVERLAP if self._watermark else datetime.min
+        async for document in self.store.changed_since(since):
+            self._watermark = max(self._watermark or document.scraped_at, document.scraped_at)
+            posting = self.store.to_posting(document)
+            key = posting_key(posting)
+            if self._expires_at.get(key) == document.expires_at:
+                continue  # already indexed in this version
+            self._expires_at[key] = document.expires_at
+            heapq.heappush(self._expiry, (document.expires_at, next(self._seq), key, posting))
+            batch.append(posting)
+            if len(batch) >= SYNC_CHUNK:
+                synced += len(batch)
+                self.index.add(batch)
+                batch = []
+                await asyncio.sleep(0)  # let requests run between chunks
+        if batch:
+            synced += len(batch)
+            self.index.add(batch)
+
+        now = datetime.utcnow()
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, _, key, posting = heapq.heappop(self._expiry)
+            if self._expires_at.get(key) == expires_at:
+                del self._expires_at[key]
+                self.index.remove(posting)
+        return synced
+
+
+job_store = JobStore()
+job_refresh_scheduler = JobRefreshScheduler(
+    job_store,
+    job_index,
+    source_ttls=parse_source_ttls(settings.job_sources),
+    refresh_skills=[skill.strip() for skill in settings.job_refresh_skills.split(",") if skill.strip()],
+    refresh_limit=settings.job_refresh_limit,
+    retention=settings.job_posting_retention,
+    tick=settings.job_refresh_tick,
+    retry_delay=settings.job_refresh_retry,
+)
@@ -17,6 +17,11 @@ from core.error_handlers import (
 )
 from database import init_database, close_database
 from utils.redis_cache import cache
+from openai_service import openai_service
+from file_parser import extraction_pool
+from utils.job_queue import InMemoryJobBackend, RedisJobBackend, job_queue
+from job_store import job_refresh_scheduler
+from job_scraper import job_scraper_service
 from routes.auth import router as auth_router
 from routes.resumes import router as resume_router
 from routes.health import router as health_router
@@ -75,15 +80,30 @@ async def startup_event():
     
     # Initialize Redis cache
     await cache.connect()
+
+    # Start background job workers; fall back to in-process jobs without Redis
+    if cache.redis_client is not None:
+        await job_queue.start(RedisJobBackend(cache.redis_client))
+    else:
+        await job_queue.start(InMemoryJobBackend())
+
+    # Keep stored job postings fresh; searches read them, never scrape.
+    # Refreshes run in the background, so startup never waits on a source.
+    await job_refresh_scheduler.start(cache.redis_client)
     
     logger.info("Application started successfully")
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Close database and cache connections on shutdown."""
+    """Close database, cache and AI client connections on shutdown."""
     logger.info("Shutting down application...")
+    await job_refresh_scheduler.stop()
+    await job_scraper_service.aclose()
+    await job_queue.stop()
+    extraction_pool.shutdown()
     await close_database()
     await cache.disconnect()
+    await openai_service.aclose()
     logger.info("Application shutdown complete")
 
 # Exception handlers
@@ -1,434 +1,437 @@
+import asyncio
 import json
-import os
-from typing import Dict, Any, List
-from datetime import date
+import logging
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 
+import httpx
+
+from ai_provider import AIProvider, ProviderRouter
 from models import Resume, JobDescription
 from core.config import settings
-from utils.redis_cache import cache_ai_response
+from prompts import (
+    PROMPT_VERSION,
+    Messages,
+    build_batch_score_messages,
+    build_cover_letter_messages,
+    build_generate_resume_messages,
+    build_optimize_resume_messages,
+    build_score_resume_messages,
+    strip_code_fences,
+)
+from utils.json_stream import JSONSectionStream
+from utils.redis_cache import CacheBypass, cache, cache_ai_response
+from utils.token_budget import estimate_tokens, minify_json, pack_by_budget
 
-class DateEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, date):
-            return obj.isoformat()
-        return super().default(obj)
+logger = logging.getLogger(__name__)
 
 try:
     # New SDK style; if unavailable, fallback will be handled in calls
-    from openai import OpenAI
+    from openai import AsyncOpenAI
 except Exception:  # pragma: no cover - fallback import for older SDKs
-    OpenAI = None  # type: ignore
+    AsyncOpenAI = None  # type: ignore
 
+OPENROUTER_HEADERS = {
+    "HTTP-Referer": "https://resume-builder.local",  # Optional. Site URL for rankings on openrouter.ai.
+    "X-Title": "Resume Builder",  # Optional. Site title for rankings on openrouter.ai.
+}
+
+
+class OpenRouterProvider(AIProvider):
+    """OpenRouter provider.
+
+    All calls go through one ``AsyncOpenAI`` client sharing a pooled
+    ``httpx.AsyncClient``, so a single worker can keep many LLM requests in
+    flight without blocking the event loop.
+    """
+
+    name = "openrouter"
 
-class OpenAIService:
     def __init__(self):
         self.model = settings.open_router_model
-        self._client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=settings.open_router_key,
-        ) if OpenAI else None
-    
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._client = None
+        if AsyncOpenAI:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.ai_max_connections,
+                    max_keepalive_connections=settings.ai_max_keepalive_connections,
+                ),
+                timeout=httpx.Timeout(
+                    settings.ai_request_timeout, connect=settings.ai_connect_timeout
+                ),
+            )
+            self._client = AsyncOpenAI(
+                base_url=settings.open_router_base_url,
+                api_key=settings.open_router_key,
+                http_client=self._http_client,
+                max_retries=settings.ai_max_retries,
+            )
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+        if self._http_client is not None and not self._http_client.is_closed:
+            await self._http_client.aclose()
+
+    async def complete(
+        self,
+        messages: Messages,
+        temperature: float,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """Run a chat completion and return the stripped message content.
+
+        ``timeout`` bounds the whole call (including SDK retries); when it
+        expires, or the calling task is cancelled, the in-flight HTTP request
+        is cancelled and its connection returned to the pool.
+        """
+        if not self._client:
+            raise RuntimeError("OpenAI client not initialized")
+
+        timeout = timeout or settings.ai_request_timeout
+        response = await asyncio.wait_for(
+            self._client.chat.completions.create(
+                extra_headers=OPENROUTER_HEADERS,
+                extra_body={},
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                timeout=timeout,
+            ),
+            timeout=timeout,
+        )
+        return (response.choices[0].message.content or "").strip()
+
+    async def stream(
+        self,
+        messages: Messages,
+        temperature: float,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        if not self._client:
+            raise RuntimeError("OpenAI client not initialized")
+
+        timeout = timeout or settings.ai_request_timeout
+        response = await asyncio.wait_for(
+            self._client.chat.completions.create(
+                extra_headers=OPENROUTER_HEADERS,
+                extra_body={},
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                timeout=timeout,
+                stream=True,
+            ),
+            timeout=timeout,
+        )
+        chunks = response.__aiter__()
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(chunks.__anext__(), timeout=timeout)
+                except StopAsyncIteration:
+                    break
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            # Return the connection to the pool even if the consumer stops early
+            await response.response.aclose()
+
+
+def build_default_router() -> ProviderRouter:
+    """Create a router over every provider listed in ``settings.ai_providers``.
+
+    Providers whose SDK is missing or whose API key is not configured are
+    skipped; OpenRouter is always available as the last resort.
+    """
+    factories = {
+        "openrouter": (OpenRouterProvider, settings.open_router_key),
+    }
+    try:
+        from groq_service import GroqService
+        factories["groq"] = (GroqService, settings.groq_api_key)
+    except ImportError:
+        pass
+    try:
+        from gemini_service import GeminiService
+        factories["gemini"] = (GeminiService, settings.gemini_api_key)
+    except ImportError:
+        pass
+
+    providers: List[AIProvider] = []
+    for name in (n.strip() for n in settings.ai_providers.split(",")):
+        factory, api_key = factories.get(name, (None, None))
+        if factory is None or not api_key:
+            continue
+        try:
+            providers.append(factory())
+        except ImportError as e:
+            logger.info(f"AI provider {name} unavailable: {e}")
+
+    if not any(isinstance(p, OpenRouterProvider) for p in providers):
+        providers.append(OpenRouterProvider())
+    return ProviderRouter(providers, default_timeout=settings.ai_request_timeout)
+
+
+class OpenAIService:
+    """AI operations used by the API routes.
+
+    Completions are delegated to a ``ProviderRouter`` so a slow or failing
+    provider is routed around instead of stalling requests.
+    """
+
+    def __init__(self, router: Optional[ProviderRouter] = None):
+        self.router = router or build_default_router()
+
+    @property
+    def model(self) -> str:
+        return self.router.model
+
+    @property
+    def cache_fingerprint(self) -> str:
+        """Identifies the prompt version in content-addressed AI cache keys.
+
+        The configured providers are left out: which one answers varies per
+        call, and adding or removing an API key must not drop every cached
+        result. Bump ``PROMPT_VERSION`` to invalidate.
+        """
+        return f"prompt-v{PROMPT_VERSION}"
+
+    async def aclose(self) -> None:
+        """Release pooled provider connections (called on application shutdown)."""
+        await self.router.aclose()
+
+    async def _complete(
+        self,
+        messages: Messages,
+        temperature: float,
+        timeout: Optional[float] = None,
+    ) -> str:
+        return await self.router.complete(messages, temperature, timeout)
+
     @cache_ai_response(ttl=7200)  # Cache AI responses for 2 hours
     async def parse_resume(self, resume_text: str, pre_processed_hints: Dict[str, Any] = None) -> Resume:
         """Parse resume text and extract structured information
-        
+
         Args:
             resume_text: The raw text extracted from the resume
             pre_processed_hints: Pre-processed structured data to help guide the AI parsing
         """
-        
-        # Prepare hints from pre-processed data if available
-        hints_text = ""
-        if pre_processed_hints:
-            hints_text = "\nPre-processed information to help with parsing:\n"
-            
-            # Add detected sections
-            if "detected_sections" in pre_processed_hints and pre_processed_hints["detected_sections"]:
-                hints_text += f"Detected sections: {', '.join(pre_processed_hints['detected_sections'])}\n"
-            
-            # Add extracted contact info
-            if "email" in pre_processed_hints:
-                hints_text += f"Detected email: {pre_processed_hints['email']}\n"
-            if "phone" in pre_processed_hints:
-                hints_text += f"Detected phone: {pre_processed_hints['phone']}\n"
-            if "name" in pre_processed_hints:
-                hints_text += f"Detected name: {pre_processed_hints['name']}\n"
-            
-            # Add section content hints
-            if "sections" in pre_processed_hints:
-                for section_name, content in pre_processed_hints["sections"].items():
-                    # Only include a preview of each section to keep prompt size reasonable
-                    content_preview = content[:200] + "..." if len(content) > 200 else content
-                    hints_text += f"\nDetected {section_name} section content preview:\n{content_preview}\n"
-        
-        prompt = f"""
-        Parse the following resume text and extract structured information. Return a JSON object with the following structure:
-        {{
-            "personal_info": {{
-                "full_name": "",
-                "email": "",
-                "phone": "",
-                "location": "",
-                "linkedin": "",
-                "github": "",
-                "website": ""
-            }},
-            "professional_summary": "",
-            "skills": [],
-            "experience": [
-                {{
-                    "company": "",
-                    "position": "",
-                    "start_date": "YYYY-MM-DD or null",
-                    "end_date": "YYYY-MM-DD or null",
-                    "description": [],
-                    "is_current": false
-                }}
-            ],
-            "education": [
-                {{
-                    "institution": "",
-                    "degree": "",
-                    "field_of_study": "",
-                    "start_date": "YYYY-MM-DD or null",
-                    "end_date": "YYYY-MM-DD or null",
-                    "gpa": ""
-                }}
-            ],
-            "projects": [
-                {{
-                    "name": "",
-                    "description": "",
-                    "technologies": [],
-                    "url": ""
-                }}
-            ],
-            "certifications": [
-                {{
-                    "name": "",
-                    "issuing_organization": "",
-                    "issue_date": "YYYY-MM-DD or null",
-                    "expiration_date": "YYYY-MM-DD or null",
-                    "credential_id": ""
-                }}
-            ]
-        }}
-
-        Resume text:
-        {resume_text}
-        {hints_text}
-        
-        Return only valid JSON without any additional text or formatting.
-        """
-        
         try:
-            if not self._client:
-                raise RuntimeError("OpenAI client not initialized")
-
-            response = self._client.chat.completions.create(
-                extra_headers={
-                    "HTTP-Referer": "https://resume-builder.local",  # Optional. Site URL for rankings on openrouter.ai.
-                    "X-Title": "Resume Builder",  # Optional. Site title for rankings on openrouter.ai.
-                },
-                extra_body={},
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a resume parsing expert. Extract structured information from resumes and return valid JSON. Pay special attention to the pre-processed hints provided, but verify all information against the original text."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                timeout=30,
-            )
+            return await self.router.parse_resume(resume_text, pre_processed_hints)
 
-            content = response.choices[0].message.content.strip()
-            # Remove any markdown formatting if present
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.endswith("```"):
-                content = content[:-3]
-            
-            parsed_data = json.loads(content)
-            print(f"AI parsed data: {parsed_data}")
-            print(f"Projects in parsed data: {parsed_data.get('projects', [])}")
-            return Resume(**parsed_data)
-            
         except Exception as e:
             # Consider raising a typed error for upstream handling
-            print(f"Error parsing resume: {e}")
-            import traceback
-            traceback.print_exc()
-            return Resume()
-    
+            logger.error(f"Error parsing resume: {e}", exc_info=True)
+            raise CacheBypass(Resume())
+
     @cache_ai_response(ttl=7200)  # Cache AI responses for 2 hours
     async def optimize_resume_for_job(self, resume: Resume, job_description: JobDescription) -> Resume:
         """Optimize resume based on job description"""
-        
-        resume_json = resume.model_dump()
-        
-        prompt = f"""
-        Optimize the following resume for this job description. Focus on:
-        1. Tailoring the professional summary to match the role
-        2. Highlighting relevant skills and experience
-        3. Rewriting experience descriptions to emphasize relevant achievements
-        4. Suggesting relevant keywords from the job description
-        
-        Job Description:
-        Title: {job_description.title}
-        Company: {job_description.company}
-        Description: {job_description.description}
-        Requirements: {', '.join(job_description.requirements)}
-        
-        Current Resume:
-        {json.dumps(resume_json, indent=2, cls=DateEncoder)}
-        
-        Return the optimized resume in the same JSON format. Keep all existing information but enhance it for this specific role.
-        """
-        
         try:
-            if not self._client:
-                raise RuntimeError("OpenAI client not initialized")
-
-            response = self._client.chat.completions.create(
-                extra_headers={
-                    "HTTP-Referer": "https://resume-builder.local",
-                    "X-Title": "Resume Builder",
-                },
-                extra_body={},
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a professional resume writer. Optimize resumes to match job descriptions while maintaining accuracy and professionalism."},
-                    {"role": "user", "content": prompt}
-                ],
+            content = await self._complete(
+                build_optimize_resume_messages(resume, job_description),
                 temperature=0.3,
                 timeout=30,
             )
-
-            content = response.choices[0].message.content.strip()
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.endswith("```"):
-                content = content[:-3]
-            
-            optimized_data = json.loads(content)
+            optimized_data = json.loads(strip_code_fences(content))
             return Resume(**optimized_data)
-            
+
         except Exception as e:
-            print(f"Error optimizing resume: {e}")
-            return resume
-    
+            logger.error(f"Error optimizing resume: {e}")
+            raise CacheBypass(resume)
+
     @cache_ai_response(ttl=7200)  # Cache AI responses for 2 hours
     async def generate_resume_from_job(self, job_description: JobDescription, user_background: str = None) -> Resume:
         """Generate a resume template based on job description"""
-        
-        background_context = f"User background: {user_background}" if user_background else "No specific background provided."
-        
-        prompt = f"""
-        Create a resume template based on this job description and user background. Generate realistic but generic content that matches the role requirements.
-        
-        Job Description:
-        Title: {job_description.title}
-        Company: {job_description.company}
-        Description: {job_description.description}
-        Requirements: {', '.join(job_description.requirements)}
-        
-        {background_context}
-        
-        Create a resume with:
-        1. Professional summary tailored to the role
-        2. Relevant skills extracted from job requirements
-        3. 2-3 sample work experiences that would be relevant
-        4. Sample education background
-        5. 1-2 relevant projects
-        
-        Return in this JSON format:
-        {{
-            "personal_info": {{
-                "full_name": "[Your Name]",
-                "email": "[Your Email]",
-                "phone": "[Your Phone]",
-                "location": "[Your Location]",
-                "linkedin": "[LinkedIn URL]",
-                "github": "[GitHub URL]",
-                "website": "[Website URL]"
-            }},
-            "professional_summary": "",
-            "skills": [],
-            "experience": [],
-            "education": [],
-            "projects": [],
-            "certifications": []
-        }}
-        """
-        
         try:
-            if not self._client:
-                raise RuntimeError("OpenAI client not initialized")
-
-            response = self._client.chat.completions.create(
-                extra_headers={
-                    "HTTP-Referer": "https://resume-builder.local",
-                    "X-Title": "Resume Builder",
-                },
-                extra_body={},
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a professional resume writer. Create resume templates that match job requirements."},
-                    {"role": "user", "content": prompt}
-                ],
+            content = await self._complete(
+                build_generate_resume_messages(job_description, user_background),
                 temperature=0.5,
                 timeout=30,
             )
-
-            content = response.choices[0].message.content.strip()
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.endswith("```"):
-                content = content[:-3]
-            
-            generated_data = json.loads(content)
+            generated_data = json.loads(strip_code_fences(content))
             return Resume(**generated_data)
-            
+
         except Exception as e:
-            print(f"Error generating resume: {e}")
-            return Resume()
+            logger.error(f"Error generating resume: {e}")
+            raise CacheBypass(Resume())
 
     @cache_ai_response(ttl=7200)  # Cache AI responses for 2 hours
     async def generate_cover_letter(self, resume: Resume, job_description: JobDescription) -> str:
         """Generate a cover letter based on the resume and job description."""
-        
-        def date_serializer(obj):
-            if isinstance(obj, date):
-                return obj.isoformat()
-            raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-
-        resume_json = resume.model_dump()
-
-        prompt = f"""
-        Generate a professional cover letter based on the following resume and job description.
-
-        The cover letter should be:
-        - Tailored to the specific job description.
-        - Highlight the most relevant skills and experiences from the resume.
-        - Written in a professional and engaging tone.
-        - Formatted as a standard cover letter with a clear introduction, body, and conclusion.
-
-        Job Description:
-        Title: {job_description.title}
-        Company: {job_description.company}
-        Description: {job_description.description}
-        Requirements: {', '.join(job_description.requirements)}
-
-        Resume:
-        {json.dumps(resume_json, indent=2, cls=DateEncoder)}
-
-        Return only the cover letter text.
-        """
-        
         try:
-            if not self._client:
-                raise RuntimeError("OpenAI client not initialized")
-
-            response = self._client.chat.completions.create(
-                extra_headers={
-                    "HTTP-Referer": "https://resume-builder.local",
-                    "X-Title": "Resume Builder",
-                },
-                extra_body={},
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a professional career coach and expert cover letter writer."},
-                    {"role": "user", "content": prompt}
-                ],
+            return await self._complete(
+                build_cover_letter_messages(resume, job_description),
                 temperature=0.7,
                 timeout=120,
             )
 
-            cover_letter_text = response.choices[0].message.content.strip()
-            return cover_letter_text
-            
         except Exception as e:
-            print(f"Error generating cover letter: {e}")
-            return "Error generating cover letter."
+            logger.error(f"Error generating cover letter: {e}")
+            raise CacheBypass("Error generating cover letter.")
 
     @cache_ai_response(ttl=7200)  # Cache AI responses for 2 hours
     async def score_resume(self, resume: Resume, job_description: str = None) -> Dict[str, Any]:
         """Score a resume and provide feedback using AI."""
-        
-        resume_json = resume.model_dump()
-
-        job_context = ""
-        if job_description:
-            job_context = f"""
-            Job Description Context:
-            {job_description}
-            
-            Please evaluate how well this resume matches the job requirements.
-            """
-
-        prompt = f"""
-        Analyze the following resume and provide a comprehensive score and feedback.
-
-        {job_context}
-
-        Resume:
-        {json.dumps(resume_json, indent=2, cls=DateEncoder)}
-
-        Please provide a detailed analysis including:
-        1. Overall score (0-100)
-        2. Strengths and positive aspects
-        3. Areas for improvement
-        4. Specific suggestions for enhancement
-
-        Return a JSON object with the following structure:
-        {{
-            "score": 85,
-            "feedback": [
-                "Strong technical skills section",
-                "Clear and concise professional summary",
-                "Good use of action verbs in experience descriptions"
-            ],
-            "suggestions": [
-                "Add more quantifiable achievements",
-                "Include relevant certifications",
-                "Consider adding a projects section"
-            ]
-        }}
-        """
-        
         try:
-            if not self._client:
-                raise RuntimeError("OpenAI client not initialized")
-
-            response = self._client.chat.completions.create(
-                extra_headers={
-                    "HTTP-Referer": "https://resume-builder.local",
-                    "X-Title": "Resume Builder",
-                },
-                extra_body={},
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a professional resume reviewer and career coach with expertise in evaluating resumes for various industries and positions."},
-                    {"role": "user", "content": prompt}
-                ],
+            content = await self._complete(
+                build_score_resume_messages(resume, job_description),
                 temperature=0.3,
                 timeout=60,
             )
-
-            content = response.choices[0].message.content.strip()
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.endswith("```"):
-                content = content[:-3]
-            
-            score_result = json.loads(content)
+            score_result = json.loads(strip_code_fences(content))
             return score_result
-            
+
         except Exception as e:
-            print(f"Error scoring resume: {e}")
-            return {
+            logger.error(f"Error scoring resume: {e}")
+            raise CacheBypass({
                 "score": 50,
                 "feedback": ["Unable to analyze resume due to technical issues"],
                 "suggestions": ["Please try again later or contact support"]
-            }
+            })
+
+    async def score_resume_batch(self, resume: Resume, job_descriptions: List[str]) -> AsyncIterator[Dict[str, Any]]:
+        """Score a resume against several job descriptions, yielding results as they finish.
+
+        Yields ``{"index", "result", "cached"}`` per job description, in
+        completion order. Results share the cache entries of
+        ``score_resume``, so only uncached descriptions are sent: they are
+        packed into as few calls as ``ai_batch_score_token_budget`` allows,
+        and the calls run concurrently.
+        """
+        cached_method = OpenAIService.score_resume
+        keys = [cached_method.cache_key(self, resume, jd) for jd in job_descriptions]
+        hits = await asyncio.gather(*(cache.get(key) for key in keys))
+
+        pending: List[int] = []
+        for index, hit in enumerate(hits):
+            if hit is not None:
+                yield {"index": index, "result": hit, "cached": True}
+            else:
+                pending.append(index)
+        if not pending:
+            return
+
+        resume_tokens = estimate_tokens(minify_json(resume.model_dump(mode="json")))
+        costs = [
+            min(estimate_tokens(job_descriptions[i]), settings.ai_job_description_token_budget)
+            for i in pending
+        ]
+        groups = pack_by_budget(
+            costs,
+            max(settings.ai_batch_score_token_budget - resume_tokens, 1),
+            settings.ai_batch_score_max_items,
+        )
+        semaphore = asyncio.Semaphore(settings.ai_batch_score_concurrency)
+
+        async def run(group: List[int]) -> List[Tuple[int, Dict[str, Any]]]:
+            indices = [pending[i] for i in group]
+            async with semaphore:
+                return await self._score_group(
+                    resume, indices, [job_descriptions[i] for i in indices], [keys[i] for i in indices]
+                )
+
+        tasks = [asyncio.ensure_future(run(group)) for group in groups]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for index, result in await next_done:
+                    yield {"index": index, "result": result, "cached": False}
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _score_group(
+        self,
+        resume: Resume,
+        indices: List[int],
+        job_descriptions: List[str],
+        keys: List[str],
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """Score one packed group, falling back to single calls for anything missing."""
+        results: Dict[int, Dict[str, Any]] = {}
+        if len(indices) > 1:
+            try:
+                content = await self._complete(
+                    build_batch_score_messages(resume, job_descriptions),
+                    temperature=0.3,
+                    timeout=90,
+                )
+                for item in json.loads(strip_code_fences(content)).get("results", []):
+                    position = item.pop("job", None)
+                    if isinstance(position, int) and 0 <= position < len(indices) and "score" in item:
+                        results[position] = item
+            except Exception as e:
+                logger.error(f"Error batch scoring resume against {len(indices)} jobs: {e}")
+
+        for position, result in results.items():
+            await cache.set(keys[position], result, OpenAIService.score_resume.cache_ttl)
+
+        missing = [position for position in range(len(indices)) if position not in results]
+        singles = await asyncio.gather(
+            *(self.score_resume(resume, job_descriptions[position]) for position in missing)
+        )
+        results.update(zip(missing, singles))
+        return [(indices[position], results[position]) for position in range(len(indices))]
+
+    async def stream_cover_letter(self, resume: Resume, job_description: JobDescription) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a cover letter as ``delta`` events followed by ``done``.
+
+        Shares the cache entry of ``generate_cover_letter``: a hit is sent
+        as one delta, and a completed stream populates the cache.
+        """
+        cached_method = OpenAIService.generate_cover_letter
+        cache_key = cached_method.cache_key(self, resume, job_description)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            yield {"event": "delta", "data": {"text": cached}}
+            yield {"event": "done", "data": {"cover_letter": cached, "cached": True}}
+            return
+
+        parts: List[str] = []
+        async for chunk in self.router.stream(
+            build_cover_letter_messages(resume, job_description),
+            temperature=0.7,
+            timeout=120,
+        ):
+            parts.append(chunk)
+            yield {"event": "delta", "data": {"text": chunk}}
+
+        cover_letter = "".join(parts).strip()
+        await cache.set(cache_key, cover_letter, cached_method.cache_ttl)
+        yield {"event": "done", "data": {"cover_letter": cover_letter, "cached": False}}
+
+    async def stream_optimized_resume(self, resume: Resume, job_description: JobDescription) -> AsyncIterator[Dict[str, Any]]:
+        """Stream resume optimization as ``section`` events followed by ``done``.
+
+        Each top-level resume section is emitted as soon as the model has
+        finished generating it (unvalidated, as produced). ``done`` carries
+        the full validated resume, which is also stored in the cache entry
+        of ``optimize_resume_for_job``.
+        """
+        cached_method = OpenAIService.optimize_resume_for_job
+        cache_key = cached_method.cache_key(self, resume, job_description)
+        cached = await cache.get(cache_key, model=Resume)
+        if cached is not None:
+            resume_dict = cached.model_dump(mode="json")
+            for name, value in resume_dict.items():
+                yield {"event": "section", "data": {"name": name, "value": value}}
+            yield {"event": "done", "data": {"resume": resume_dict, "cached": True}}
+            return
+
+        parser = JSONSectionStream()
+        parts: List[str] = []
+        async for chunk in self.router.stream(
+            build_optimize_resume_messages(resume, job_description),
+            temperature=0.3,
+            timeout=30,
+        ):
+            parts.append(chunk)
+            for name, value in parser.feed(chunk):
+                yield {"event": "section", "data": {"name": name, "value": value}}
+
+        optimized = Resume(**json.loads(strip_code_fences("".join(parts))))
+        await cache.set(cache_key, optimized, cached_method.cache_ttl)
+        yield {"event": "done", "data": {"resume": optimized.model_dump(mode="json"), "cached": False}}
 
 openai_service = OpenAIService()
@@ -0,0 +1,384 @@
+"""
+Prompt builders shared by every AI provider.
+
+Each ``build_*_messages`` function returns a chat message list
+(``[{"role": "system", ...}, {"role": "user", ...}]``) that any provider
+implementing ``AIProvider.complete`` can send as-is.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+
+from core.config import settings
+from models import JobDescription, Resume
+from utils.token_budget import dedupe_hints, fit_json, minify_json, squeeze_lines, truncate_text
+
+# Bump whenever prompt wording or output schema changes so cached AI
+# responses produced by older prompts are not reused. Cache keys leave out
+# the model, so also bump it when a model change should invalidate them.
+PROMPT_VERSION = "3"
+
+# Resume sections cut first (lowest value first) when a resume exceeds its
+# prompt budget
+RESUME_TRIM_ORDER = ("certifications", "projects", "education", "experience", "skills")
+
+Messages = List[Dict[str, str]]
+
+
+def strip_code_fences(content: str) -> str:
+    """Remove markdown code fences the model sometimes wraps JSON in."""
+    content = content.strip()
+    if content.startswith("```json"):
+        content = content[7:]
+    elif content.startswith("```"):
+        content = content[3:]
+    if content.endswith("```"):
+        content = content[:-3]
+    return content.strip()
+
+
+def _messages(system: str, prompt: str) -> Messages:
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": prompt},
+    ]
+
+
+def _render(template: str, **values: str) -> str:
+    """Fill ``template`` after squeezing it, leaving ``values`` as given."""
+    # Template indentation and blank lines are pure token overhead, but the
+    # line structure of resume and job text carries meaning for the model
+    return squeeze_lines(template).format(**values)
+
+
+def _resume_json(resume: Resume, trim: bool = True) -> str:
+    """Minified resume JSON, trimmed to the resume token budget if ``trim``.
+
+    Pass ``trim=False`` when the model must return the whole resume, since
+    anything trimmed from the prompt would be missing from its answer.
+    """
+    data = resume.model_dump(mode="json")
+    if not trim:
+        return minify_json(data)
+    return fit_json(data, settings.ai_resume_token_budget, RESUME_TRIM_ORDER)
+
+
+def _job_description_text(description: str) -> str:
+    return truncate_text(description, settings.ai_job_description_token_budget)
+
+
+def _job_description_block(job_description: JobDescription) -> str:
+    return _render(
+        """Title: {title}
+        Company: {company}
+        Description: {description}
+        Requirements: {requirements}""",
+        title=job_description.title,
+        company=job_description.company,
+        description=_job_description_text(job_description.description),
+        requirements=', '.join(job_description.requirements),
+    )
+
+
+PARSE_RESUME_SYSTEM_PROMPT = (
+    "You are a resume parsing expert. Extract structured information from resumes "
+    "and return valid JSON. Pay special attention to the pre-processed hints "
+    "provided, but verify all information against the original text."
+)
+
+
+def build_parse_hints(pre_processed_hints: Optional[Dict[str, Any]]) -> str:
+    """Render ``FileParser.pre_process_resume`` output as prompt hints."""
+    if not pre_processed_hints:
+        return ""
+
+    hints_text = "\nPre-processed information to help with parsing:\n"
+
+    # Add detected sections
+    if pre_processed_hints.get("detected_sections"):
+        hints_text += f"Detected sections: {', '.join(pre_processed_hints['detected_sections'])}\n"
+
+    # Add extracted contact info
+    if "email" in pre_processed_hints:
+        hints_text += f"Detected email: {pre_processed_hints['email']}\n"
+    if "phone" in pre_processed_hints:
+        hints_text += f"Detected phone: {pre_processed_hints['phone']}\n"
+    if "name" in pre_processed_hints:
+        hints_text += f"Detected name: {pre_processed_hints['name']}\n"
+
+    # Add section content hints
+    if "sections" in pre_processed_hints:
+        for section_name, content in pre_processed_hints["sections"].items():
+            # Only include a preview of each section to keep prompt size reasonable
+            content_preview = content[:200] + "..." if len(content) > 200 else content
+            hints_text += f"\nDetected {section_name} section content preview:\n{content_preview}\n"
+
+    return hints_text
+
+
+def build_parse_resume_messages(
+    resume_text: str, pre_processed_hints: Optional[Dict[str, Any]] = None
+) -> Messages:
+    resume_text = truncate_text(resume_text, settings.ai_resume_text_token_budget)
+    hints_text = build_parse_hints(dedupe_hints(pre_processed_hints, resume_text))
+    prompt = _render(
+        """
+        Parse the following resume text and extract structured information. Return a JSON object with the following structure:
+        {{
+            "personal_info": {{
+                "full_name": "",
+                "email": "",
+                "phone": "",
+                "location": "",
+                "linkedin": "",
+                "github": "",
+                "website": ""
+            }},
+            "professional_summary": "",
+            "skills": [],
+            "experience": [
+                {{
+                    "company": "",
+                    "position": "",
+                    "start_date": "YYYY-MM-DD or null",
+                    "end_date": "YYYY-MM-DD or null",
+                    "description": [],
+                    "is_current": false
+                }}
+            ],
+            "education": [
+                {{
+                    "institution": "",
+                    "degree": "",
+                    "field_of_study": "",
+                    "start_date": "YYYY-MM-DD or null",
+                    "end_date": "YYYY-MM-DD or null",
+                    "gpa": ""
+                }}
+            ],
+            "projects": [
+                {{
+                    "name": "",
+                    "description": "",
+                    "technologies": [],
+                    "url": ""
+                }}
+            ],
+            "certifications": [
+                {{
+                    "name": "",
+                    "issuing_organization": "",
+                    "issue_date": "YYYY-MM-DD or null",
+                    "expiration_date": "YYYY-MM-DD or null",
+                    "credential_id": ""
+                }}
+            ]
+        }}
+
+        Resume text:
+        {resume_text}
+        {hints_text}
+
+        Return only valid JSON without any additional text or formatting.
+        """,
+        resume_text=resume_text,
+        hints_text=hints_text,
+    )
+    return _messages(PARSE_RESUME_SYSTEM_PROMPT, prompt)
+
+
+def build_optimize_resume_messages(resume: Resume, job_description: JobDescription) -> Messages:
+    prompt = _render(
+        """
+        Optimize the following resume for this job description. Focus on:
+        1. Tailoring the professional summary to match the role
+        2. Highlighting relevant skills and experience
+        3. Rewriting experience descriptions to emphasize relevant achievements
+        4. Suggesting relevant keywords from the job description
+
+        Job Description:
+        {job_description}
+
+        Current Resume:
+        {resume}
+
+        Return the optimized resume in the same JSON format. Keep all existing information but enhance it for this specific role.
+        """,
+        job_description=_job_description_block(job_description),
+        resume=_resume_json(resume, trim=False),
+    )
+    return _messages(
+        "You are a professional resume writer. Optimize resumes to match job "
+        "descriptions while maintaining accuracy and professionalism.",
+        prompt,
+    )
+
+
+def build_generate_resume_messages(
+    job_description: JobDescription, user_background: Optional[str] = None
+) -> Messages:
+    background_context = f"User background: {user_background}" if user_background else "No specific background provided."
+    prompt = _render(
+        """
+        Create a resume template based on this job description and user background. Generate realistic but generic content that matches the role requirements.
+
+        Job Description:
+        {job_description}
+
+        {background_context}
+
+        Create a resume with:
+        1. Professional summary tailored to the role
+        2. Relevant skills extracted from job requirements
+        3. 2-3 sample work experiences that would be relevant
+        4. Sample education background
+        5. 1-2 relevant projects
+
+        Return in this JSON format:
+        {{
+            "personal_info": {{
+                "full_name": "[Your Name]",
+                "email": "[Your Email]",
+                "phone": "[Your Phone]",
+                "location": "[Your Location]",
+                "linkedin": "[LinkedIn URL]",
+                "github": "[GitHub URL]",
+                "website": "[Website URL]"
+            }},
+            "professional_summary": "",
+            "skills": [],
+            "experience": [],
+            "education": [],
+            "projects": [],
+            "certifications": []
+        }}
+        """,
+        job_description=_job_description_block(job_description),
+        background_context=background_context,
+    )
+    return _messages(
+        "You are a professional resume writer. Create resume templates that match job requirements.",
+        prompt,
+    )
+
+
+def build_cover_letter_messages(resume: Resume, job_description: JobDescription) -> Messages:
+    prompt = _render(
+        """
+        Generate a professional cover letter based on the following resume and job description.
+
+        The cover letter should be:
+        - Tailored to the specific job description.
+        - Highlight the most relevant skills and experiences from the resume.
+        - Written in a professional and engaging tone.
+        - Formatted as a standard cover letter with a clear introduction, body, and conclusion.
+
+        Job Description:
+        {job_description}
+
+        Resume:
+        {resume}
+
+        Return only the cover letter text.
+        """,
+        job_description=_job_description_block(job_description),
+        resume=_resume_json(resume),
+    )
+    return _messages(
+        "You are a professional career coach and expert cover letter writer.",
+        prompt,
+    )
+
+
+def build_score_resume_messages(resume: Resume, job_description: Optional[str] = None) -> Messages:
+    job_context = ""
+    if job_description:
+        job_context = _render(
+            """
+            Job Description Context:
+            {job_description}
+
+            Please evaluate how well this resume matches the job requirements.
+            """,
+            job_description=_job_description_text(job_description),
+        )
+
+    prompt = _render(
+        """
+        Analyze the following resume and provide a comprehensive score and feedback.
+
+        {job_context}
+
+        Resume:
+        {resume}
+
+        Please provide a detailed analysis including:
+        1. Overall score (0-100)
+        2. Strengths and positive aspects
+        3. Areas for improvement
+        4. Specific suggestions for enhancement
+
+        Return a JSON object with the following structure:
+        {{
+            "score": 85,
+            "feedback": [
+                "Strong technical skills section",
+                "Clear and concise professional summary",
+                "Good use of action verbs in experience descriptions"
+            ],
+            "suggestions": [
+                "Add more quantifiable achievements",
+                "Include relevant certifications",
+                "Consider adding a projects section"
+            ]
+        }}
+        """,
+        job_context=job_context,
+        resume=_resume_json(resume),
+    )
+    return _messages(
+        "You are a professional resume reviewer and career coach with expertise in "
+        "evaluating resumes for various industries and positions.",
+        prompt,
+    )
+
+
+def build_batch_score_messages(resume: Resume, job_descriptions: Sequence[str]) -> Messages:
+    """Score one resume against several job descriptions in a single call."""
+    jobs_text = "\n\n".join(
+        f"Job {i}:\n{_job_description_text(job_description)}"
+        for i, job_description in enumerate(job_descriptions)
+    )
+    prompt = _render(
+        """
+        Analyze the following resume against each of the job descriptions below and provide a score and feedback for each one.
+
+        Resume:
+        {resume}
+
+        {jobs_text}
+
+        For each job, evaluate how well this resume matches the job requirements, including:
+        1. Overall score (0-100)
+        2. Strengths and positive aspects
+        3. Areas for improvement
+        4. Specific suggestions for enhancement
+
+        Return a JSON object with one entry per job, using the job number as "job":
+        {{
+            "results": [
+                {{
+                    "job": 0,
+                    "score": 85,
+                    "feedback": ["Strong technical skills section"],
+                    "suggestions": ["Add more quantifiable achievements"]
+                }}
+            ]
+        }}
+        """,
+        resume=_resume_json(resume),
+        jobs_text=jobs_text,
+    )
+    return _messages(
+        "You are a professional resume reviewer and career coach with expertise in "
+        "evaluating resumes for various industries and positions.",
+        prompt,
+    )
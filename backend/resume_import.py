@@ -0,0 +1,101 @@
+"""
+Resume import pipeline: text extraction, pre-processing, AI parsing and save.
+
+Uploads run through the ``parse_resume`` job handler on the background job
+queue, so requests never wait for extraction or the AI call.
+"""
+import base64
+import logging
+from typing import Any, Dict
+
+from core.config import settings
+from database import Resume as ResumeDocument
+from db_service import ResumeService
+from file_parser import file_parser
+from models import Resume
+from openai_service import openai_service
+from utils.job_queue import JobError, job_queue
+from utils.upload_cache import content_digest, upload_cache
+
+logger = logging.getLogger(__name__)
+
+PARSE_RESUME_JOB = "parse_resume"
+
+
+class ResumeImportError(ValueError):
+    """The uploaded file could not be turned into a resume."""
+
+
+async def import_resume_file(user_id: str, filename: str, file_content: bytes) -> ResumeDocument:
+    """Extract, parse and save an uploaded resume file for ``user_id``.
+
+    Stages already run for identical file bytes are served from the upload cache.
+    """
+    structured_resume = await parse_resume_file(filename, file_content)
+
+    return await ResumeService.create_resume(
+        user_id=user_id,
+        title=f"Resume from {filename}",
+        resume_data=structured_resume
+    )
+
+
+async def parse_resume_file(filename: str, file_content: bytes) -> Resume:
+    """Turn an uploaded file into a structured resume without saving it."""
+    digest = content_digest(file_content)
+    fingerprint = openai_service.cache_fingerprint
+
+    cached_resume = await upload_cache.get(digest, "parse", variant=fingerprint)
+    if cached_resume is not None:
+        return Resume(**cached_resume)
+
+    extracted = await upload_cache.get(digest, "extract")
+    if extracted is not None:
+        resume_text, pre_processed_data = extracted["text"], extracted["hints"]
+    else:
+        resume_text = await file_parser.parse_file_async(filename, file_content)
+        if not resume_text:
+            raise ResumeImportError("Failed to parse the uploaded file")
+        pre_processed_data = file_parser.pre_process_resume(resume_text)
+        await upload_cache.set(digest, "extract", {"text": resume_text, "hints": pre_processed_data})
+
+    structured_resume = await openai_service.parse_resume(
+        resume_text,
+        pre_processed_hints=pre_processed_data
+    )
+    # An empty resume is the fallback after an AI error; don't pin it to the file
+    if structured_resume != Resume():
+        await upload_cache.set(digest, "parse", structured_resume, variant=fingerprint)
+    return structured_resume
+
+
+async def build_parse_resume_payload(user_id: str, filename: str, file_content: bytes) -> Dict[str, Any]:
+    """Job payload for ``parse_resume``.
+
+    The file is stored in the upload cache and the payload refers to it by
+    digest. Without Redis the in-memory queue keeps the payload in this
+    process, so the bytes are inlined (base64 encoded for JSON) instead.
+    """
+    digest = content_digest(file_content)
+    payload = {"user_id": user_id, "filename": filename, "digest": digest}
+    if not await upload_cache.put_file(digest, file_content, ttl=settings.job_ttl):
+        payload["content"] = base64.b64encode(file_content).decode("ascii")
+    return payload
+
+
+@job_queue.register(PARSE_RESUME_JOB)
+async def parse_resume_job(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Job handler: run the import pipeline and return the new resume id."""
+    if payload.get("content"):
+        file_content = base64.b64decode(payload["content"])
+    else:
+        file_content = await upload_cache.get_file(payload["digest"])
+        if file_content is None:
+            raise JobError("The uploaded file expired before it was processed, please upload it again", "UPLOAD_EXPIRED")
+
+    try:
+        resume = await import_resume_file(payload["user_id"], payload["filename"], file_content)
+    except ResumeImportError as e:
+        raise JobError(str(e), "UNREADABLE_FILE") from e
+    logger.info(f"Imported resume {resume.id} from {payload['filename']}")
+    return {"resume_id": str(resume.id)}
@@ -0,0 +1,210 @@
+"""
+Local, deterministic resume scoring.
+
+Computes the checks the LLM scorer was mostly asked for - section
+completeness, bullet quality (length, quantified results, action verbs)
+and keyword / term-vector match against a job description - in-process,
+so the scoring widget gets a score instantly. The LLM is only needed for
+narrative feedback.
+"""
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from models import Resume
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.\-]*[a-z0-9+#]|[a-z0-9]")
+_QUANTIFIED_RE = re.compile(r"\d|%|\$|€|£")
+
+STOPWORDS = frozenset("""
+    a about above across after all also an and any are as at be been being both but by can
+    could do does each either etc for from has have having he her here his how i if in into
+    is it its just least like may more most must no not of on one or other our out over own
+    per please plus should so some such than that the their them then there these they this
+    those through to too under up upon us using via was we well were what when where which
+    while who whom why will with within without would you your
+    ability able candidate candidates company experience job join looking position preferred
+    required requirements responsibilities role skills strong team work working years year
+""".split())
+
+ACTION_VERBS = frozenset("""
+    accelerated achieved administered analyzed architected automated built championed coached
+    collaborated created cut decreased defined delivered designed developed directed drove
+    eliminated enabled engineered established expanded generated grew guided implemented
+    improved increased initiated introduced launched led maintained managed mentored migrated
+    modernized negotiated optimized orchestrated organized owned partnered pioneered planned
+    produced reduced refactored resolved restructured scaled shipped simplified spearheaded
+    streamlined supervised trained transformed upgraded
+""".split())
+
+# Bullets outside this word range read as too terse or too dense
+BULLET_WORDS_MIN = 8
+BULLET_WORDS_MAX = 30
+
+# Maximum points per component; the keyword component only applies when a
+# job description is given, otherwise the rest is scaled to 100
+WEIGHTS = {
+    "completeness": 25,
+    "bullet_length": 10,
+    "quantified": 15,
+    "action_verbs": 10,
+    "keywords": 40,
+}
+
+MAX_KEYWORDS = 30
+
+
+def _tokens(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS and len(t) > 1]
+
+
+def _cosine(a: Counter, b: Counter) -> float:
+    if not a or not b:
+        return 0.0
+    dot = sum(count * b[term] for term, count in a.items() if term in b)
+    norm = math.sqrt(sum(c * c for c in a.values())) * math.sqrt(sum(c * c for c in b.values()))
+    return dot / norm if norm else 0.0
+
+
+class ResumeScorer:
+    """Rule- and term-vector-based resume scorer returning the LLM scorer's shape."""
+
+    @staticmethod
+    def resume_text(resume: Resume) -> str:
+        parts = [resume.professional_summary]
+        parts += [skill.name for skill in resume.skills]
+        for exp in resume.experience:
+            parts += [exp.position, exp.company, *exp.description]
+        for edu in resume.education:
+            parts += [edu.degree, edu.field_of_study or "", edu.institution]
+        for project in resume.projects:
+            parts += [project.name, project.description, *project.technologies]
+        parts += [cert.name for cert in resume.certifications]
+        return "\n".join(p for p in parts if p)
+
+    def _completeness(self, resume: Resume, feedback: List[str], suggestions: List[str]) -> float:
+        info = resume.personal_info
+        contact = {"name": info.full_name, "email": info.email, "phone": info.phone, "location": info.location}
+        missing = [field for field, value in contact.items() if not value.strip()]
+        summary_words = len(resume.professional_summary.split())
+
+        checks = [
+            1 - len(missing) / len(contact),
+            1.0 if 30 <= summary_words <= 120 else (0.5 if summary_words else 0.0),
+            min(len(resume.skills) / 5, 1.0),
+            1.0 if resume.experience else 0.0,
+            1.0 if resume.education else 0.0,
+        ]
+
+        if not missing:
+            feedback.append("Contact information is complete")
+        else:
+            suggestions.append(f"Add your {', '.join(missing)} to the contact section")
+        if not summary_words:
+            suggestions.append("Add a professional summary")
+        elif summary_words < 30:
+            suggestions.append("Expand your professional summary to 2-4 sentences")
+        elif summary_words > 120:
+            suggestions.append("Tighten your professional summary to under 120 words")
+        else:
+            feedback.append("Professional summary is a good length")
+        if len(resume.skills) < 5:
+            suggestions.append("List at least 5 relevant skills")
+        if not resume.experience:
+            suggestions.append("Add your work experience")
+        if not resume.education:
+            suggestions.append("Add your education")
+        return sum(checks) / len(checks)
+
+    def _bullets(self, resume: Resume, feedback: List[str], suggestions: List[str]) -> Tuple[float, float, float]:
+        bullets = [b.strip() for exp in resume.experience for b in exp.description if b and b.strip()]
+        if not bullets:
+            if resume.experience:
+                suggestions.append("Describe your achievements in each role with bullet points")
+            return 0.0, 0.0, 0.0
+
+        well_sized = sum(1 for b in bullets if BULLET_WORDS_MIN <= len(b.split()) <= BULLET_WORDS_MAX)
+        quantified = sum(1 for b in bullets if _QUANTIFIED_RE.search(b))
+        action = sum(1 for b in bullets if b.lstrip("•-* ").split(" ", 1)[0].lower().strip(",.") in ACTION_VERBS)
+
+        length_ratio = well_sized / len(bullets)
+        # Around 40% quantified bullets counts as full marks
+        quantified_ratio = min(quantified / len(bullets) / 0.4, 1.0)
+        action_ratio = action / len(bullets)
+
+        if length_ratio >= 0.8:
+            feedback.append("Experience bullets are concise and well sized")
+        else:
+            suggestions.append(
+                f"Keep experience bullets between {BULLET_WORDS_MIN} and {BULLET_WORDS_MAX} words "
+                f"({len(bullets) - well_sized} of {len(bullets)} are outside that range)"
+            )
+        if quantified_ratio >= 1.0:
+            feedback.append("Good use of quantified achievements")
+        else:
+            suggestions.append(
+                f"Add more quantifiable achievements (only {quantified} of {len(bullets)} bullets include numbers)"
+            )
+        if action_ratio >= 0.6:
+            feedback.append("Good use of action verbs in experience descriptions")
+        else:
+            suggestions.append("Start experience bullets with strong action verbs")
+        return length_ratio, quantified_ratio, action_ratio
+
+    def _keywords(
+        self, resume: Resume, job_description: str, feedback: List[str], suggestions: List[str]
+    ) -> Tuple[float, Dict[str, Any]]:
+        job_terms = Counter(_tokens(job_description))
+        resume_terms = Counter(_tokens(self.resume_text(resume)))
+        # Most frequent job terms, ties broken alphabetically for determinism
+        keywords = sorted(job_terms.items(), key=lambda item: (-item[1], item[0]))[:MAX_KEYWORDS]
+        total = sum(count for _, count in keywords)
+        matched = [term for term, _ in keywords if term in resume_terms]
+        missing = [term for term, _ in keywords if term not in resume_terms]
+
+        coverage = sum(job_terms[term] for term in matched) / total if total else 0.0
+        similarity = _cosine(job_terms, resume_terms)
+        # Coverage dominates; term-vector similarity rewards matching emphasis
+        score = 0.75 * coverage + 0.25 * min(similarity * 2, 1.0)
+
+        if coverage >= 0.6:
+            feedback.append("Resume covers most of the job description's key terms")
+        if missing:
+            suggestions.append(f"Consider addressing these job description keywords: {', '.join(missing[:8])}")
+        return score, {
+            "coverage": round(coverage, 3),
+            "similarity": round(similarity, 3),
+            "matched_keywords": matched,
+            "missing_keywords": missing,
+        }
+
+    def score(self, resume: Resume, job_description: Optional[str] = None) -> Dict[str, Any]:
+        """Score ``resume`` (0-100) with feedback, suggestions and a per-component breakdown."""
+        feedback: List[str] = []
+        suggestions: List[str] = []
+
+        components = {"completeness": self._completeness(resume, feedback, suggestions)}
+        components["bullet_length"], components["quantified"], components["action_verbs"] = self._bullets(
+            resume, feedback, suggestions
+        )
+        keyword_details: Dict[str, Any] = {}
+        if job_description and job_description.strip():
+            components["keywords"], keyword_details = self._keywords(resume, job_description, feedback, suggestions)
+
+        max_points = sum(WEIGHTS[name] for name in components)
+        score = round(sum(value * WEIGHTS[name] for name, value in components.items()) * 100 / max_points)
+
+        return {
+            "score": score,
+            "feedback": feedback,
+            "suggestions": suggestions,
+            "breakdown": {
+                **{name: round(value * 100) for name, value in components.items()},
+                **keyword_details,
+            },
+            "source": "local",
+        }
+
+
+resume_scorer = ResumeScorer()
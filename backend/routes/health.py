@@ -28,4 +28,27 @@ async def health_check():
             database="error",
             timestamp=datetime.utcnow(),
             error=str(e)
-        )
\ No newline at end of file
+        )
+
+
+@router.get("/health/ai")
+async def ai_health_check():
+    """Latency and error statistics the AI router uses to pick providers."""
+    from openai_service import openai_service
+    return {
+        "providers": openai_service.router.snapshot(),
+        "order": [provider.name for provider in openai_service.router.ranked()],
+        "timestamp": datetime.utcnow()
+    }
+
+@router.get("/health/cache")
+async def cache_health_check():
+    """Redis connectivity, in-process L1 and upload cache statistics."""
+    from utils.redis_cache import cache
+    from utils.upload_cache import upload_cache
+    return {
+        "redis": "connected" if cache.redis_client else "disconnected",
+        "local": cache.local.stats() if cache.local is not None else None,
+        "uploads": await upload_cache.stats(),
+        "timestamp": datetime.utcnow()
+    }
@@ -118,11 +118,10 @@ async def search_jobs_by_resume(
     """Search for jobs using skills from the authenticated user's resume"""
     try:
         # Get user's resume skills
-        resumes = await ResumeService.get_user_resumes(str(current_user.id), limit=1)
-        if not resumes:
+        resume = await ResumeService.get_latest_resume_skills(str(current_user.id))
+        if not resume:
             raise HTTPException(status_code=400, detail="No resume found for user")
         
-        resume = resumes[0]
         if not resume.skills:
             raise HTTPException(status_code=400, detail="No skills found in user's resume")
         
@@ -173,11 +172,10 @@ async def analyze_job_match(job_id: str, current_user: User = Depends(get_curren
     """Analyze how well a specific job matches the user's resume"""
     try:
         # Get user's resume skills
-        resumes = await ResumeService.get_user_resumes(str(current_user.id), limit=1)
-        if not resumes:
+        resume = await ResumeService.get_latest_resume_skills(str(current_user.id))
+        if not resume:
             raise HTTPException(status_code=400, detail="No resume found for user")
         
-        resume = resumes[0]
         if not resume.skills:
             raise HTTPException(status_code=400, detail="No skills found in user's resume")
         
@@ -2,20 +2,27 @@
 Resume management routes for the Resume Builder API.
 """
 from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Request
-from typing import List
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Dict, List
+import json
 import logging
 
-from schemas.requests import ResumeUpdateRequest, ResumeScoreRequest
-from models import GenerateResumeRequest, ParseResumeRequest, GenerateCoverLetterRequest
+from schemas.requests import ResumeUpdateRequest, ResumePatchRequest, ResumeScoreRequest, BatchScoreRequest
+from schemas.requests import BulkResumeImportRequest, BulkResumeIdsRequest, BulkTemplateRequest
+from models import GenerateResumeRequest, ParseResumeRequest, GenerateCoverLetterRequest, Resume
 from schemas.requests import OptimizeResumeRequest
-from schemas.responses import ResumeResponse, ResumeListResponse, ResumeListItem, ResumeVersionResponse, SuccessResponse, OptimizedResumeResponse
+from schemas.responses import ResumeResponse, ResumeListResponse, ResumeListItem, ResumeVersionResponse, SuccessResponse, OptimizedResumeResponse, JobStatusResponse
+from schemas.responses import BulkOperationResponse
 from database import User
+from core.exceptions import ResumeBuilderException
 from db_service import ResumeService
 from routes.auth import get_current_user
 from utils.rate_limiter import rate_limit_ip, rate_limit_user
 from utils.redis_cache import cache, cache_user_data
 from openai_service import openai_service
-from file_parser import file_parser
+from resume_scorer import resume_scorer
+from resume_import import PARSE_RESUME_JOB, build_parse_resume_payload
+from utils.job_queue import FAILED, SUCCEEDED, job_queue
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/resumes", tags=["resumes"])
@@ -66,7 +73,7 @@ async def get_user_resumes(
             return ResumeListResponse(**cached_result)
         
         # Fetch from database
-        resumes = await ResumeService.get_user_resumes(str(current_user.id), limit, offset)
+        resumes = await ResumeService.get_user_resume_summaries(str(current_user.id), limit, offset)
         total_count = await ResumeService.get_user_resume_count(str(current_user.id))
         
         # Calculate pagination info
@@ -103,6 +110,74 @@ async def get_user_resumes(
         logger.error(f"Error fetching resumes for user {current_user.id}: {e}")
         raise HTTPException(status_code=500, detail="Error fetching resumes")
 
+def _bulk_response(results: List[Dict[str, Any]]) -> BulkOperationResponse:
+    failed = sum(1 for result in results if result["status"] in ("failed", "not_found"))
+    return BulkOperationResponse(succeeded=len(results) - failed, failed=failed, results=results)
+
+@router.post("/bulk/import", response_model=BulkOperationResponse, dependencies=[Depends(rate_limit_user(30, 60))])
+async def bulk_import_resumes(
+    request: BulkResumeImportRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """Create many resumes at once; returns one result per resume, in order."""
+    try:
+        results = await ResumeService.bulk_create_resumes(
+            user_id=str(current_user.id),
+            items=[item.dict() for item in request.resumes]
+        )
+        await cache.clear_user_cache(str(current_user.id))
+        return _bulk_response(results)
+    except Exception as e:
+        logger.error(f"Error bulk importing resumes for user {current_user.id}: {e}")
+        raise HTTPException(status_code=500, detail="Error importing resumes")
+
+@router.post("/bulk/delete", response_model=BulkOperationResponse, dependencies=[Depends(rate_limit_user(30, 60))])
+async def bulk_delete_resumes(
+    request: BulkResumeIdsRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """Delete many resumes at once."""
+    try:
+        results = await ResumeService.bulk_delete_resumes(str(current_user.id), request.resume_ids)
+        await cache.clear_user_cache(str(current_user.id))
+        return _bulk_response(results)
+    except Exception as e:
+        logger.error(f"Error bulk deleting resumes for user {current_user.id}: {e}")
+        raise HTTPException(status_code=500, detail="Error deleting resumes")
+
+@router.post("/bulk/template", response_model=BulkOperationResponse, dependencies=[Depends(rate_limit_user(30, 60))])
+async def bulk_update_template(
+    request: BulkTemplateRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """Switch many resumes to a template at once."""
+    try:
+        results = await ResumeService.bulk_update_template(
+            user_id=str(current_user.id),
+            resume_ids=request.resume_ids,
+            template_id=request.template_id,
+            font_family=request.font_family,
+            accent_color=request.accent_color
+        )
+        await cache.clear_user_cache(str(current_user.id))
+        return _bulk_response(results)
+    except Exception as e:
+        logger.error(f"Error bulk updating templates for user {current_user.id}: {e}")
+        raise HTTPException(status_code=500, detail="Error updating resumes")
+
+@router.post("/bulk/export", response_model=BulkOperationResponse, dependencies=[Depends(rate_limit_user(30, 60))])
+async def bulk_export_resumes(
+    request: BulkResumeIdsRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """Full data of many resumes at once."""
+    try:
+        results = await ResumeService.bulk_export_resumes(str(current_user.id), request.resume_ids)
+        return _bulk_response(results)
+    except Exception as e:
+        logger.error(f"Error bulk exporting resumes for user {current_user.id}: {e}")
+        raise HTTPException(status_code=500, detail="Error exporting resumes")
+
 @router.get("/my-resume", response_model=ResumeResponse, dependencies=[Depends(rate_limit_user(300, 60))])
 async def get_my_resume(
     current_user: User = Depends(get_current_user)
@@ -154,6 +229,7 @@ async def get_my_resume(
             template_id=resume.template_id,
             font_family=resume.font_family,
             accent_color=resume.accent_color,
+            revision=resume.revision,
             created_at=resume.created_at,
             updated_at=resume.updated_at
         )
@@ -193,6 +269,7 @@ async def get_resume(
             template_id=resume.template_id,
             font_family=resume.font_family,
             accent_color=resume.accent_color,
+            revision=resume.revision,
             created_at=resume.created_at,
             updated_at=resume.updated_at
         )
@@ -211,16 +288,12 @@ async def update_my_resume(
     try:
         # Log the incoming data for debugging
         logger.info(f"Received resume update data: {resume_data.dict(exclude_unset=True)}")
-        resumes = await ResumeService.get_user_resumes(str(current_user.id), limit=1)
-        if not resumes:
-            raise HTTPException(status_code=404, detail="Resume not found")
-        
-        resume = resumes[0]
-        updated_resume = await ResumeService.update_resume(
-            resume_id=str(resume.id),
+        updated_resume = await ResumeService.update_latest_resume(
             user_id=str(current_user.id),
             updates=resume_data.dict(exclude_unset=True)
         )
+        if not updated_resume:
+            raise HTTPException(status_code=404, detail="Resume not found")
         
         # Clear user cache after update
         await cache.clear_user_cache(str(current_user.id))
@@ -239,6 +312,7 @@ async def update_my_resume(
             template_id=updated_resume.template_id,
             font_family=updated_resume.font_family,
             accent_color=updated_resume.accent_color,
+            revision=updated_resume.revision,
             created_at=updated_resume.created_at,
             updated_at=updated_resume.updated_at
         )
@@ -261,7 +335,8 @@ async def update_resume(
         resume = await ResumeService.update_resume(
             resume_id=resume_id,
             user_id=str(current_user.id),
-            updates=updates.dict(exclude_unset=True)
+            updates=updates.dict(exclude_unset=True),
+            expected_revision=updates.revision
         )
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
@@ -271,14 +346,46 @@ async def update_resume(
         
         return SuccessResponse(
             message="Resume updated successfully",
-            data={"updated_at": resume.updated_at}
+            data={"updated_at": resume.updated_at, "revision": resume.revision}
         )
-    except HTTPException:
+    except (HTTPException, ResumeBuilderException):
         raise
     except Exception as e:
         logger.error(f"Error updating resume {resume_id}: {e}")
         raise HTTPException(status_code=500, detail="Error updating resume")
 
+@router.patch("/{resume_id}", response_model=ResumeResponse)
+async def patch_resume(
+    resume_id: str,
+    patch: ResumePatchRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """Apply field-level changes to a resume.
+    
+    Each operation sets a field or array item, or pushes to / pulls from
+    an array, so concurrent edits to different sections don't overwrite
+    each other. Send ``revision`` to get a 409 if the resume has changed.
+    """
+    try:
+        resume = await ResumeService.patch_resume(
+            resume_id=resume_id,
+            user_id=str(current_user.id),
+            operations=[operation.dict() for operation in patch.operations],
+            expected_revision=patch.revision
+        )
+        if not resume:
+            raise HTTPException(status_code=404, detail="Resume not found")
+        
+        # Clear user cache after update
+        await cache.clear_user_cache(str(current_user.id))
+        
+        return _resume_response(resume)
+    except (HTTPException, ResumeBuilderException):
+        raise
+    except Exception as e:
+        logger.error(f"Error patching resume {resume_id}: {e}")
+        raise HTTPException(status_code=500, detail="Error updating resume")
+
 @router.delete("/{resume_id}", response_model=SuccessResponse)
 async def delete_resume(
     resume_id: str,
@@ -363,114 +470,195 @@ async def restore_resume_version(
 # AI-powered routes
 ai_router = APIRouter(prefix="/ai", tags=["ai"])
 
-@ai_router.post("/parse-and-save-resume", response_model=ResumeResponse, dependencies=[Depends(rate_limit_user(30, 60))])
+def _validate_upload(filename: str, file_content: bytes) -> None:
+    """Server-side file validation for resume uploads."""
+    filename_lower = (filename or '').lower()
+    if not (filename_lower.endswith('.pdf') or filename_lower.endswith('.docx') or filename_lower.endswith('.txt')):
+        raise HTTPException(status_code=400, detail="Unsupported file type. Use PDF, DOCX, or TXT.")
+    if len(file_content) > 10 * 1024 * 1024:
+        raise HTTPException(status_code=400, detail="File too large. Max size is 10MB.")
+
+
+def _resume_response(resume) -> ResumeResponse:
+    return ResumeResponse(
+        id=str(resume.id),
+        title=resume.title,
+        is_default=resume.is_default,
+        personal_info=resume.personal_info.dict(),
+        professional_summary=resume.professional_summary,
+        skills=resume.skills,
+        experience=[exp.dict() for exp in resume.experience],
+        education=[edu.dict() for edu in resume.education],
+        projects=[proj.dict() for proj in resume.projects],
+        certifications=[cert.dict() for cert in resume.certifications],
+        template_id=resume.template_id,
+        font_family=resume.font_family,
+        accent_color=resume.accent_color,
+        revision=resume.revision,
+        created_at=resume.created_at,
+        updated_at=resume.updated_at
+    )
+
+
+def _job_status_response(job: Dict[str, Any]) -> JobStatusResponse:
+    return JobStatusResponse(
+        job_id=job["id"],
+        job_type=job["type"],
+        status=job["status"],
+        result=job.get("result"),
+        error=job.get("error"),
+        error_code=job.get("error_code"),
+        created_at=job["created_at"],
+        updated_at=job["updated_at"]
+    )
+
+
+async def _get_user_job(job_id: str, current_user: User) -> Dict[str, Any]:
+    job = await job_queue.get(job_id)
+    if not job or job.get("owner_id") != str(current_user.id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+async def _queue_parse_resume(file: UploadFile, current_user: User) -> JobStatusResponse:
+    if not current_user or not getattr(current_user, "id", None):
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    file_content = await file.read()
+    _validate_upload(file.filename, file_content)
+
+    try:
+        payload = await build_parse_resume_payload(str(current_user.id), file.filename, file_content)
+        job = await job_queue.submit(PARSE_RESUME_JOB, payload, owner_id=str(current_user.id))
+    except Exception as e:
+        logger.error(f"Error queueing resume file {file.filename}: {e}")
+        raise HTTPException(status_code=503, detail="Resume parsing queue unavailable")
+    return _job_status_response(job)
+
+
+@ai_router.post("/parse-resume-jobs", response_model=JobStatusResponse, status_code=202, dependencies=[Depends(rate_limit_user(30, 60))])
+async def submit_parse_resume_job(
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user)
+):
+    """Queue the uploaded resume for background parsing and return the job id.
+
+    Poll ``/ai/jobs/{job_id}`` for progress and fetch the saved resume from
+    ``/ai/jobs/{job_id}/result`` once the job has succeeded.
+    """
+    return await _queue_parse_resume(file, current_user)
+
+
+@ai_router.post(
+    "/parse-and-save-resume",
+    response_model=JobStatusResponse,
+    status_code=202,
+    deprecated=True,
+    dependencies=[Depends(rate_limit_user(30, 60))]
+)
 async def parse_and_save_resume(
-    file: UploadFile = File(...), 
+    file: UploadFile = File(...),
     current_user: User = Depends(get_current_user)
 ):
-    """Parse, and save the uploaded resume file using AI."""
-    # Ensure current_user is not None (authentication check)
-    if not current_user or not getattr(current_user, "id", None):
-        raise HTTPException(status_code=401, detail="Not authenticated")
+    """Same as ``/ai/parse-resume-jobs``; parsing no longer runs inside the request."""
+    return await _queue_parse_resume(file, current_user)
+
+
+@ai_router.get("/jobs/{job_id}", response_model=JobStatusResponse, dependencies=[Depends(rate_limit_user(600, 60))])
+async def get_job_status(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Get the status of a background job."""
+    return _job_status_response(await _get_user_job(job_id, current_user))
+
+
+@ai_router.get("/jobs/{job_id}/result", response_model=ResumeResponse, dependencies=[Depends(rate_limit_user(600, 60))])
+async def get_parse_resume_job_result(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Get the resume saved by a finished parse job."""
+    job = await _get_user_job(job_id, current_user)
+    if job["status"] == FAILED:
+        raise HTTPException(status_code=422, detail=job.get("error") or "Resume parsing failed")
+    if job["status"] != SUCCEEDED:
+        raise HTTPException(status_code=409, detail=f"Job is {job['status']}")
+
+    resume = await ResumeService.get_resume_by_id(job["result"]["resume_id"], str(current_user.id))
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    return _resume_response(resume)
+
 
+def _resume_model_from_request(resume_data: Dict[str, Any]) -> Resume:
+    """Build a ``models.Resume`` from builder data, raising 422 if invalid."""
+    # Pre-process the resume data to handle skills conversion
+    resume_data = resume_data.copy()
+    
+    # Convert skills from strings to Skill objects
+    if 'skills' in resume_data and isinstance(resume_data['skills'], list):
+        processed_skills = []
+        for skill_item in resume_data['skills']:
+            if isinstance(skill_item, str) and skill_item and skill_item.strip():
+                processed_skills.append({
+                    'name': skill_item,
+                    'category_id': 'technical',
+                    'category': 'Technical Skills',
+                    'level': 'intermediate'
+                })
+            elif isinstance(skill_item, dict) and skill_item and skill_item.get('name'):
+                processed_skills.append(skill_item)
+        
+        resume_data['skills'] = processed_skills
+    
+    # Handle empty date strings in experience and education
+    if 'experience' in resume_data and isinstance(resume_data['experience'], list):
+        for exp in resume_data['experience']:
+            if isinstance(exp, dict):
+                if exp.get('start_date') == '':
+                    exp['start_date'] = None
+                if exp.get('end_date') == '':
+                    exp['end_date'] = None
+    
+    if 'education' in resume_data and isinstance(resume_data['education'], list):
+        for edu in resume_data['education']:
+            if isinstance(edu, dict):
+                if edu.get('start_date') == '':
+                    edu['start_date'] = None
+                if edu.get('end_date') == '':
+                    edu['end_date'] = None
+    
     try:
-        file_content = await file.read()
-        # Server-side file validation
-        filename_lower = (file.filename or '').lower()
-        if not (filename_lower.endswith('.pdf') or filename_lower.endswith('.docx') or filename_lower.endswith('.txt')):
-            raise HTTPException(status_code=400, detail="Unsupported file type. Use PDF, DOCX, or TXT.")
-        if len(file_content) > 10 * 1024 * 1024:
-            raise HTTPException(status_code=400, detail="File too large. Max size is 10MB.")
-
-        resume_text = file_parser.parse_file(file.filename, file_content)
-
-        if not resume_text:
-            raise HTTPException(status_code=400, detail="Failed to parse the uploaded file")
-
-        pre_processed_data = file_parser.pre_process_resume(resume_text)
-        structured_resume = await openai_service.parse_resume(
-            resume_text,
-            pre_processed_hints=pre_processed_data
-        )
+        return Resume(**resume_data)
+    except Exception as validation_error:
+        logger.error(f"Resume validation error: {validation_error}")
+        raise HTTPException(status_code=422, detail=f"Invalid resume data: {str(validation_error)}")
 
-        resume = await ResumeService.create_resume(
-            user_id=str(current_user.id),
-            title=f"Resume from {file.filename}",
-            resume_data=structured_resume
-        )
 
-        return ResumeResponse(
-            id=str(resume.id),
-            title=resume.title,
-            is_default=resume.is_default,
-            personal_info=resume.personal_info.dict(),
-            professional_summary=resume.professional_summary,
-            skills=resume.skills,
-            experience=[exp.dict() for exp in resume.experience],
-            education=[edu.dict() for edu in resume.education],
-            projects=[proj.dict() for proj in resume.projects],
-            certifications=[cert.dict() for cert in resume.certifications],
-            template_id=resume.template_id,
-            font_family=resume.font_family,
-            accent_color=resume.accent_color,
-            created_at=resume.created_at,
-            updated_at=resume.updated_at
-        )
-    except HTTPException:
-        raise
+def _sse_event(event: str, data: Any) -> str:
+    """Format one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def _sse_stream(events: AsyncIterator[Dict[str, Any]], operation: str) -> AsyncIterator[str]:
+    """Forward service events as SSE, reporting failures as an ``error`` event."""
+    try:
+        async for event in events:
+            yield _sse_event(event["event"], event["data"])
     except Exception as e:
-        logger.error(f"Error parsing resume file {file.filename}: {e}")
-        raise HTTPException(status_code=500, detail="Error parsing resume")
+        logger.error(f"Error streaming {operation}: {e}")
+        yield _sse_event("error", {"detail": f"Error {operation}"})
+
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
 
 
 @ai_router.post("/optimize-resume", response_model=OptimizedResumeResponse, dependencies=[Depends(rate_limit_user(60, 60))])
 async def optimize_resume(request: OptimizeResumeRequest):
     """Optimize resume for specific job description using AI."""
     try:
-        # Convert dict to Resume model for the service
-        from models import Resume, Skill, SkillLevel
-        
-        # Pre-process the resume data to handle skills conversion
-        resume_data = request.resume.copy()
-        
-        # Convert skills from strings to Skill objects
-        if 'skills' in resume_data and isinstance(resume_data['skills'], list):
-            processed_skills = []
-            for skill_item in resume_data['skills']:
-                if isinstance(skill_item, str) and skill_item and skill_item.strip():
-                    processed_skills.append({
-                        'name': skill_item,
-                        'category_id': 'technical',
-                        'category': 'Technical Skills',
-                        'level': 'intermediate'
-                    })
-                elif isinstance(skill_item, dict) and skill_item and skill_item.get('name'):
-                    processed_skills.append(skill_item)
-            
-            resume_data['skills'] = processed_skills
-        
-        # Handle empty date strings in experience and education
-        if 'experience' in resume_data and isinstance(resume_data['experience'], list):
-            for exp in resume_data['experience']:
-                if isinstance(exp, dict):
-                    if exp.get('start_date') == '':
-                        exp['start_date'] = None
-                    if exp.get('end_date') == '':
-                        exp['end_date'] = None
-        
-        if 'education' in resume_data and isinstance(resume_data['education'], list):
-            for edu in resume_data['education']:
-                if isinstance(edu, dict):
-                    if edu.get('start_date') == '':
-                        edu['start_date'] = None
-                    if edu.get('end_date') == '':
-                        edu['end_date'] = None
-        
-        try:
-            resume_model = Resume(**resume_data)
-        except Exception as validation_error:
-            logger.error(f"Resume validation error: {validation_error}")
-            raise HTTPException(status_code=422, detail=f"Invalid resume data: {str(validation_error)}")
+        resume_model = _resume_model_from_request(request.resume)
         
         optimized_resume = await openai_service.optimize_resume_for_job(
             resume_model, request.job_description
@@ -517,6 +705,21 @@ async def optimize_resume(request: OptimizeResumeRequest):
         logger.error(f"Error optimizing resume: {e}")
         raise HTTPException(status_code=500, detail="Error optimizing resume")
 
+@ai_router.post("/optimize-resume/stream", dependencies=[Depends(rate_limit_user(60, 60))])
+async def optimize_resume_stream(request: OptimizeResumeRequest):
+    """Optimize a resume, streaming each section as Server-Sent Events.
+
+    Emits ``section`` events (``{"name", "value"}``) as the model completes
+    each top-level section, then ``done`` with the full validated resume.
+    """
+    resume_model = _resume_model_from_request(request.resume)
+    events = openai_service.stream_optimized_resume(resume_model, request.job_description)
+    return StreamingResponse(
+        _sse_stream(events, "optimizing resume"),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
 @ai_router.post("/generate-resume", response_model=ResumeResponse, dependencies=[Depends(rate_limit_user(60, 60))])
 async def generate_resume(request: GenerateResumeRequest):
     """Generate resume from job description and user background using AI."""
@@ -576,26 +779,46 @@ async def generate_cover_letter(request: GenerateCoverLetterRequest):
         logger.error(f"Error generating cover letter: {e}")
         raise HTTPException(status_code=500, detail="Error generating cover letter")
 
+@ai_router.post("/generate-cover-letter/stream", dependencies=[Depends(rate_limit_user(60, 60))])
+async def generate_cover_letter_stream(request: GenerateCoverLetterRequest):
+    """Generate a cover letter, streaming text as Server-Sent Events.
+
+    Emits ``delta`` events (``{"text"}``) as tokens arrive, then ``done``
+    with the complete cover letter.
+    """
+    events = openai_service.stream_cover_letter(request.resume, request.job_description)
+    return StreamingResponse(
+        _sse_stream(events, "generating cover letter"),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
 @router.post("/score", response_model=dict)
 async def score_resume(
     request: ResumeScoreRequest,
     current_user: User = Depends(get_current_user)
 ):
-    """Score a resume and provide feedback using AI."""
+    """Score a resume locally; AI feedback is added only when requested.
+
+    The local score is deterministic and instant. With
+    ``include_ai_feedback`` the AI's score, feedback and suggestions are
+    returned instead, with the local breakdown attached.
+    """
     try:
         # Convert dict to Resume model for the service
-        from models import Resume
         try:
             resume_model = Resume(**request.resume)
         except Exception as validation_error:
             logger.error(f"Resume validation error: {validation_error}")
             raise HTTPException(status_code=400, detail=f"Invalid resume data: {str(validation_error)}")
-        
-        # Use OpenAI service to analyze the resume
-        score_result = await openai_service.score_resume(
-            resume=resume_model,
-            job_description=request.job_description
-        )
+
+        score_result = resume_scorer.score(resume_model, request.job_description)
+        if request.include_ai_feedback:
+            ai_result = await openai_service.score_resume(
+                resume=resume_model,
+                job_description=request.job_description
+            )
+            score_result = {**ai_result, "breakdown": score_result["breakdown"], "source": "ai"}
         return score_result
     except HTTPException:
         raise
@@ -603,5 +826,34 @@ async def score_resume(
         logger.error(f"Error scoring resume: {e}")
         raise HTTPException(status_code=500, detail="Error scoring resume")
 
+@ai_router.post("/score-resume/batch", dependencies=[Depends(rate_limit_user(30, 60))])
+async def score_resume_batch(
+    request: BatchScoreRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """Score a resume against several job descriptions, streamed as Server-Sent Events.
+
+    Emits a ``result`` event (``index`` into ``job_descriptions``, ``result``,
+    ``cached``) per job description as soon as it is scored, then ``done``.
+    """
+    try:
+        resume_model = Resume(**request.resume)
+    except Exception as validation_error:
+        logger.error(f"Resume validation error: {validation_error}")
+        raise HTTPException(status_code=400, detail=f"Invalid resume data: {str(validation_error)}")
+
+    async def events():
+        count = 0
+        async for item in openai_service.score_resume_batch(resume_model, request.job_descriptions):
+            count += 1
+            yield {"event": "result", "data": item}
+        yield {"event": "done", "data": {"count": count}}
+
+    return StreamingResponse(
+        _sse_stream(events(), "scoring resume"),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
 # Include AI router in main resume router
 router.include_router(ai_router)
@@ -129,7 +129,7 @@ async def get_template_professions():
 async def clear_template_cache(current_user: User = Depends(get_current_user)):
     """Clear template cache (admin/debug endpoint)."""
     try:
-        await cache.clear_pattern("templates:*")
+        await cache.clear_namespace("templates")
         return SuccessResponse(message="Template cache cleared successfully")
     except Exception as e:
         logger.error(f"Error clearing template cache: {e}")
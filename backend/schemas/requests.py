@@ -2,7 +2,7 @@
 Request schemas for API endpoints.
 """
 from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 
 from utils.validators import validate_password
 
@@ -58,6 +58,46 @@ class ResumeUpdateRequest(BaseModel):
     template_id: Optional[str] = None
     font_family: Optional[str] = None
     accent_color: Optional[str] = None
+    revision: Optional[int] = Field(
+        None, ge=0, description="Reject the update if the resume is no longer at this revision (by-ID updates only)"
+    )
+
+
+class ResumePatchOperation(BaseModel):
+    """One field-level change to a resume."""
+    op: Literal["set", "push", "pull"]
+    path: str = Field(..., min_length=1, description="Dotted field path, e.g. experience.2.position")
+    value: Any = None
+    position: Optional[int] = Field(None, description="push only: insert at this index instead of appending")
+
+
+class ResumePatchRequest(BaseModel):
+    """Patch resume request model."""
+    operations: List[ResumePatchOperation] = Field(..., min_length=1, max_length=100)
+    revision: Optional[int] = Field(None, ge=0, description="Reject the patch if the resume is no longer at this revision")
+
+
+class BulkResumeImportItem(BaseModel):
+    """One resume in a bulk import."""
+    title: str = Field("My Resume", min_length=1, max_length=255)
+    resume_data: Dict[str, Any] = Field(default_factory=dict)
+
+
+class BulkResumeImportRequest(BaseModel):
+    """Bulk resume import request model."""
+    resumes: List[BulkResumeImportItem] = Field(..., min_length=1, max_length=1000)
+
+
+class BulkResumeIdsRequest(BaseModel):
+    """Request model for bulk operations on existing resumes."""
+    resume_ids: List[str] = Field(..., min_length=1, max_length=1000)
+
+
+class BulkTemplateRequest(BulkResumeIdsRequest):
+    """Bulk template change request model."""
+    template_id: str = Field(..., min_length=1)
+    font_family: Optional[str] = None
+    accent_color: Optional[str] = None
 
 
 class JobDescription(BaseModel):
@@ -91,6 +131,13 @@ class ResumeScoreRequest(BaseModel):
     """Resume scoring request model."""
     resume: Dict[str, Any]
     job_description: Optional[str] = None
+    include_ai_feedback: bool = Field(False, description="Also request narrative feedback from the AI")
+
+
+class BatchScoreRequest(BaseModel):
+    """Score one resume against several job descriptions."""
+    resume: Dict[str, Any]
+    job_descriptions: List[str] = Field(..., min_length=1, max_length=50)
 
 
 class JobSearchRequest(BaseModel):
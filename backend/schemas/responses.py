@@ -77,6 +77,35 @@ class ResumeResponse(BaseModel):
     template_id: str
     font_family: str
     accent_color: str
+    revision: int = 0
+    created_at: datetime
+    updated_at: datetime
+
+
+class BulkItemResult(BaseModel):
+    """Outcome of one item in a bulk operation."""
+    index: int
+    id: Optional[str] = None
+    status: str  # created, updated, deleted, exported, not_found, failed
+    error: Optional[str] = None
+    resume: Optional[Dict[str, Any]] = None  # exports only
+
+
+class BulkOperationResponse(BaseModel):
+    """Bulk operation response model, with one result per requested item."""
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
+
+
+class JobStatusResponse(BaseModel):
+    """Background job status response model."""
+    job_id: str
+    job_type: str
+    status: str  # queued, running, succeeded, failed
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    error_code: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
@@ -40,6 +40,7 @@ async def setup_database():
         logger.info("  - users (for user accounts)")
         logger.info("  - resumes (for resume data)")
         logger.info("  - resume_versions (for version history)")
+        logger.info("  - job_postings (for scraped job postings)")
         logger.info("")
         logger.info("Next steps:")
         logger.info("1. Make sure MongoDB is running")
@@ -0,0 +1,225 @@
+"""
+Skill vocabulary and batched skill matching.
+
+Skills are normalized (case, whitespace, aliases such as "JS" ->
+"JavaScript") and interned to integer ids, so each job's or resume's skill
+set is a bitset. Matching a resume against many jobs is then one AND +
+popcount per job, done as a single NumPy operation over a packed bitset
+matrix when NumPy is installed.
+"""
+import logging
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Alternate spellings -> canonical skill name (keys are normalized lowercase)
+SKILL_ALIASES: Dict[str, str] = {
+    "js": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "python3": "python",
+    "golang": "go",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "node js": "node.js",
+    "react.js": "react",
+    "reactjs": "react",
+    "vue": "vue.js",
+    "vuejs": "vue.js",
+    "angularjs": "angular",
+    "next": "next.js",
+    "nextjs": "next.js",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "mongo": "mongodb",
+    "k8s": "kubernetes",
+    "aws": "amazon web services",
+    "gcp": "google cloud",
+    "google cloud platform": "google cloud",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "dl": "deep learning",
+    "nlp": "natural language processing",
+    "cicd": "ci/cd",
+    "c sharp": "c#",
+    "csharp": "c#",
+    "cpp": "c++",
+    "dotnet": ".net",
+    ".net core": ".net",
+    "tf": "tensorflow",
+    "sklearn": "scikit-learn",
+    "scikit learn": "scikit-learn",
+    "ux": "ux design",
+    "ui": "ui design",
+}
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Below this many jobs the per-row Python path is faster than packing a matrix
+NUMPY_MIN_ROWS = 256
+
+
+def normalize_skill(name: str) -> str:
+    """Canonical key for a skill name."""
+    key = _WHITESPACE_RE.sub(" ", name.strip().lower())
+    return SKILL_ALIASES.get(key, key)
+
+
+class SkillVocabulary:
+    """Interns canonical skill names to dense integer ids."""
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+        self.names: List[str] = []  # id -> first display name seen
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def intern(self, name: str) -> int:
+        key = normalize_skill(name)
+        skill_id = self._ids.get(key)
+        if skill_id is None:
+            skill_id = self._ids[key] = len(self.names)
+            self.names.append(name.strip())
+        return skill_id
+
+    def lookup(self, name: str) -> Optional[int]:
+        return self._ids.get(normalize_skill(name))
+
+    def encode(self, skills: Iterable[str]) -> Tuple[int, int]:
+        """Intern ``skills`` and return ``(bitset, distinct count)``."""
+        bits = 0
+        for skill in skills:
+            if skill and skill.strip():
+                bits |= 1 << self.intern(skill)
+        return bits, _popcount(bits)
+
+    def encode_query(self, skills: Iterable[str]) -> Tuple[int, int]:
+        """Bitset of the known ``skills`` and the count of all distinct ones.
+
+        Skills nobody has posted yet can't match but still count toward the
+        total, without growing the vocabulary.
+        """
+        bits = 0
+        distinct = set()
+        for skill in skills:
+            if skill and skill.strip():
+                key = normalize_skill(skill)
+                distinct.add(key)
+                skill_id = self._ids.get(key)
+                if skill_id is not None:
+                    bits |= 1 << skill_id
+        return bits, len(distinct)
+
+
+def _popcount(bits: int) -> int:
+    try:
+        return bits.bit_count()
+    except AttributeError:  # Python < 3.10
+        return bin(bits).count("1")
+
+
+def match_score(matches: int, job_count: int, resume_count: int) -> float:
+    """Share of resume skills the job asks for, plus a bonus for broader jobs."""
+    if not resume_count:
+        return 0.0
+    score = matches / resume_count * 100
+    if job_count > resume_count:
+        score += min(10, (job_count - resume_count) * 2)
+    return min(100.0, max(0.0, score))
+
+
+class SkillMatrix:
+    """Skill bitsets of many jobs, scored against a resume in one batch.
+
+    Rows are appended as jobs arrive; the packed NumPy matrix is rebuilt
+    lazily on the next scoring call after a change.
+    """
+
+    def __init__(self, vocabulary: SkillVocabulary) -> None:
+        self.vocabulary = vocabulary
+        self.rows: List[int] = []
+        self.counts: List[int] = []
+        self._packed = None
+        self._packed_counts = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def append(self, skills: Iterable[str]) -> int:
+        """Add a job's skills and return its row index."""
+        bits, count = self.vocabulary.encode(skills)
+        self.rows.append(bits)
+        self.counts.append(count)
+        self._packed = None
+        return len(self.rows) - 1
+
+    def _matrix(self):
+        if self._packed is None:
+            words = max(1, -(-len(self.vocabulary) // 64))
+            width = words * 8
+            buffer = b"".join(bits.to_bytes(width, "little") for bits in self.rows)
+            self._packed = np.frombuffer(buffer, dtype="<u8").reshape(len(self.rows), words)
+            self._packed_counts = np.asarray(self.counts, dtype=np.int64)
+        return self._packed, self._packed_counts
+
+    def match_counts(self, query_bits: int) -> Sequence[int]:
+        """Number of skills each row shares with ``query_bits``."""
+        if np is None or len(self.rows) < NUMPY_MIN_ROWS:
+            return [_popcount(bits & query_bits) for bits in self.rows]
+
+        matrix, _ = self._matrix()
+        words = matrix.shape[1]
+        query = np.frombuffer(
+            (query_bits & ((1 << (words * 64)) - 1)).to_bytes(words * 8, "little"), dtype="<u8"
+        )
+        shared = matrix & query
+        if hasattr(np, "bitwise_count"):
+            return np.bitwise_count(shared).sum(axis=1)
+        return np.unpackbits(shared.view(np.uint8), axis=1).sum(axis=1)
+
+    def scores(self, resume_skills: Iterable[str]) -> List[float]:
+        """Match score (0-100) of every row against ``resume_skills``."""
+        if not self.rows:
+            return []
+        query_bits, resume_count = self.vocabulary.encode_query(resume_skills)
+        if not resume_count:
+            return [0.0] * len(self.rows)
+
+        matches = self.match_counts(query_bits)
+        if np is None or len(self.rows) < NUMPY_MIN_ROWS:
+            return [match_score(m, c, resume_count) for m, c in zip(matches, self.counts)]
+
+        _, counts = self._matrix()
+        scores = np.asarray(matches, dtype=np.float64) / resume_count * 100
+        scores += np.clip((counts - resume_count) * 2, 0, 10)
+        return np.clip(scores, 0, 100).tolist()
+
+
+class SkillMatcher:
+    """Shared vocabulary plus one-off and batched match scoring."""
+
+    def __init__(self) -> None:
+        self.vocabulary = SkillVocabulary()
+
+    def match_score(self, job_skills: Iterable[str], resume_skills: Iterable[str]) -> float:
+        job_bits, job_count = self.vocabulary.encode(job_skills)
+        resume_bits, resume_count = self.vocabulary.encode_query(resume_skills)
+        return match_score(_popcount(job_bits & resume_bits), job_count, resume_count)
+
+    def match_scores(self, jobs_skills: Iterable[Iterable[str]], resume_skills: Iterable[str]) -> List[float]:
+        """Scores for many jobs against one resume in a single batch."""
+        matrix = SkillMatrix(self.vocabulary)
+        for skills in jobs_skills:
+            matrix.append(skills)
+        return matrix.scores(resume_skills)
+
+
+skill_matcher = SkillMatcher()
@@ -0,0 +1,23 @@
+"""
+Shared test setup: make the backend modules importable and give settings
+the values they require without a real environment.
+"""
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+for name, value in {
+    "SECRET_KEY": "test-secret",
+    "MONGODB_URL": "mongodb://localhost:27017",
+    "DATABASE_NAME": "resume_builder_test",
+    "OPENAI_API_KEY": "test",
+    "OPEN_ROUTER_KEY": "test",
+    "GROQ_API_KEY": "",
+    "GEMINI_API_KEY": "",
+    "GOOGLE_CLIENT_ID": "test",
+    "GOOGLE_CLIENT_SECRET": "test",
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,27 @@
+"""
+Tests that AI cache keys don't depend on which providers are configured.
+"""
+from ai_provider import AIProvider, ProviderRouter
+from openai_service import OpenAIService
+from utils.redis_cache import build_cache_key
+
+
+class _Provider(AIProvider):
+    def __init__(self, name, model):
+        self.name = name
+        self.model = model
+
+    async def complete(self, messages, temperature, timeout=None):
+        return ""
+
+
+def test_adding_a_provider_keeps_cached_results():
+    one = OpenAIService(ProviderRouter([_Provider("openrouter", "gpt")]))
+    two = OpenAIService(ProviderRouter([_Provider("groq", "llama"), _Provider("openrouter", "gpt")]))
+
+    keys = [
+        build_cache_key(OpenAIService.score_resume, (service, {"skills": ["Python"]}), {}, "ai_response")
+        for service in (one, two)
+    ]
+
+    assert keys[0] == keys[1]
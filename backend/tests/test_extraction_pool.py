@@ -0,0 +1,51 @@
+"""
+Tests for ExtractionPool worker isolation.
+"""
+import asyncio
+import time
+
+import pytest
+
+from file_parser import ExtractionPool
+
+
+def _sleep_and_return(seconds: float, value: str) -> str:
+    time.sleep(seconds)
+    return value
+
+
+def test_timeout_leaves_concurrent_extraction_intact():
+    pool = ExtractionPool(max_workers=2, timeout=3.0, memory_limit_mb=0)
+
+    async def scenario():
+        # Warm both workers so process start-up doesn't count against the timeout
+        await asyncio.gather(
+            pool.run(_sleep_and_return, 0, "warm"), pool.run(_sleep_and_return, 0, "warm")
+        )
+        stuck = asyncio.create_task(pool.run(_sleep_and_return, 30, "stuck"))
+        await asyncio.sleep(1.5)
+        # Still running when the stuck worker is killed at the 3s timeout
+        healthy = asyncio.create_task(pool.run(_sleep_and_return, 2.5, "healthy"))
+        with pytest.raises(asyncio.TimeoutError):
+            await stuck
+        return await healthy
+
+    try:
+        assert asyncio.run(scenario()) == "healthy"
+    finally:
+        pool.shutdown()
+
+
+def test_worker_is_reused_after_success():
+    pool = ExtractionPool(max_workers=1, timeout=30.0, memory_limit_mb=0)
+
+    async def scenario():
+        first = await pool.run(_sleep_and_return, 0, "a")
+        executor = pool._idle[0]
+        second = await pool.run(_sleep_and_return, 0, "b")
+        return first, second, pool._idle == [executor]
+
+    try:
+        assert asyncio.run(scenario()) == ("a", "b", True)
+    finally:
+        pool.shutdown()
@@ -0,0 +1,112 @@
+"""
+Tests for the job posting index against a brute-force search.
+"""
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from job_index import JobIndex, parse_salary_range
+from job_scraper import JobPosting
+from skill_matcher import SkillVocabulary, match_score
+
+SKILLS = ["Python", "JavaScript", "React", "SQL", "AWS", "Docker", "Go", "Rust", "Java", "Kotlin"]
+JOB_TYPES = ["full-time", "part-time", "contract"]
+LEVELS = ["junior", "mid", "senior"]
+
+
+def _postings(count, seed=7):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    postings = []
+    for i in range(count):
+        low = rng.choice([40, 60, 80, 100, 120])
+        postings.append(JobPosting(
+            id=str(i),
+            title=f"Engineer {i}",
+            company=f"Company {i % 13}",
+            location="Remote",
+            description="",
+            requirements=[],
+            skills=rng.sample(SKILLS, rng.randint(0, 5)),
+            salary_range=rng.choice([None, f"${low}k - ${low + 20}k"]),
+            job_type=rng.choice(JOB_TYPES),
+            experience_level=rng.choice(LEVELS),
+            posted_date=start + timedelta(hours=i),
+            application_url="",
+            source=rng.choice(["Indeed", "LinkedIn"]),
+            remote=rng.random() < 0.5,
+        ))
+    return postings
+
+
+def _brute_force(postings, skills, filters, limit):
+    vocabulary = SkillVocabulary()
+    encoded = {job.id: vocabulary.encode(job.skills) for job in postings}
+    query_bits, resume_count = vocabulary.encode_query(skills)
+    matched, unmatched = [], []
+    for job in postings:
+        if any(
+            filters.get(facet) not in (None, "") and str(getattr(job, facet)).lower() != str(filters[facet]).lower()
+            for facet in ("job_type", "experience_level", "remote", "source")
+        ):
+            continue
+        if filters.get("min_salary") or filters.get("max_salary"):
+            salary = parse_salary_range(job.salary_range)
+            if salary is None:
+                continue
+            if filters.get("min_salary") and salary[0] < filters["min_salary"]:
+                continue
+            if filters.get("max_salary") and salary[0] > filters["max_salary"]:
+                continue
+        job_bits, job_count = encoded[job.id]
+        matches = bin(job_bits & query_bits).count("1")
+        if matches:
+            matched.append((match_score(matches, job_count, resume_count), job.posted_date, job.id))
+        else:
+            unmatched.append((0.0, job.posted_date, job.id))
+    matched.sort(reverse=True)
+    unmatched.sort(reverse=True)
+    return [(job_id, score) for score, _, job_id in (matched + unmatched)[:limit]]
+
+
+@pytest.mark.parametrize("skills", [
+    ["Python", "SQL"],
+    ["python", "Docker", "Rust", "Haskell"],
+    ["COBOL"],
+    [],
+    SKILLS,
+])
+@pytest.mark.parametrize("filters", [
+    {},
+    {"job_type": "contract"},
+    {"experience_level": "senior", "remote": True},
+    {"min_salary": 70000, "max_salary": 110000},
+])
+@pytest.mark.parametrize("limit", [1, 10, 500])
+def test_search_matches_brute_force(skills, filters, limit):
+    postings = _postings(300)
+    index = JobIndex(SkillVocabulary())
+    index.add(postings)
+
+    found = [(job.id, job.match_score) for job in index.search(skills, filters, limit=limit)]
+
+    assert found == _brute_force(postings, skills, filters, limit)
+
+
+def test_upserts_and_eviction_keep_the_index_consistent():
+    postings = _postings(120)
+    index = JobIndex(SkillVocabulary(), max_postings=80)
+    index.add(postings[:100])
+    index.remove(postings[50])
+    rescraped = [JobPosting(**{**vars(job), "skills": ["Rust"]}) for job in postings[60:70]]
+    index.add(rescraped + postings[100:])
+
+    # The oldest keys were evicted past max_postings; re-scraped ones moved to the back
+    rescraped_ids = {job.id for job in rescraped}
+    order = [job for job in postings[:100] if job.id != "50" and job.id not in rescraped_ids]
+    live = (order + rescraped + postings[100:])[-80:]
+
+    assert len(index) == 80
+    found = [(job.id, job.match_score) for job in index.search(["Rust", "Go"], limit=500)]
+    assert found == _brute_force(live, ["Rust", "Go"], {}, 500)
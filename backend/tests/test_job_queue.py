@@ -0,0 +1,149 @@
+"""
+Tests for the background job queue and crash recovery.
+"""
+import asyncio
+
+import pytest
+
+from utils.job_queue import (
+    FAILED,
+    JOB_FAILED,
+    QUEUED,
+    SUCCEEDED,
+    InMemoryJobBackend,
+    JobError,
+    JobQueue,
+    RedisJobBackend,
+)
+
+
+async def _wait_for_status(queue, job_id, status, timeout=5.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        record = await queue.get(job_id)
+        if record and record["status"] == status:
+            return record
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job_id} never reached {status}")
+
+
+def _queue():
+    queue = JobQueue(concurrency=2, poll_timeout=0.05)
+
+    @queue.register("double")
+    async def double(payload):
+        return payload["n"] * 2
+
+    @queue.register("explode")
+    async def explode(payload):
+        raise ValueError("provider said: invalid key sk-secret")
+
+    @queue.register("reject")
+    async def reject(payload):
+        raise JobError("That file is not a resume", "UNREADABLE_FILE")
+
+    return queue
+
+
+def test_jobs_succeed_and_fail_with_their_handler_outcome():
+    async def scenario():
+        queue = _queue()
+        await queue.start(InMemoryJobBackend())
+        try:
+            ok = await queue.submit("double", {"n": 21})
+            bad = await queue.submit("explode", {})
+            rejected = await queue.submit("reject", {})
+            ok_record = await _wait_for_status(queue, ok["id"], SUCCEEDED)
+            bad_record = await _wait_for_status(queue, bad["id"], FAILED)
+            rejected_record = await _wait_for_status(queue, rejected["id"], FAILED)
+        finally:
+            await queue.stop()
+        return ok_record, bad_record, rejected_record
+
+    ok_record, bad_record, rejected_record = asyncio.run(scenario())
+    assert ok_record["result"] == 42
+    assert ok_record["attempts"] == 1
+    # Unexpected errors are logged, not handed to the client
+    assert "sk-secret" not in bad_record["error"]
+    assert bad_record["error_code"] == JOB_FAILED
+    assert rejected_record["error"] == "That file is not a resume"
+    assert rejected_record["error_code"] == "UNREADABLE_FILE"
+
+
+def _redis():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+def test_jobs_of_a_dead_worker_are_requeued_then_failed():
+    async def scenario():
+        redis = _redis()
+        queue = _queue()
+        queue.backend = RedisJobBackend(redis)
+
+        # A process takes the job, marks it running, then dies without a heartbeat
+        record = await queue.submit("double", {"n": 1})
+        dead = queue.backend
+        assert await dead.dequeue(1) == record["id"]
+        await queue._update(await queue.get(record["id"]), status="running", attempts=1)
+
+        survivor = RedisJobBackend(redis)
+        queue.backend = survivor
+        assert await queue.recover_stale() == 1
+        requeued = await queue.get(record["id"])
+        assert await redis.lrange(dead.processing_key, 0, -1) == []
+
+        # Second interrupted attempt: out of attempts, so it fails
+        assert await survivor.dequeue(1) == record["id"]
+        await queue._update(await queue.get(record["id"]), status="running", attempts=2)
+        other = RedisJobBackend(redis)
+        queue.backend = other
+        assert await queue.recover_stale() == 1
+        failed = await queue.get(record["id"])
+        return requeued, failed, await redis.llen(other.processing_key), await redis.llen(RedisJobBackend.QUEUE_KEY)
+
+    requeued, failed, processing, queued = asyncio.run(scenario())
+    assert requeued["status"] == QUEUED
+    assert failed["status"] == FAILED
+    assert processing == 0 and queued == 0
+
+
+def test_live_workers_keep_their_jobs():
+    async def scenario():
+        redis = _redis()
+        queue = _queue()
+        busy = RedisJobBackend(redis)
+        queue.backend = busy
+        record = await queue.submit("double", {"n": 1})
+        await busy.heartbeat(30)
+        await busy.dequeue(1)
+
+        queue.backend = RedisJobBackend(redis)
+        recovered = await queue.recover_stale()
+        return recovered, await redis.lrange(busy.processing_key, 0, -1), record["id"]
+
+    recovered, processing, job_id = asyncio.run(scenario())
+    assert recovered == 0
+    assert processing == [job_id]
+
+
+def test_finished_jobs_leave_the_processing_list():
+    async def scenario():
+        redis = _redis()
+        queue = _queue()
+        backend = RedisJobBackend(redis)
+        queue.backend = backend
+        record = await queue.submit("double", {"n": 5})
+        await queue._process(await backend.dequeue(1))
+        return (
+            await queue.get(record["id"]),
+            await redis.llen(backend.processing_key),
+            await redis.exists(backend._payload_key(record["id"])),
+        )
+
+    done, processing, payload_left = asyncio.run(scenario())
+    assert done["status"] == SUCCEEDED
+    assert done["result"] == 10
+    assert processing == 0
+    assert payload_left == 0
@@ -0,0 +1,120 @@
+"""
+Tests for the job posting refresh scheduler.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import job_store
+from job_index import JobIndex
+from job_scraper import JobPosting
+from job_store import REFRESH_KEY_PREFIX, JobRefreshScheduler
+from skill_matcher import SkillVocabulary
+
+
+class _FakeStore:
+    def __init__(self):
+        self.upserted = []
+
+    async def upsert(self, jobs, retention):
+        self.upserted.extend(jobs)
+        return len(jobs)
+
+
+def _scheduler(store, redis):
+    scheduler = JobRefreshScheduler(
+        store, JobIndex(SkillVocabulary()), {"indeed": 3600}, ["Python"], retry_delay=60
+    )
+    scheduler._redis = redis
+    return scheduler
+
+
+def test_failed_refresh_releases_claim_and_retries_soon(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+
+    async def failing_scrape(source, skills, limit):
+        raise RuntimeError("source down")
+
+    monkeypatch.setattr(job_store.job_scraper_service, "scrape_source", failing_scrape)
+
+    async def scenario():
+        redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        scheduler = _scheduler(_FakeStore(), redis)
+        changed = await scheduler.refresh_source("indeed")
+        return changed, await redis.exists(f"{REFRESH_KEY_PREFIX}indeed"), scheduler._due_at["indeed"]
+
+    changed, claimed, due_at = asyncio.run(scenario())
+    assert changed == 0
+    assert not claimed
+    assert due_at <= datetime.utcnow() + timedelta(seconds=60)
+
+
+def test_successful_refresh_keeps_claim_for_ttl(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+
+    async def scrape(source, skills, limit):
+        return ["posting"]
+
+    monkeypatch.setattr(job_store.job_scraper_service, "scrape_source", scrape)
+
+    async def scenario():
+        redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        store = _FakeStore()
+        scheduler = _scheduler(store, redis)
+        first = await scheduler.refresh_source("indeed")
+        # Another worker finds the source claimed and leaves it alone
+        second = await _scheduler(store, redis).refresh_source("indeed")
+        return first, second, await redis.ttl(f"{REFRESH_KEY_PREFIX}indeed"), scheduler._due_at["indeed"]
+
+    first, second, ttl, due_at = asyncio.run(scenario())
+    assert (first, second) == (1, 0)
+    assert ttl > 3000
+    assert due_at > datetime.utcnow() + timedelta(seconds=3000)
+
+
+def test_start_does_not_wait_for_the_first_scrape(monkeypatch):
+    release = asyncio.Event()
+
+    async def hanging_scrape(source, skills, limit):
+        await release.wait()
+        return []
+
+    monkeypatch.setattr(job_store.job_scraper_service, "scrape_source", hanging_scrape)
+    posting = JobPosting(
+        id="1", title="Engineer", company="Acme", location="Remote", description="",
+        requirements=[], skills=["Python"], salary_range=None, job_type="full-time",
+        experience_level="mid", posted_date=datetime.utcnow(), application_url="",
+        source="Indeed", remote=True,
+    )
+    document = SimpleNamespace(
+        posting=posting,
+        scraped_at=datetime.utcnow(),
+        expires_at=datetime.utcnow() + timedelta(hours=1),
+    )
+
+    class _StoredPostings(_FakeStore):
+        async def last_scraped(self, source):
+            return None
+
+        async def changed_since(self, since):
+            yield document
+
+        def to_posting(self, stored):
+            return stored.posting
+
+    async def scenario():
+        scheduler = _scheduler(_StoredPostings(), None)
+        await asyncio.wait_for(scheduler.start(), timeout=1)
+        # Stored postings are searchable while the first scrape is still running
+        for _ in range(100):
+            if len(scheduler.index):
+                break
+            await asyncio.sleep(0.01)
+        indexed = len(scheduler.index)
+        release.set()
+        await scheduler.stop()
+        return indexed
+
+    assert asyncio.run(scenario()) == 1
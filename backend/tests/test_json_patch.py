@@ -0,0 +1,63 @@
+"""
+Round-trip tests for the JSON patch used by resume version deltas.
+"""
+import random
+
+import pytest
+
+from utils.json_patch import JsonPatchError, apply_patch, make_patch
+
+
+def _value(rng, depth=0):
+    kind = rng.randrange(6 if depth < 3 else 3)
+    if kind == 0:
+        return rng.choice([0, 1, 1.0, True, False, None])
+    if kind == 1:
+        return rng.choice(["", "a", "b/c", "d~e"])
+    if kind == 2:
+        return rng.randint(-3, 3)
+    if kind == 3:
+        return [_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {rng.choice(["x", "y", "a/b", "m~n"]): _value(rng, depth + 1) for _ in range(rng.randint(0, 3))}
+
+
+def _mutate(rng, value):
+    if isinstance(value, list):
+        value = [_mutate(rng, item) if rng.random() < 0.3 else item for item in value]
+        if rng.random() < 0.4:
+            value.insert(rng.randint(0, len(value)), _value(rng, 2))
+        if value and rng.random() < 0.4:
+            del value[rng.randrange(len(value))]
+        return value
+    if isinstance(value, dict):
+        value = {key: _mutate(rng, item) if rng.random() < 0.3 else item for key, item in value.items()}
+        if rng.random() < 0.3:
+            value[rng.choice(["x", "z", "p/q"])] = _value(rng, 2)
+        if value and rng.random() < 0.3:
+            del value[rng.choice(list(value))]
+        return value
+    return _value(rng, 2) if rng.random() < 0.5 else value
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_patch_round_trips(seed):
+    rng = random.Random(seed)
+    old = _value(rng)
+    new = _mutate(rng, old)
+
+    patched = apply_patch(old, make_patch(old, new))
+
+    assert patched == new
+    assert repr(patched) == repr(new)  # True, 1 and 1.0 stay distinct
+
+
+def test_inserting_into_a_list_costs_one_operation():
+    old = {"experience": [{"company": f"C{i}"} for i in range(20)]}
+    new = {"experience": [{"company": "New"}] + old["experience"]}
+
+    assert make_patch(old, new) == [{"op": "add", "path": "/experience/0", "value": {"company": "New"}}]
+
+
+def test_patch_that_does_not_fit_raises():
+    with pytest.raises(JsonPatchError):
+        apply_patch({"a": []}, [{"op": "remove", "path": "/a/0"}])
@@ -0,0 +1,24 @@
+"""
+Tests that FileParser.pre_process_resume matches the line-by-line
+implementation it replaced.
+"""
+import pytest
+
+from file_parser import FileParser
+from scripts.benchmark_pre_process import build_resume_text, legacy_pre_process_resume
+
+TEXTS = [
+    "",
+    "Jane Doe\njane@example.com\n(555) 123-4567",
+    "Jane Doe\n\nEXPERIENCE\nAcme\n  - Built things\nEducation\nState University\nSKILLS\nPython, Go",
+    "A name that is far too long\nCONTACT\nreach me at jane@example.com or 555.123.4567\nSUMMARY\nEngineer",
+    "Jane Doe\nwork experience: 5 years\nexperience\nexperience\nProjects and more projects",
+    "\n\n   \nJohn Smith\r\nCONTACT INFORMATION\r\njohn@example.org\r\n",
+    build_resume_text(1),
+    build_resume_text(12),
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_pre_process_matches_legacy_implementation(text):
+    assert FileParser.pre_process_resume(text) == legacy_pre_process_resume(text)
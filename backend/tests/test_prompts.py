@@ -0,0 +1,25 @@
+"""
+Tests for the shared prompt builders.
+"""
+from models import JobDescription, Resume
+from prompts import build_cover_letter_messages, build_parse_resume_messages
+
+RESUME_TEXT = "Jane Doe\n\nEXPERIENCE\n    Acme {Corp}\n      - Led a team of 5\n\n\nSKILLS\n  Python"
+
+
+def test_template_is_squeezed_but_resume_text_keeps_its_layout():
+    messages = build_parse_resume_messages(RESUME_TEXT)
+    content = messages[1]["content"]
+
+    assert RESUME_TEXT in content
+    template = content.replace(RESUME_TEXT, "")
+    assert not any(line != line.strip() for line in template.splitlines())
+
+
+def test_job_description_text_is_passed_through():
+    description = "About us\n\n  - Remote first\n  - {Flexible} hours"
+    job = JobDescription(title="Engineer", company="Acme", description=description)
+
+    messages = build_cover_letter_messages(Resume(), job)
+
+    assert f"Description: {description}\nRequirements: " in messages[1]["content"]
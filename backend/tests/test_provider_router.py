@@ -0,0 +1,47 @@
+"""
+Tests for provider fallback in the AI router.
+"""
+import asyncio
+import time
+
+import pytest
+
+from ai_provider import AIProvider, ProviderRouter
+
+
+class _Provider(AIProvider):
+    def __init__(self, name, delay=0.0, fail=False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.timeouts = []
+
+    async def complete(self, messages, temperature, timeout=None):
+        self.timeouts.append(timeout)
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ValueError(f"{self.name} failed")
+        return self.name
+
+
+def test_fallbacks_share_one_deadline():
+    slow = [_Provider(f"slow{i}", delay=10) for i in range(3)]
+    router = ProviderRouter(slow)
+
+    started = time.monotonic()
+    with pytest.raises(RuntimeError):
+        asyncio.run(router.complete([], 0.1, timeout=0.3))
+
+    assert time.monotonic() - started < 1.0
+    # The first provider used up the whole budget; the others were never tried
+    assert [len(p.timeouts) for p in slow] == [1, 0, 0]
+
+
+def test_fallback_gets_the_time_that_is_left():
+    failing = _Provider("failing", delay=0.2, fail=True)
+    healthy = _Provider("healthy")
+    router = ProviderRouter([failing, healthy], default_timeout=1.0)
+
+    assert asyncio.run(router.complete([], 0.1)) == "healthy"
+    assert failing.timeouts[0] == pytest.approx(1.0, abs=0.05)
+    assert healthy.timeouts[0] == pytest.approx(0.8, abs=0.1)
@@ -0,0 +1,84 @@
+"""
+Tests for tag-based cache invalidation and the local L1 tier.
+"""
+import asyncio
+
+import pytest
+
+from utils.redis_cache import (
+    INVALIDATE_TAG_LUA,
+    SET_WITH_TAGS_LUA,
+    TAG_KEY_PREFIX,
+    RedisCache,
+    default_tags,
+)
+from utils.local_cache import LocalCache
+
+
+def _cache():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")  # fakeredis needs it for Lua scripts
+    cache = RedisCache()
+    cache.redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    cache._set_with_tags = cache.redis_client.register_script(SET_WITH_TAGS_LUA)
+    cache._invalidate_tag = cache.redis_client.register_script(INVALIDATE_TAG_LUA)
+    return cache
+
+
+def test_default_tags():
+    assert default_tags("user:42:resumes:1:20") == ["user:42"]
+    assert default_tags("templates:get_all:abc") == ["ns:templates"]
+    assert default_tags("ai_response:optimize:abc") == []
+
+
+def test_short_lived_namespaces_get_no_tag_set_and_clear_by_scan():
+    async def scenario():
+        cache = _cache()
+        for i in range(20):
+            await cache.set(f"ai_response:optimize:{i}", {"i": i}, ttl=60)
+        await cache.set("templates:get_all:x", ["basic"], ttl=60)
+        tag_sets = sorted([key async for key in cache.redis_client.scan_iter(match=f"{TAG_KEY_PREFIX}*")])
+
+        await cache.clear_pattern("ai_response:*")
+        left = [key async for key in cache.redis_client.scan_iter(match="ai_response:*")]
+        template_kept = await cache.exists("templates:get_all:x")
+        return tag_sets, left, template_kept
+
+    tag_sets, left, template_kept = asyncio.run(scenario())
+    assert tag_sets == [f"{TAG_KEY_PREFIX}ns:templates"]
+    assert left == []
+    assert template_kept
+
+
+def test_tagged_namespace_is_cleared_from_its_tag_set():
+    async def scenario():
+        cache = _cache()
+        await cache.set("templates:get_all:x", ["basic"], ttl=60)
+        await cache.set("user:7:my_resume", {"id": "r"}, ttl=60)
+        await cache.clear_namespace("templates")
+        return await cache.exists("templates:get_all:x"), await cache.exists("user:7:my_resume")
+
+    assert asyncio.run(scenario()) == (False, True)
+
+
+def test_local_hits_return_the_decoded_value_without_decoding_again():
+    async def scenario():
+        cache = _cache()
+        cache.local = LocalCache(max_entries=10, default_ttl=60)
+        decoded = []
+        deserialize = cache._deserialize_value
+        cache._deserialize_value = lambda raw, model=None: decoded.append(raw) or deserialize(raw, model)
+
+        await cache.set("user:7:my_resume", {"id": "r"}, ttl=60)
+        first = await cache.get("user:7:my_resume")
+        second = await cache.get("user:7:my_resume")
+        reads = len(decoded)
+
+        await cache.set("user:7:my_resume", {"id": "s"}, ttl=60)
+        updated = await cache.get("user:7:my_resume")
+        return first, second, reads, updated
+
+    first, second, reads, updated = asyncio.run(scenario())
+    assert first == {"id": "r"} and second is first
+    assert reads == 1
+    assert updated == {"id": "s"}
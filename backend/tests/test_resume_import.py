@@ -0,0 +1,58 @@
+"""
+Tests for the resume import job payload and handler.
+"""
+import asyncio
+
+import pytest
+
+import resume_import
+from utils.job_queue import JobError
+
+
+class _Cache:
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+
+
+def _use_redis(monkeypatch, redis_client):
+    monkeypatch.setattr(resume_import.upload_cache, "cache", _Cache(redis_client))
+
+
+def test_payload_refers_to_the_stored_file(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    _use_redis(monkeypatch, fakeredis.FakeAsyncRedis(decode_responses=True))
+    imported = {}
+
+    async def fake_import(user_id, filename, file_content):
+        imported["content"] = file_content
+        return type("Saved", (), {"id": "r1"})()
+
+    monkeypatch.setattr(resume_import, "import_resume_file", fake_import)
+
+    async def scenario():
+        payload = await resume_import.build_parse_resume_payload("u1", "cv.pdf", b"%PDF" * 1000)
+        result = await resume_import.parse_resume_job(payload)
+        return payload, result
+
+    payload, result = asyncio.run(scenario())
+    assert "content" not in payload
+    assert result == {"resume_id": "r1"}
+    assert imported["content"] == b"%PDF" * 1000
+
+
+def test_payload_inlines_the_file_without_redis(monkeypatch):
+    _use_redis(monkeypatch, None)
+
+    payload = asyncio.run(resume_import.build_parse_resume_payload("u1", "cv.txt", b"Jane Doe"))
+
+    assert payload["content"]
+
+
+def test_expired_upload_fails_with_a_user_facing_error(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    _use_redis(monkeypatch, fakeredis.FakeAsyncRedis(decode_responses=True))
+
+    with pytest.raises(JobError) as error:
+        asyncio.run(resume_import.parse_resume_job({"user_id": "u1", "filename": "cv.pdf", "digest": "0" * 64}))
+
+    assert error.value.error_code == "UPLOAD_EXPIRED"
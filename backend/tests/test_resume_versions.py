@@ -0,0 +1,167 @@
+"""
+Tests for resume writes and versioning against an in-memory MongoDB.
+"""
+import asyncio
+
+import pytest
+from bson import ObjectId
+
+from core.exceptions import ConflictError, ValidationError
+from database import JobPostingDocument, Resume, ResumeVersion, User
+from db_service import ResumeService, _latest_version_content, resume_version_content, versioning_policy
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+RESUME_DATA = {
+    "personal_info": {"full_name": "Jane Doe", "email": "jane@example.com"},
+    "professional_summary": "Backend engineer",
+    "skills": ["Python", "Go"],
+    "experience": [
+        {"company": f"Company {i}", "position": "Engineer", "description": ["Built services " * 10] * 3}
+        for i in range(5)
+    ],
+}
+
+
+def _run(scenario):
+    """Run ``scenario`` against a fresh database with every save versioned."""
+    async def main():
+        from beanie import init_beanie
+
+        client = mongomock_motor.AsyncMongoMockClient()
+        await init_beanie(
+            database=client["test"],
+            document_models=[User, Resume, ResumeVersion, JobPostingDocument],
+        )
+        _latest_version_content.clear()
+        return await scenario()
+
+    window = versioning_policy.window
+    versioning_policy.window = 0
+    try:
+        return asyncio.run(main())
+    finally:
+        versioning_policy.window = window
+
+
+def test_returned_resumes_carry_the_new_version_counter():
+    async def scenario():
+        created = await ResumeService.create_resume("user", "Resume", RESUME_DATA)
+        updated = await ResumeService.update_resume(str(created.id), "user", {"professional_summary": "Lead"})
+        patched = await ResumeService.patch_resume(
+            str(created.id), "user", [{"op": "set", "path": "title", "value": "Renamed"}]
+        )
+        stored = await Resume.get(created.id)
+        return created, updated, patched, stored
+
+    created, updated, patched, stored = _run(scenario)
+    assert created.version_counter == 1 and created.versioned_at is not None
+    # Each write versions the state it replaces, so the first update has nothing new to keep
+    assert updated.version_counter == 1
+    assert patched.version_counter == 2
+    assert stored.version_counter == patched.version_counter
+    assert stored.revision == patched.revision
+
+
+def test_stale_revisions_are_rejected():
+    async def scenario():
+        created = await ResumeService.create_resume("user", "Resume", RESUME_DATA)
+        resume_id = str(created.id)
+        current = await ResumeService.update_resume(
+            resume_id, "user", {"title": "First"}, expected_revision=created.revision
+        )
+        errors = []
+        for write in (
+            ResumeService.update_resume(resume_id, "user", {"title": "Late"}, expected_revision=created.revision),
+            ResumeService.patch_resume(
+                resume_id, "user", [{"op": "set", "path": "title", "value": "Late"}],
+                expected_revision=created.revision,
+            ),
+        ):
+            with pytest.raises(ConflictError) as error:
+                await write
+            errors.append(error.value)
+        with pytest.raises(ValidationError):
+            await ResumeService.patch_resume(
+                resume_id, "user", [{"op": "set", "path": "experience.9.position", "value": "CTO"}]
+            )
+        missing = await ResumeService.update_resume(str(ObjectId()), "user", {"title": "Nope"}, expected_revision=0)
+        return current, errors, missing, await Resume.get(created.id)
+
+    current, errors, missing, stored = _run(scenario)
+    assert [error.details["revision"] for error in errors] == [current.revision, current.revision]
+    assert missing is None
+    assert stored.title == "First"
+    assert stored.revision == current.revision
+
+
+def test_field_patches_return_what_was_stored():
+    async def scenario():
+        created = await ResumeService.create_resume("user", "Resume", RESUME_DATA)
+        patched = await ResumeService.patch_resume(str(created.id), "user", [
+            {"op": "set", "path": "experience.1.position", "value": "Staff Engineer"},
+            {"op": "push", "path": "skills", "value": "Rust", "position": 0},
+            {"op": "pull", "path": "education", "value": {"institution": "Nowhere"}},
+            {"op": "set", "path": "personal_info.location", "value": "Berlin"},
+        ])
+        return patched, await Resume.get(created.id)
+
+    patched, stored = _run(scenario)
+    assert resume_version_content(patched) == resume_version_content(stored)
+    assert patched.revision == stored.revision
+    assert stored.experience[1].position == "Staff Engineer"
+    assert stored.skills[0] == "Rust"
+
+
+def test_versions_rebuild_every_earlier_state():
+    async def scenario():
+        created = await ResumeService.create_resume("user", "Resume", RESUME_DATA)
+        resume_id = str(created.id)
+        states = {1: resume_version_content(created)}
+        resume = created
+        for i in range(30):
+            updates = {"professional_summary": f"Summary {i} " + "x" * 200}
+            if i % 4 == 0:
+                updates["skills"] = ["Python", f"Skill {i}"]
+            if i % 7 == 0:
+                experience = [item.model_dump() for item in resume.experience]
+                experience.insert(0, {"company": f"New {i}", "position": "Lead", "description": ["Led"]})
+                updates["experience"] = experience
+            resume = await ResumeService.update_resume(resume_id, "user", updates)
+            states[resume.version_counter + 1] = resume_version_content(resume)
+            if i % 3 == 0:
+                _latest_version_content.clear()
+
+        versions = await ResumeService.get_resume_versions(resume_id, "user")
+        rebuilt = {v.version_number: await ResumeService.get_version_content(v) for v in versions}
+
+        oldest = min(versions, key=lambda v: v.version_number)
+        restored = await ResumeService.restore_resume_version(resume_id, str(oldest.id), "user")
+        after_restore = await Resume.get(created.id)
+        return states, versions, rebuilt, restored, after_restore
+
+    states, versions, rebuilt, restored, after_restore = _run(scenario)
+    assert {v.kind for v in versions} == {"keyframe", "delta"}
+    assert all(rebuilt[number] == states[number] for number in rebuilt)
+    assert len(rebuilt) == 30
+    assert restored
+    assert resume_version_content(after_restore) == states[1]
+    # The state replaced by the restore was versioned first
+    assert after_restore.version_counter == 31
+
+
+def test_bulk_operations_report_repeated_ids_once():
+    async def scenario():
+        first = await ResumeService.create_resume("user", "First", RESUME_DATA)
+        second = await ResumeService.create_resume("user", "Second", RESUME_DATA)
+        ids = [str(first.id), str(second.id), str(first.id), str(second.id)]
+        updated = await ResumeService.bulk_update_template("user", ids, "modern")
+        exported = await ResumeService.bulk_export_resumes("user", ids)
+        deleted = await ResumeService.bulk_delete_resumes("user", ids)
+        return ids, updated, exported, deleted, await Resume.get(first.id)
+
+    ids, updated, exported, deleted, stored = _run(scenario)
+    for results, status in ((updated, "updated"), (exported, "exported"), (deleted, "deleted")):
+        assert [r["id"] for r in results] == ids[:2]
+        assert [r["status"] for r in results] == [status, status]
+    assert stored is None
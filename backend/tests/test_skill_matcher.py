@@ -0,0 +1,70 @@
+"""
+Tests for batched skill matching against per-job set intersection.
+"""
+import random
+
+import pytest
+
+import skill_matcher as skill_matcher_module
+from skill_matcher import NUMPY_MIN_ROWS, SkillMatcher, SkillMatrix, match_score, normalize_skill
+
+SKILLS = [
+    "Python", "python3", "JS", "JavaScript", "React", "reactjs", "SQL", "AWS",
+    "Amazon Web Services", "Docker", "k8s", "Kubernetes", "Go", "golang", "Rust",
+]
+
+
+def _jobs(count, seed=3):
+    rng = random.Random(seed)
+    return [rng.sample(SKILLS, rng.randint(0, 8)) for _ in range(count)]
+
+
+def _brute_force(jobs, resume_skills):
+    resume = {normalize_skill(skill) for skill in resume_skills if skill.strip()}
+    scores = []
+    for job_skills in jobs:
+        job = {normalize_skill(skill) for skill in job_skills}
+        scores.append(match_score(len(job & resume), len(job), len(resume)))
+    return scores
+
+
+@pytest.mark.parametrize("rows", [10, NUMPY_MIN_ROWS + 50])
+@pytest.mark.parametrize("resume_skills", [
+    ["Python", "AWS"],
+    ["py", "Node", "k8s", "Haskell"],
+    ["  ", "golang"],
+    [],
+])
+def test_batched_scores_match_brute_force(rows, resume_skills):
+    jobs = _jobs(rows)
+    matcher = SkillMatcher()
+
+    assert matcher.match_scores(jobs, resume_skills) == pytest.approx(_brute_force(jobs, resume_skills))
+
+
+def test_python_fallback_matches_numpy(monkeypatch):
+    pytest.importorskip("numpy")
+    jobs = _jobs(NUMPY_MIN_ROWS * 2)
+    matrix = SkillMatrix(SkillMatcher().vocabulary)
+    for job_skills in jobs:
+        matrix.append(job_skills)
+    vectorized = matrix.scores(["Python", "Docker", "Rust"])
+
+    monkeypatch.setattr(skill_matcher_module, "np", None)
+
+    assert matrix.scores(["Python", "Docker", "Rust"]) == pytest.approx(vectorized)
+
+
+def test_matrix_picks_up_rows_and_skills_added_after_scoring():
+    matrix = SkillMatrix(SkillMatcher().vocabulary)
+    jobs = _jobs(NUMPY_MIN_ROWS)
+    for job_skills in jobs:
+        matrix.append(job_skills)
+    matrix.scores(["Python"])
+
+    # New skills widen every packed row, not just the appended one
+    extra = [f"Skill {i}" for i in range(70)]
+    jobs.append(extra + ["Python"])
+    matrix.append(jobs[-1])
+
+    assert matrix.scores(["Python", "Skill 69"]) == pytest.approx(_brute_force(jobs, ["Python", "Skill 69"]))
@@ -0,0 +1,180 @@
+"""
+Field-level updates for documents described by pydantic models.
+
+``build_update`` turns a list of ``set`` / ``push`` / ``pull`` operations
+on dotted paths (``"experience.2.position"``, ``"skills"``) into one
+MongoDB update document. Values are validated against the model's field
+types first. ``apply_operations`` applies the same operations to a plain
+dict, with MongoDB's semantics, so callers can build the updated state
+without reading the document back.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+
+OPERATIONS = ("set", "push", "pull")
+
+
+class FieldUpdateError(ValueError):
+    """Raised for an operation that is malformed or does not fit the model."""
+
+
+@dataclass
+class FieldUpdate:
+    """A MongoDB update built from field operations."""
+    update: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Filter conditions that fail when a path indexes past the end of an
+    # array, where MongoDB would otherwise pad the array with nulls
+    guards: Dict[str, Any] = field(default_factory=dict)
+    # The operations with validated values, for ``apply_operations``
+    operations: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _list_item_type(annotation: Any) -> Optional[Any]:
+    if get_origin(annotation) in (list, List):
+        args = get_args(annotation)
+        return args[0] if args else Any
+    return None
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def resolve_path(model: type, path: str, protected: Iterable[str] = ()) -> Tuple[List[Union[str, int]], Any]:
+    """Tokens of ``path`` and the type of the value it points at."""
+    if not path:
+        raise FieldUpdateError("Path must not be empty")
+    tokens: List[Union[str, int]] = []
+    annotation: Any = model
+    for position, token in enumerate(path.split(".")):
+        item_type = _list_item_type(annotation)
+        if item_type is not None:
+            if not token.isdigit():
+                raise FieldUpdateError(f"Expected an array index at '{token}' in {path}")
+            tokens.append(int(token))
+            annotation = _unwrap_optional(item_type)
+        elif _is_model(annotation):
+            if token not in annotation.model_fields or (position == 0 and token in protected):
+                raise FieldUpdateError(f"Unknown or read-only field '{token}' in {path}")
+            tokens.append(token)
+            annotation = _unwrap_optional(annotation.model_fields[token].annotation)
+        else:
+            raise FieldUpdateError(f"Cannot index into '{tokens[-1]}' in {path}")
+    return tokens, annotation
+
+
+def _validate(annotation: Any, value: Any, path: str) -> Any:
+    adapter = TypeAdapter(annotation)
+    try:
+        return adapter.dump_python(adapter.validate_python(value))
+    except PydanticValidationError as e:
+        raise FieldUpdateError(f"Invalid value for {path}: {e.errors()[0]['msg']}") from e
+
+
+def _pull_condition(item_type: Any, value: Any, path: str) -> Any:
+    # A partial object removes every element whose given fields all match
+    if _is_model(item_type) and isinstance(value, dict):
+        condition = {}
+        for key, item in value.items():
+            if key not in item_type.model_fields:
+                raise FieldUpdateError(f"Unknown field '{key}' in pull condition for {path}")
+            condition[key] = _validate(item_type.model_fields[key].annotation, item, f"{path}.{key}")
+        if not condition:
+            raise FieldUpdateError(f"Empty pull condition for {path}")
+        return condition
+    return _validate(item_type, value, path)
+
+
+def _overlaps(a: str, b: str) -> bool:
+    return a == b or a.startswith(b + ".") or b.startswith(a + ".")
+
+
+def build_update(model: type, operations: Iterable[Dict[str, Any]], protected: Iterable[str] = ()) -> FieldUpdate:
+    """Validate ``operations`` against ``model`` and build one MongoDB update.
+
+    Each operation is ``{"op", "path", "value"}``, plus an optional
+    ``position`` for ``push``. MongoDB rejects updates that touch a path
+    and its parent or child together, so such operations raise
+    ``FieldUpdateError`` and have to be sent as separate updates.
+    """
+    protected = set(protected)
+    result = FieldUpdate()
+    paths: List[str] = []
+    for operation in operations:
+        op, path, value = operation.get("op"), operation.get("path", ""), operation.get("value")
+        if op not in OPERATIONS:
+            raise FieldUpdateError(f"Unsupported operation: {op}")
+        tokens, annotation = resolve_path(model, path, protected)
+
+        for other in paths:
+            if _overlaps(path, other):
+                raise FieldUpdateError(f"Conflicting operations on {path} and {other}")
+        paths.append(path)
+
+        for i, token in enumerate(tokens):
+            if isinstance(token, int):
+                result.guards[".".join(str(t) for t in tokens[:i + 1])] = {"$exists": True}
+
+        if op == "set":
+            value = _validate(annotation, value, path)
+            result.update.setdefault("$set", {})[path] = value
+        else:
+            item_type = _list_item_type(annotation)
+            if item_type is None:
+                raise FieldUpdateError(f"{op} needs an array field, {path} is not one")
+            item_type = _unwrap_optional(item_type)
+            if op == "push":
+                value = _validate(item_type, value, path)
+                push: Dict[str, Any] = {"$each": [value]}
+                if operation.get("position") is not None:
+                    push["$position"] = int(operation["position"])
+                result.update.setdefault("$push", {})[path] = push
+            else:
+                value = _pull_condition(item_type, value, path)
+                result.update.setdefault("$pull", {})[path] = value
+
+        result.operations.append({**operation, "op": op, "path": path, "value": value, "tokens": tokens})
+    if not result.operations:
+        raise FieldUpdateError("No operations given")
+    return result
+
+
+def _matches(item: Any, condition: Any) -> bool:
+    if isinstance(condition, dict) and isinstance(item, dict):
+        return all(item.get(key) == value for key, value in condition.items())
+    return item == condition
+
+
+def apply_operations(document: Dict[str, Any], operations: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Apply operations validated by ``build_update`` to ``document`` in place."""
+    for operation in operations:
+        tokens = operation["tokens"]
+        parent: Any = document
+        for token in tokens[:-1]:
+            parent = parent[token]
+        last = tokens[-1]
+        if operation["op"] == "set":
+            parent[last] = operation["value"]
+        elif operation["op"] == "push":
+            items = parent[last]
+            position = operation.get("position")
+            if position is None:
+                items.append(operation["value"])
+            else:
+                items.insert(int(position), operation["value"])
+        else:
+            parent[last] = [item for item in parent[last] if not _matches(item, operation["value"])]
+    return document
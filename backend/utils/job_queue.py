@@ -0,0 +1,337 @@
+"""
+Background job queue for long-running work such as resume parsing.
+
+Jobs are submitted with a JSON payload and processed by a pool of worker
+tasks. Job state lives in a backend: ``RedisJobBackend`` shares the queue
+and job records between all workers/processes, ``InMemoryJobBackend`` is a
+process-local stand-in used when Redis is unavailable and in tests.
+
+A dequeued job stays on its process's processing list until it finishes.
+Each process keeps a heartbeat key alive; jobs left on the processing
+list of a process whose heartbeat expired are re-queued, or failed once
+they have used up their attempts.
+
+Failed records only carry a generic message and error code, which are
+returned to clients; handlers raise ``JobError`` for failures the user can
+act on, and everything else is logged here with its details.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from core.config import settings
+from utils.redis_cache import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+JOB_FAILED = "JOB_FAILED"
+WORKER_STOPPED = "WORKER_STOPPED"
+
+
+class JobError(Exception):
+    """A job failure whose message is safe to show to the job's owner."""
+
+    def __init__(self, message: str, error_code: str = JOB_FAILED) -> None:
+        super().__init__(message)
+        self.message = message
+        self.error_code = error_code
+
+
+class InMemoryJobBackend:
+    """Process-local job storage."""
+
+    def __init__(self) -> None:
+        self._queue: Deque[str] = deque()
+        self._ready = asyncio.Event()
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._payloads: Dict[str, Dict[str, Any]] = {}
+
+    async def save(self, record: Dict[str, Any], ttl: int) -> None:
+        self._records[record["id"]] = dict(record)
+
+    async def load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        record = self._records.get(job_id)
+        return dict(record) if record else None
+
+    async def enqueue(self, record: Dict[str, Any], payload: Dict[str, Any], ttl: int) -> None:
+        await self.save(record, ttl)
+        self._payloads[record["id"]] = payload
+        self._queue.append(record["id"])
+        self._ready.set()
+
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        if not self._queue:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._queue.popleft() if self._queue else None
+
+    async def load_payload(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self._payloads.get(job_id)
+
+    async def ack(self, job_id: str) -> None:
+        self._payloads.pop(job_id, None)
+
+    async def requeue(self, job_id: str) -> None:
+        self._queue.append(job_id)
+        self._ready.set()
+
+    async def heartbeat(self, ttl: int) -> None:
+        pass
+
+    async def claim_stale(self) -> List[str]:
+        # Jobs can't outlive the process that holds them
+        return []
+
+
+class RedisJobBackend:
+    """Redis job storage shared by every worker process."""
+
+    QUEUE_KEY = "jobs:queue"
+    PROCESSING_PREFIX = "jobs:processing:"
+    CONSUMER_PREFIX = "jobs:consumer:"
+
+    def __init__(self, redis_client: Any) -> None:
+        self.redis = redis_client
+        self.consumer = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.processing_key = f"{self.PROCESSING_PREFIX}{self.consumer}"
+
+    @staticmethod
+    def _record_key(job_id: str) -> str:
+        return f"job:{job_id}"
+
+    @staticmethod
+    def _payload_key(job_id: str) -> str:
+        return f"job:{job_id}:payload"
+
+    async def save(self, record: Dict[str, Any], ttl: int) -> None:
+        await self.redis.setex(self._record_key(record["id"]), ttl, dumps(record))
+
+    async def load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = await self.redis.get(self._record_key(job_id))
+        return loads(raw) if raw else None
+
+    async def enqueue(self, record: Dict[str, Any], payload: Dict[str, Any], ttl: int) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.setex(self._record_key(record["id"]), ttl, dumps(record))
+            pipe.setex(self._payload_key(record["id"]), ttl, dumps(payload))
+            pipe.lpush(self.QUEUE_KEY, record["id"])
+            await pipe.execute()
+
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        # Keep the blocking timeout below the client's socket timeout
+        return await self.redis.blmove(
+            self.QUEUE_KEY, self.processing_key, max(1, int(timeout)), src="RIGHT", dest="LEFT"
+        )
+
+    async def load_payload(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = await self.redis.get(self._payload_key(job_id))
+        return loads(raw) if raw else None
+
+    async def ack(self, job_id: str) -> None:
+        """Take a finished job off this process's processing list."""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.lrem(self.processing_key, 1, job_id)
+            pipe.delete(self._payload_key(job_id))
+            await pipe.execute()
+
+    async def requeue(self, job_id: str) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.lrem(self.processing_key, 1, job_id)
+            pipe.lpush(self.QUEUE_KEY, job_id)
+            await pipe.execute()
+
+    async def heartbeat(self, ttl: int) -> None:
+        await self.redis.setex(f"{self.CONSUMER_PREFIX}{self.consumer}", ttl, "1")
+
+    async def claim_stale(self) -> List[str]:
+        """Move jobs held by processes with an expired heartbeat onto our processing list."""
+        claimed: List[str] = []
+        async for key in self.redis.scan_iter(match=f"{self.PROCESSING_PREFIX}*"):
+            consumer = key[len(self.PROCESSING_PREFIX):]
+            if consumer == self.consumer or await self.redis.exists(f"{self.CONSUMER_PREFIX}{consumer}"):
+                continue
+            # LMOVE hands each job to exactly one claiming process
+            while True:
+                job_id = await self.redis.lmove(key, self.processing_key, "RIGHT", "LEFT")
+                if job_id is None:
+                    break
+                claimed.append(job_id)
+        return claimed
+
+
+class JobQueue:
+    """Dispatches queued jobs to registered handlers on a pool of worker tasks."""
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        job_ttl: int = 3600,
+        poll_timeout: float = 2.0,
+        max_attempts: int = 2,
+        heartbeat_interval: float = 15.0,
+    ) -> None:
+        self.concurrency = concurrency
+        self.job_ttl = job_ttl
+        self.poll_timeout = poll_timeout
+        self.max_attempts = max_attempts
+        self.heartbeat_interval = heartbeat_interval
+        self.backend: Optional[Any] = None
+        self._handlers: Dict[str, JobHandler] = {}
+        self._workers: List[asyncio.Task] = []
+
+    def register(self, job_type: str) -> Callable[[JobHandler], JobHandler]:
+        """Decorator registering ``handler(payload) -> result`` for ``job_type``."""
+        def decorator(handler: JobHandler) -> JobHandler:
+            self._handlers[job_type] = handler
+            return handler
+        return decorator
+
+    async def start(self, backend: Any) -> None:
+        """Attach a backend and start the worker tasks."""
+        self.backend = backend
+        try:
+            await self._heartbeat()
+            await self.recover_stale()
+        except Exception as e:
+            logger.error(f"Recovering stale jobs failed: {e}")
+        self._workers = [
+            asyncio.create_task(self._worker(i)) for i in range(self.concurrency)
+        ]
+        self._workers.append(asyncio.create_task(self._monitor()))
+        logger.info(f"Job queue started with {self.concurrency} workers ({type(backend).__name__})")
+
+    async def stop(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(self, job_type: str, payload: Dict[str, Any], owner_id: Optional[str] = None) -> Dict[str, Any]:
+        """Queue a job and return its initial record without waiting for it."""
+        if self.backend is None:
+            raise RuntimeError("Job queue not started")
+        if job_type not in self._handlers:
+            raise ValueError(f"No handler registered for job type {job_type}")
+
+        now = datetime.utcnow().isoformat()
+        record = {
+            "id": uuid.uuid4().hex,
+            "type": job_type,
+            "owner_id": owner_id,
+            "status": QUEUED,
+            "result": None,
+            "error": None,
+            "error_code": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        await self.backend.enqueue(record, payload, self.job_ttl)
+        return record
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        if self.backend is None:
+            return None
+        return await self.backend.load(job_id)
+
+    async def _update(self, record: Dict[str, Any], **changes: Any) -> None:
+        record.update(changes, updated_at=datetime.utcnow().isoformat())
+        await self.backend.save(record, self.job_ttl)
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            try:
+                job_id = await self.backend.dequeue(self.poll_timeout)
+                if job_id:
+                    await self._process(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job worker {index} error: {e}")
+                await asyncio.sleep(1)
+
+    async def _heartbeat(self) -> None:
+        await self.backend.heartbeat(max(1, int(self.heartbeat_interval * 3)))
+
+    async def _monitor(self) -> None:
+        """Keep this process's heartbeat alive and recover jobs of dead ones."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await self._heartbeat()
+                await self.recover_stale()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job monitor error: {e}")
+
+    async def recover_stale(self) -> int:
+        """Re-queue jobs whose worker died, or fail them once out of attempts."""
+        recovered = 0
+        for job_id in await self.backend.claim_stale():
+            record = await self.backend.load(job_id)
+            if record is None:
+                await self.backend.ack(job_id)
+                continue
+            if record.get("attempts", 0) < self.max_attempts:
+                await self._update(record, status=QUEUED)
+                await self.backend.requeue(job_id)
+                logger.warning(f"Re-queued job {job_id} after its worker stopped")
+            else:
+                await self._update(
+                    record, status=FAILED, error="The worker processing this job stopped", error_code=WORKER_STOPPED
+                )
+                await self.backend.ack(job_id)
+                logger.warning(f"Failed job {job_id} after {record['attempts']} interrupted attempts")
+            recovered += 1
+        return recovered
+
+    async def _process(self, job_id: str) -> None:
+        record = await self.backend.load(job_id)
+        payload = await self.backend.load_payload(job_id)
+        if record is None or payload is None:
+            logger.warning(f"Job {job_id} expired before it was processed")
+            await self.backend.ack(job_id)
+            return
+
+        await self._update(record, status=RUNNING, attempts=record.get("attempts", 0) + 1)
+        try:
+            result = await self._handlers[record["type"]](payload)
+        except JobError as e:
+            logger.warning(f"Job {job_id} ({record['type']}) failed: {e.message}")
+            await self._update(record, status=FAILED, error=e.message, error_code=e.error_code)
+            await self.backend.ack(job_id)
+            return
+        except Exception as e:
+            # Provider and internal error text stays in the server log
+            logger.error(f"Job {job_id} ({record['type']}) failed: {e}", exc_info=True)
+            await self._update(record, status=FAILED, error="The job failed", error_code=JOB_FAILED)
+            await self.backend.ack(job_id)
+            return
+        await self._update(record, status=SUCCEEDED, result=result)
+        await self.backend.ack(job_id)
+
+
+# Global job queue; started on application startup
+job_queue = JobQueue(
+    concurrency=settings.job_queue_concurrency,
+    job_ttl=settings.job_ttl,
+    max_attempts=settings.job_max_attempts,
+    heartbeat_interval=settings.job_heartbeat_interval,
+)
@@ -0,0 +1,138 @@
+"""
+Minimal JSON Patch (RFC 6902) diff and apply for plain JSON values.
+
+``make_patch`` emits only ``add``, ``remove`` and ``replace`` operations.
+Lists are diffed after trimming their common prefix and suffix, so
+inserting or removing an item anywhere costs one operation instead of
+rewriting every item after it.
+"""
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, List
+
+Patch = List[Dict[str, Any]]
+
+
+class JsonPatchError(ValueError):
+    """Raised when a patch does not apply to the given document."""
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _equal(a: Any, b: Any) -> bool:
+    # Type-strict, so True / 1 / 1.0 are not conflated as they are by ==
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_equal(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> Patch:
+    """Operations that turn ``old`` into ``new``."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: Patch = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(make_patch(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        return _list_patch(old, new, path)
+
+    if not _equal(old, new):
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+def _list_patch(old: list, new: list, path: str) -> Patch:
+    prefix = 0
+    limit = min(len(old), len(new))
+    while prefix < limit and _equal(old[prefix], new[prefix]):
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and _equal(old[-1 - suffix], new[-1 - suffix]):
+        suffix += 1
+
+    old_middle = old[prefix:len(old) - suffix]
+    new_middle = new[prefix:len(new) - suffix]
+    paired = min(len(old_middle), len(new_middle))
+
+    ops: Patch = []
+    for i in range(paired):
+        ops.extend(make_patch(old_middle[i], new_middle[i], f"{path}/{prefix + i}"))
+    for i in range(paired, len(new_middle)):
+        ops.append({"op": "add", "path": f"{path}/{prefix + i}", "value": new_middle[i]})
+    for _ in range(paired, len(old_middle)):
+        ops.append({"op": "remove", "path": f"{path}/{prefix + paired}"})
+    return ops
+
+
+def _resolve(document: Any, path: str):
+    """Parent container and final token of ``path``."""
+    if not path.startswith("/"):
+        raise JsonPatchError(f"Invalid JSON pointer: {path!r}")
+    tokens = [_unescape(token) for token in path[1:].split("/")]
+    parent = document
+    try:
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+    except (KeyError, IndexError, ValueError, TypeError) as e:
+        raise JsonPatchError(f"Path not found: {path}") from e
+    return parent, tokens[-1]
+
+
+def apply_patch(document: Any, patch: Patch) -> Any:
+    """Return a copy of ``document`` with ``patch`` applied."""
+    result = copy.deepcopy(document)
+    for operation in patch:
+        op, path = operation.get("op"), operation.get("path", "")
+        if path == "":
+            if op not in ("add", "replace"):
+                raise JsonPatchError(f"Cannot {op} the document root")
+            result = copy.deepcopy(operation["value"])
+            continue
+
+        parent, token = _resolve(result, path)
+        try:
+            if isinstance(parent, list):
+                index = len(parent) if token == "-" else int(token)
+                if op == "add":
+                    if not 0 <= index <= len(parent):
+                        raise IndexError(index)
+                    parent.insert(index, copy.deepcopy(operation["value"]))
+                elif op == "remove":
+                    del parent[index]
+                elif op == "replace":
+                    parent[index] = copy.deepcopy(operation["value"])
+                else:
+                    raise JsonPatchError(f"Unsupported operation: {op}")
+            elif isinstance(parent, dict):
+                if op in ("add", "replace"):
+                    if op == "replace" and token not in parent:
+                        raise KeyError(token)
+                    parent[token] = copy.deepcopy(operation["value"])
+                elif op == "remove":
+                    del parent[token]
+                else:
+                    raise JsonPatchError(f"Unsupported operation: {op}")
+            else:
+                raise JsonPatchError(f"Path not found: {path}")
+        except (KeyError, IndexError, ValueError) as e:
+            raise JsonPatchError(f"Cannot {op} {path}") from e
+    return result
@@ -0,0 +1,91 @@
+"""
+Incremental parser for a streamed JSON object.
+
+LLM output for structured operations is a single JSON object that arrives
+in small text chunks. ``JSONSectionStream`` scans the chunks as they come
+in and returns each top-level member (e.g. ``"experience": [...]``) as soon
+as its value is complete, so sections can be forwarded before the whole
+object has been generated.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class JSONSectionStream:
+    """Emit ``(key, value)`` pairs for completed top-level object members."""
+
+    def __init__(self) -> None:
+        self.buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._started = False
+        self._done = False
+        self._key_start: Optional[int] = None
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+
+    @property
+    def done(self) -> bool:
+        """True once the closing brace of the top-level object was seen."""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Consume ``chunk`` and return the members completed by it."""
+        self.buffer += chunk
+        completed: List[Tuple[str, Any]] = []
+        buf = self.buffer
+        while self._pos < len(buf) and not self._done:
+            ch = buf[self._pos]
+            if not self._started:
+                # Skip anything before the object, e.g. a ```json fence
+                if ch == "{":
+                    self._started = True
+                    self._depth = 1
+                self._pos += 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._key is None and self._key_start is not None:
+                        self._key = json.loads(buf[self._key_start:self._pos + 1])
+                self._pos += 1
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._key is None and self._value_start is None:
+                    self._key_start = self._pos
+            elif ch == ":" and self._depth == 1 and self._key is not None and self._value_start is None:
+                self._value_start = self._pos + 1
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(buf, completed)
+                    self._done = True
+            elif ch == "," and self._depth == 1:
+                self._emit(buf, completed)
+            self._pos += 1
+        return completed
+
+    def _emit(self, buf: str, completed: List[Tuple[str, Any]]) -> None:
+        if self._key is not None and self._value_start is not None:
+            raw = buf[self._value_start:self._pos].strip()
+            try:
+                completed.append((self._key, json.loads(raw)))
+            except ValueError:
+                # Malformed member; the final full parse reports the error
+                pass
+        self._key_start = None
+        self._key = None
+        self._value_start = None
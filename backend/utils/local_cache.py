@@ -0,0 +1,70 @@
+"""
+Bounded in-process LRU cache with per-entry TTL.
+
+Used as the L1 tier in front of Redis. Entries are only touched from the
+event loop thread, so no locking is needed.
+"""
+from __future__ import annotations
+
+import fnmatch
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Tuple
+
+
+class LocalCache:
+    """LRU cache evicting the least recently used entry beyond ``max_entries``."""
+
+    def __init__(self, max_entries: int = 1024, default_ttl: float = 60.0) -> None:
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        # key -> (expires_at, value)
+        self._store: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._store.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._store[key]
+            self.misses += 1
+            return None
+        self._store.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.default_ttl if ttl is None else min(ttl, self.default_ttl)
+        if ttl <= 0:
+            return
+        self._store[key] = (time.monotonic() + ttl, value)
+        self._store.move_to_end(key)
+        while len(self._store) > self.max_entries:
+            self._store.popitem(last=False)
+
+    def delete(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._store.pop(key, None)
+
+    def delete_matching(self, pattern: str) -> None:
+        """Drop entries whose key matches a Redis-style glob ``pattern``."""
+        for key in [k for k in self._store if fnmatch.fnmatchcase(k, pattern)]:
+            del self._store[key]
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._store),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
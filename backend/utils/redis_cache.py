@@ -1,21 +1,165 @@
 """
 Redis cache utilities for the Resume Builder application.
 """
+import asyncio
+import functools
+import hashlib
+import inspect
 import json
 import logging
-from typing import Any, Optional, Union
+import uuid
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, Union
 from datetime import datetime, date
 import redis.asyncio as redis
+from pydantic import BaseModel
 from core.config import settings
+from utils.local_cache import LocalCache
+from utils.single_flight import SingleFlight
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson optional, falls back to json
+    orjson = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Pydantic models are stored as "@<module>:<QualName>\n<model JSON>" so a hit
+# can be rehydrated into the same type straight from the JSON payload.
+TYPED_VALUE_MARKER = "@"
+
+_cache_types: Dict[str, Type[BaseModel]] = {}
+
+
+def _type_name(model: Type[BaseModel]) -> str:
+    return f"{model.__module__}:{model.__qualname__}"
+
+
+def register_cache_type(model: Type[BaseModel]) -> Type[BaseModel]:
+    """Allow cached values of ``model`` to be rehydrated on read.
+
+    Only registered types are ever instantiated from cache payloads; other
+    typed payloads are returned as plain data.
+    """
+    _cache_types[_type_name(model)] = model
+    return model
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        # Handle Pydantic models
+        return obj.model_dump(mode="json")
+    elif isinstance(obj, (datetime, date)):
+        # Handle datetime objects
+        return obj.isoformat()
+    elif hasattr(obj, 'isoformat'):
+        # Handle other date-like objects
+        return obj.isoformat()
+    elif isinstance(obj, (set, frozenset)):
+        return list(obj)
+    elif hasattr(obj, '__dict__'):
+        # Handle regular objects
+        return obj.__dict__
+    else:
+        # Fallback to string representation
+        return str(obj)
+
+
+def dumps(value: Any) -> str:
+    """Encode ``value`` as compact JSON text (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(value, default=_json_default, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(raw: Union[str, bytes]) -> Any:
+    """Decode JSON text produced by :func:`dumps`."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Pub/sub channel used to keep every worker's L1 cache coherent
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# Every cached key is registered in one or more tag sets ("tag:<tag>") so
+# invalidation touches only that tag's keys instead of running KEYS over
+# the whole keyspace. Tag sets live at least as long as their newest member.
+TAG_KEY_PREFIX = "tag:"
+
+# KEYS[1] = cache key, KEYS[2..n] = tag sets; ARGV[1] = ttl, ARGV[2] = value
+SET_WITH_TAGS_LUA = """
+local ttl = tonumber(ARGV[1])
+redis.call('SETEX', KEYS[1], ttl, ARGV[2])
+for i = 2, #KEYS do
+    redis.call('SADD', KEYS[i], KEYS[1])
+    if redis.call('TTL', KEYS[i]) < ttl then
+        redis.call('EXPIRE', KEYS[i], ttl)
+    end
+end
+return 1
+"""
+
+# KEYS[1] = tag set; deletes every member and the set, returns the members
+INVALIDATE_TAG_LUA = """
+local members = redis.call('SMEMBERS', KEYS[1])
+for i = 1, #members, 500 do
+    redis.call('DEL', unpack(members, i, math.min(i + 499, #members)))
+end
+redis.call('DEL', KEYS[1])
+return members
+"""
+
+
+# cache_result namespaces holding many short-lived keys (one per distinct
+# call). They get no tag set, which would only accumulate members whose
+# keys had expired; clearing them falls back to SCAN.
+UNTAGGED_NAMESPACES = frozenset({"ai_response", "user_data"})
+
+
+def user_tag(user_id: str) -> str:
+    return f"user:{user_id}"
+
+
+def namespace_tag(namespace: str) -> str:
+    return f"ns:{namespace}"
+
+
+def default_tags(key: str) -> List[str]:
+    """Tags a key is indexed under when the caller doesn't pass any.
+
+    ``user:<id>:...`` keys are tagged with their user, everything else with
+    its namespace (the first key segment, e.g. ``templates`` for
+    ``cache_result`` keys), except for ``UNTAGGED_NAMESPACES``.
+    """
+    parts = key.split(":")
+    if parts[0] == "user" and len(parts) > 2:
+        return [user_tag(parts[1])]
+    if parts[0] in UNTAGGED_NAMESPACES:
+        return []
+    return [namespace_tag(parts[0])]
+
+
 class RedisCache:
-    """Redis cache client with async operations."""
+    """Redis cache client with async operations.
+
+    When ``settings.local_cache_enabled`` is set, reads are served from a
+    bounded in-process LRU (L1) in front of Redis (L2). Every write and
+    invalidation is broadcast on ``INVALIDATION_CHANNEL`` so other workers
+    drop their stale L1 copies.
+
+    L1 holds decoded values, so a local hit does no JSON work. The same
+    object is handed to every caller that reads the key until it is
+    invalidated or expires: treat cached values as read-only.
+    """
     
     def __init__(self):
         self.redis_client: Optional[redis.Redis] = None
         self._connection_pool = None
+        self.local: Optional[LocalCache] = None
+        self._node_id = uuid.uuid4().hex
+        self._listener_task: Optional[asyncio.Task] = None
+        self._set_with_tags = None
+        self._invalidate_tag = None
     
     async def connect(self):
         """Initialize Redis connection."""
@@ -41,6 +185,16 @@ class RedisCache:
             # Test connection
             await self.redis_client.ping()
             logger.info("Redis cache connected successfully")
+
+            self._set_with_tags = self.redis_client.register_script(SET_WITH_TAGS_LUA)
+            self._invalidate_tag = self.redis_client.register_script(INVALIDATE_TAG_LUA)
+
+            if settings.local_cache_enabled:
+                self.local = LocalCache(
+                    max_entries=settings.local_cache_max_entries,
+                    default_ttl=settings.local_cache_ttl,
+                )
+                self._listener_task = asyncio.create_task(self._listen_for_invalidations())
             
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
@@ -48,59 +202,157 @@ class RedisCache:
     
     async def disconnect(self):
         """Close Redis connection."""
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        self.local = None
         if self.redis_client:
             await self.redis_client.close()
             logger.info("Redis cache disconnected")
+
+    async def _listen_for_invalidations(self):
+        """Apply invalidations published by other workers to the local L1."""
+        while True:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Anything cached before (re)subscribing may have missed messages
+                if self.local is not None:
+                    self.local.clear()
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    event = loads(message["data"])
+                    if event.get("origin") != self._node_id:
+                        self._invalidate_local(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Cache invalidation listener error, retrying: {e}")
+                if self.local is not None:
+                    self.local.clear()
+                await asyncio.sleep(1)
+            finally:
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
+
+    def _invalidate_local(self, event: Dict[str, Any]) -> None:
+        if self.local is None:
+            return
+        if event.get("all"):
+            self.local.clear()
+        if event.get("keys"):
+            self.local.delete(event["keys"])
+        if event.get("pattern"):
+            self.local.delete_matching(event["pattern"])
+
+    def _invalidation_message(self, **event: Any) -> str:
+        return dumps({"origin": self._node_id, **event})
+
+    async def _publish_invalidation(self, **event: Any) -> None:
+        """Drop matching L1 entries here and in every other worker."""
+        if self.local is None:
+            return
+        self._invalidate_local(event)
+        try:
+            await self.redis_client.publish(INVALIDATION_CHANNEL, self._invalidation_message(**event))
+        except Exception as e:
+            logger.error(f"Error publishing cache invalidation: {e}")
     
-    async def get(self, key: str) -> Optional[Any]:
-        """Get value from cache."""
+    async def get(self, key: str, model: Optional[Type[BaseModel]] = None) -> Optional[Any]:
+        """Get value from cache.
+
+        Values cached from a Pydantic model come back as that model; pass
+        ``model`` to force rehydration into a specific type.
+        """
         if not self.redis_client:
             return None
         
         try:
-            value = await self.redis_client.get(key)
-            if value:
-                return json.loads(value)
-            return None
+            if self.local is None:
+                value = await self.redis_client.get(key)
+                return self._deserialize_value(value, model) if value else None
+
+            # L1 entries are (model, decoded value); a read asking for another
+            # model decodes the Redis payload again
+            entry = self.local.get(key)
+            if entry is not None and entry[0] is model:
+                return entry[1]
+
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.get(key)
+                pipe.ttl(key)
+                value, ttl = await pipe.execute()
+            if not value:
+                return None
+            decoded = self._deserialize_value(value, model)
+            self.local.set(key, (model, decoded), ttl if ttl > 0 else None)
+            return decoded
         except Exception as e:
             logger.error(f"Error getting cache key {key}: {e}")
             return None
+
+    def _deserialize_value(self, raw: str, model: Optional[Type[BaseModel]] = None) -> Any:
+        """Decode a cached payload, rehydrating typed values."""
+        if raw.startswith(TYPED_VALUE_MARKER):
+            header, _, body = raw.partition("\n")
+            model = model or _cache_types.get(header[len(TYPED_VALUE_MARKER):])
+            if model is not None:
+                # Validate straight from JSON: no intermediate dict
+                return model.model_validate_json(body)
+            return loads(body)
+
+        data = loads(raw)
+        if model is not None and data is not None:
+            return model.model_validate(data)
+        return data
     
     def _serialize_value(self, value: Any) -> str:
         """Serialize value to JSON with proper handling of complex objects."""
-        def custom_serializer(obj):
-            if hasattr(obj, 'dict'):
-                # Handle Pydantic models
-                return obj.dict()
-            elif hasattr(obj, '__dict__'):
-                # Handle regular objects
-                return obj.__dict__
-            elif isinstance(obj, (datetime, date)):
-                # Handle datetime objects
-                return obj.isoformat()
-            elif hasattr(obj, 'isoformat'):
-                # Handle other date-like objects
-                return obj.isoformat()
-            else:
-                # Fallback to string representation
-                return str(obj)
-        
         try:
-            return json.dumps(value, default=custom_serializer, ensure_ascii=False)
+            if isinstance(value, BaseModel):
+                model = register_cache_type(type(value))
+                return f"{TYPED_VALUE_MARKER}{_type_name(model)}\n{value.model_dump_json()}"
+            return dumps(value)
         except Exception as e:
             logger.error(f"Error serializing value for cache: {e}")
             # Fallback to string representation
-            return json.dumps(str(value), ensure_ascii=False)
+            return dumps(str(value))
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> bool:
+        """Set value in cache with optional TTL.
 
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
-        """Set value in cache with optional TTL."""
+        The key is registered under ``tags`` (``default_tags(key)`` when not
+        given) so ``invalidate_tags`` can remove it without scanning.
+        """
         if not self.redis_client:
             return False
         
         try:
             ttl = ttl or settings.redis_cache_ttl
             serialized_value = self._serialize_value(value)
-            await self.redis_client.setex(key, ttl, serialized_value)
+            tag_keys = [f"{TAG_KEY_PREFIX}{tag}" for tag in (tags if tags is not None else default_tags(key))]
+            # Write, index and tell other workers to drop their old copy in one round trip
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                await self._set_with_tags(keys=[key, *tag_keys], args=[ttl, serialized_value], client=pipe)
+                if self.local is not None:
+                    pipe.publish(INVALIDATION_CHANNEL, self._invalidation_message(keys=[key]))
+                await pipe.execute()
+            if self.local is not None:
+                # Not filled from ``value``: the caller still holds that object
+                self.local.delete([key])
             return True
         except Exception as e:
             logger.error(f"Error setting cache key {key}: {e}")
@@ -113,6 +365,7 @@ class RedisCache:
         
         try:
             await self.redis_client.delete(key)
+            await self._publish_invalidation(keys=[key])
             return True
         except Exception as e:
             logger.error(f"Error deleting cache key {key}: {e}")
@@ -140,19 +393,51 @@ class RedisCache:
             logger.error(f"Error setting expiration for key {key}: {e}")
             return False
     
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Delete every key registered under ``tags``.
+
+        Cost is proportional to the number of keys carrying the tags; the
+        keyspace is never scanned. Returns the number of keys removed.
+        """
+        if not self.redis_client:
+            return 0
+
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                await self._invalidate_tag(keys=[f"{TAG_KEY_PREFIX}{tag}"], client=pipe)
+            results = await pipe.execute()
+        keys = [key for members in results for key in members]
+        if keys:
+            await self._publish_invalidation(keys=keys)
+        return len(keys)
+
     async def clear_user_cache(self, user_id: str):
         """Clear all cache entries for a specific user."""
         if not self.redis_client:
             return
         
         try:
-            pattern = f"user:{user_id}:*"
-            keys = await self.redis_client.keys(pattern)
-            if keys:
-                await self.redis_client.delete(*keys)
-                logger.info(f"Cleared {len(keys)} cache entries for user {user_id}")
+            cleared = await self.invalidate_tags(user_tag(user_id))
+            if cleared:
+                logger.info(f"Cleared {cleared} cache entries for user {user_id}")
         except Exception as e:
             logger.error(f"Error clearing user cache for {user_id}: {e}")
+
+    async def clear_namespace(self, namespace: str):
+        """Clear all cache entries in a namespace (e.g. ``templates``)."""
+        if not self.redis_client:
+            return
+
+        if namespace in UNTAGGED_NAMESPACES:
+            await self._clear_by_scan(f"{namespace}:*")
+            return
+
+        try:
+            cleared = await self.invalidate_tags(namespace_tag(namespace))
+            if cleared:
+                logger.info(f"Cleared {cleared} cache entries in namespace {namespace}")
+        except Exception as e:
+            logger.error(f"Error clearing cache namespace {namespace}: {e}")
     
     async def clear_all_cache(self):
         """Clear all cache entries."""
@@ -161,46 +446,179 @@ class RedisCache:
         
         try:
             await self.redis_client.flushdb()
+            await self._publish_invalidation(all=True)
             logger.info("Cleared all cache entries")
         except Exception as e:
             logger.error(f"Error clearing all cache: {e}")
     
     async def clear_pattern(self, pattern: str):
-        """Clear cache entries matching a pattern."""
+        """Clear cache entries matching a pattern.
+
+        ``user:<id>:*`` and tagged ``<namespace>:*`` patterns are served from
+        the tag index. Any other pattern falls back to an incremental SCAN,
+        which never blocks Redis the way KEYS does but still walks the
+        keyspace.
+        """
         if not self.redis_client:
             return
         
+        prefix = pattern[:-2] if pattern.endswith(":*") else None
+        if prefix and not any(c in prefix for c in "*?["):
+            parts = prefix.split(":")
+            if parts[0] == "user" and len(parts) == 2:
+                await self.clear_user_cache(parts[1])
+                return
+            if len(parts) == 1:
+                await self.clear_namespace(prefix)
+                return
+        await self._clear_by_scan(pattern)
+
+    async def _clear_by_scan(self, pattern: str) -> None:
+        """Delete keys matching ``pattern`` with an incremental SCAN."""
         try:
-            keys = await self.redis_client.keys(pattern)
-            if keys:
-                await self.redis_client.delete(*keys)
-                logger.info(f"Cleared {len(keys)} cache entries matching pattern: {pattern}")
+            logger.warning(f"Clearing untagged cache pattern {pattern} with SCAN")
+            cleared = 0
+            batch: List[str] = []
+            async for key in self.redis_client.scan_iter(match=pattern, count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    cleared += await self.redis_client.delete(*batch)
+                    batch = []
+            if batch:
+                cleared += await self.redis_client.delete(*batch)
+            if cleared:
+                logger.info(f"Cleared {cleared} cache entries matching pattern: {pattern}")
+            await self._publish_invalidation(pattern=pattern)
         except Exception as e:
             logger.error(f"Error clearing cache pattern {pattern}: {e}")
 
 # Global cache instance
 cache = RedisCache()
 
+# Coalesces identical in-flight calls made through cache_result(single_flight=True)
+_single_flight = SingleFlight(cache, lock_ttl=settings.single_flight_lock_ttl)
+
+def canonicalize(value: Any) -> Any:
+    """Convert a value into plain JSON data with a stable, process-independent form.
+
+    Pydantic models are dumped, mappings are key-sorted and sets are ordered,
+    so equal inputs always serialize to the same bytes.
+    """
+    if isinstance(value, BaseModel):
+        return canonicalize(value.model_dump(mode="json"))
+    if isinstance(value, dict):
+        return {str(k): canonicalize(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        items = [canonicalize(v) for v in value]
+        return sorted(items, key=lambda v: json.dumps(v, sort_keys=True))
+    if isinstance(value, Enum):
+        return canonicalize(value.value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    # Never fall back to repr(): it may embed memory addresses
+    return f"{type(value).__module__}.{type(value).__qualname__}"
+
+
+def build_cache_key(func: Callable, args: tuple, kwargs: Dict[str, Any], key_prefix: str = "", version: str = "") -> str:
+    """Build a content-addressed cache key for a call to ``func``.
+
+    Arguments are bound to parameter names (so positional and keyword calls
+    share a key) and hashed with SHA-256. A bound ``self`` is replaced by its
+    ``cache_fingerprint`` attribute (e.g. the prompt version) or
+    its class name, never by its repr.
+    """
+    try:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        call_args = dict(bound.arguments)
+    except TypeError:
+        call_args = {"args": list(args), "kwargs": kwargs}
+
+    fingerprint = None
+    for owner in ("self", "cls"):
+        if owner in call_args:
+            instance = call_args.pop(owner)
+            fingerprint = getattr(instance, "cache_fingerprint", None) or (
+                instance.__qualname__ if isinstance(instance, type) else type(instance).__qualname__
+            )
+
+    payload = json.dumps(
+        {"v": version, "fp": fingerprint, "args": canonicalize(call_args)},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{key_prefix}:{func.__qualname__}:{digest}"
+
+
+class CacheBypass(Exception):
+    """Raised inside a cached function to return ``value`` without caching it.
+
+    Used for degraded fallbacks (e.g. an empty resume after an AI error) that
+    must not be served from cache once the upstream recovers.
+    """
+
+    def __init__(self, value: Any):
+        super().__init__("cache bypass")
+        self.value = value
+
+
 # Cache decorators
-def cache_result(ttl: Optional[int] = None, key_prefix: str = ""):
-    """Decorator to cache function results."""
+def cache_result(
+    ttl: Optional[int] = None,
+    key_prefix: str = "",
+    version: str = "",
+    single_flight: bool = False,
+):
+    """Decorator to cache function results.
+
+    With ``single_flight``, concurrent calls that miss the cache for the
+    same key share one execution, in this process and across workers.
+    """
     def decorator(func):
+        # Rehydrate hits into the declared return model (e.g. models.Resume)
+        return_type = inspect.signature(func).return_annotation
+        result_model = None
+        if inspect.isclass(return_type) and issubclass(return_type, BaseModel):
+            result_model = register_cache_type(return_type)
+
+        @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             # Generate cache key
-            cache_key = f"{key_prefix}:{func.__name__}:{hash(str(args) + str(sorted(kwargs.items())))}"
+            cache_key = build_cache_key(func, args, kwargs, key_prefix, version)
             
             # Try to get from cache
-            cached_result = await cache.get(cache_key)
+            cached_result = await cache.get(cache_key, model=result_model)
             if cached_result is not None:
                 logger.debug(f"Cache hit for {cache_key}")
                 return cached_result
-            
-            # Execute function and cache result
-            result = await func(*args, **kwargs)
-            await cache.set(cache_key, result, ttl)
-            logger.debug(f"Cached result for {cache_key}")
-            
-            return result
+
+            async def compute():
+                # Execute function and cache result
+                try:
+                    result = await func(*args, **kwargs)
+                except CacheBypass as bypass:
+                    return bypass.value
+                await cache.set(cache_key, result, ttl)
+                logger.debug(f"Cached result for {cache_key}")
+                return result
+
+            if single_flight:
+                return await _single_flight.do(
+                    cache_key, compute, lambda: cache.get(cache_key, model=result_model)
+                )
+            return await compute()
+
+        # Let callers that produce the same result another way (e.g. a
+        # streamed variant) read and populate this function's cache entries
+        wrapper.cache_key = lambda *args, **kwargs: build_cache_key(func, args, kwargs, key_prefix, version)
+        wrapper.cache_ttl = ttl
+        wrapper.result_model = result_model
         return wrapper
     return decorator
 
@@ -209,5 +627,10 @@ def cache_user_data(ttl: Optional[int] = None):
     return cache_result(ttl or settings.redis_user_cache_ttl, "user_data")
 
 def cache_ai_response(ttl: Optional[int] = None):
-    """Decorator to cache AI service responses."""
-    return cache_result(ttl or settings.redis_ai_cache_ttl, "ai_response")
+    """Decorator to cache AI service responses.
+
+    Keys are content-addressed; the decorated service's ``cache_fingerprint``
+    should identify the prompt version that produced the result.
+    Identical concurrent requests are coalesced into one upstream call.
+    """
+    return cache_result(ttl or settings.redis_ai_cache_ttl, "ai_response", single_flight=True)
@@ -0,0 +1,198 @@
+"""
+Client-side protection for calls to upstream sites.
+
+``SourceGuard`` combines a concurrency cap, a token-bucket rate limit,
+retries with jittered exponential backoff and a circuit breaker, so a
+scraper can call a site through one ``guard.call(...)`` without
+stampeding it or hammering it while it is down.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a source whose circuit breaker is open."""
+
+    def __init__(self, name: str, retry_in: float) -> None:
+        super().__init__(f"Circuit for {name} is open; retrying in {retry_in:.0f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class RetryableError(Exception):
+    """A failure worth retrying, optionally with a server-requested delay."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Allows ``rate`` acquisitions per second with bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures.
+
+    While open, calls fail fast; after ``reset_timeout`` seconds a single
+    trial call is let through (half-open) and its outcome closes or
+    re-opens the circuit.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 300.0) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        state = self.state
+        if state == "closed":
+            return
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+        retry_in = self.reset_timeout - (time.monotonic() - self._opened_at)
+        raise CircuitOpenError(self.name, max(0.0, retry_in))
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info(f"Circuit for {self.name} closed")
+        self.failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_cancelled(self) -> None:
+        # A cancelled trial says nothing about the source; allow another
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self._opened_at is not None or self.failures >= self.failure_threshold:
+            if self._opened_at is None:
+                logger.warning(f"Circuit for {self.name} opened after {self.failures} consecutive failures")
+            self._opened_at = time.monotonic()
+
+
+def backoff_delay(attempt: int, base: float, maximum: float) -> float:
+    """Full-jitter exponential backoff for retry ``attempt`` (0-based)."""
+    return random.uniform(0, min(maximum, base * 2 ** attempt))
+
+
+async def retry_with_backoff(
+    call: Callable[[], Awaitable[T]],
+    retries: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 10.0,
+    retry_on: Tuple[Type[BaseException], ...] = (RetryableError,),
+    name: str = "call",
+) -> T:
+    """Run ``call``, retrying ``retry_on`` errors up to ``retries`` times."""
+    for attempt in range(retries + 1):
+        try:
+            return await call()
+        except retry_on as e:
+            if attempt == retries:
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            retry_after = getattr(e, "retry_after", None)
+            if retry_after:
+                delay = max(delay, min(retry_after, max_delay))
+            logger.warning(f"{name} failed ({e}); retry {attempt + 1}/{retries} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+class SourceGuard:
+    """Concurrency cap, rate limit, retries and circuit breaker for one source."""
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: int = 2,
+        rate: float = 1.0,
+        burst: int = 3,
+        retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 300.0,
+        retry_on: Tuple[Type[BaseException], ...] = (RetryableError, asyncio.TimeoutError),
+    ) -> None:
+        self.name = name
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker(name, failure_threshold, reset_timeout)
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+
+    async def _attempt(self, call: Callable[[], Awaitable[T]]) -> T:
+        # Each attempt, retries included, takes a slot and a token
+        async with self.semaphore:
+            await self.bucket.acquire()
+            return await call()
+
+    async def call(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Run ``call`` under this source's limits; raises ``CircuitOpenError`` if open."""
+        self.breaker.before_call()
+        try:
+            result = await retry_with_backoff(
+                lambda: self._attempt(call),
+                retries=self.retries,
+                base_delay=self.base_delay,
+                max_delay=self.max_delay,
+                retry_on=self.retry_on,
+                name=self.name,
+            )
+        except asyncio.CancelledError:
+            self.breaker.record_cancelled()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
+
+    def stats(self) -> dict:
+        return {"state": self.breaker.state, "consecutive_failures": self.breaker.failures}
@@ -0,0 +1,106 @@
+"""
+Single-flight request coalescing.
+
+Concurrent calls for the same key share one execution: callers in the same
+process await a shared task, and callers in other workers wait on a Redis
+lock and pick the result up from the cache once the lock holder stores it.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+LOCK_KEY_PREFIX = "sf:lock:"
+
+# Delete the lock only if we still own it
+RELEASE_LOCK_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class SingleFlight:
+    """Coalesce identical in-flight calls within and across workers.
+
+    ``cache`` only needs a ``redis_client`` attribute; without Redis the
+    coalescing is process-local.
+    """
+
+    def __init__(self, cache: Any, lock_ttl: float = 130.0, poll_interval: float = 0.25) -> None:
+        self.cache = cache
+        self.lock_ttl = lock_ttl
+        self.poll_interval = poll_interval
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def do(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        load_cached: Callable[[], Awaitable[Optional[Any]]],
+    ) -> Any:
+        """Return ``compute()`` for ``key``, running it at most once at a time.
+
+        ``compute`` must store its result where ``load_cached`` finds it, so
+        workers that lost the lock race can read it back.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run(key, compute, load_cached))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.debug(f"Joining in-flight call for {key}")
+        # Shield so one caller being cancelled doesn't cancel the shared call
+        return await asyncio.shield(task)
+
+    async def _run(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        load_cached: Callable[[], Awaitable[Optional[Any]]],
+    ) -> Any:
+        redis_client = getattr(self.cache, "redis_client", None)
+        if redis_client is None:
+            return await compute()
+
+        lock_key = f"{LOCK_KEY_PREFIX}{key}"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.lock_ttl
+        while True:
+            try:
+                acquired = await redis_client.set(lock_key, token, nx=True, px=int(self.lock_ttl * 1000))
+            except Exception as e:
+                logger.error(f"Single-flight lock error for {key}, running uncoordinated: {e}")
+                return await compute()
+
+            if acquired:
+                try:
+                    return await compute()
+                finally:
+                    await self._release(redis_client, lock_key, token)
+
+            # Another worker is computing it: wait for its result
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.poll_interval)
+                cached = await load_cached()
+                if cached is not None:
+                    return cached
+                if not await redis_client.exists(lock_key):
+                    # Holder finished without caching (or died); take over
+                    break
+            else:
+                logger.warning(f"Timed out waiting for single-flight holder of {key}")
+                return await compute()
+
+    async def _release(self, redis_client: Any, lock_key: str, token: str) -> None:
+        try:
+            await redis_client.eval(RELEASE_LOCK_LUA, 1, lock_key, token)
+        except Exception as e:
+            logger.error(f"Error releasing single-flight lock {lock_key}: {e}")
@@ -0,0 +1,145 @@
+"""
+Prompt-size budgeting for LLM calls.
+
+Upstream latency and cost grow with prompt tokens, so prompt builders run
+their variable content through these helpers: estimate tokens locally,
+drop hints that repeat the main text, minify JSON, and cut the least
+valuable content first when something exceeds its budget.
+"""
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Rough characters-per-token ratio for English prose and JSON
+CHARS_PER_TOKEN = 4
+
+_encoding = None
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of ``text`` without calling the provider.
+
+    Uses tiktoken's ``cl100k_base`` encoding when installed, otherwise a
+    character-ratio estimate.
+    """
+    global _encoding
+    if not text:
+        return 0
+    if tiktoken is not None:
+        if _encoding is None:
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        return len(_encoding.encode(text, disallowed_special=()))
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def truncate_text(text: str, max_tokens: int, marker: str = " [...]") -> str:
+    """Keep the beginning of ``text`` within ``max_tokens``, cutting at a word boundary."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    limit = max(0, max_tokens * CHARS_PER_TOKEN - len(marker))
+    cut = text[:limit]
+    # Tokenizer estimates can exceed the ratio; shrink until it fits
+    while cut and estimate_tokens(cut + marker) > max_tokens:
+        cut = cut[: int(len(cut) * 0.9)]
+    space = cut.rfind(" ")
+    if space > len(cut) // 2:
+        cut = cut[:space]
+    return cut.rstrip() + marker
+
+
+def squeeze_lines(text: str) -> str:
+    """Strip per-line indentation and blank lines from a prompt template."""
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+def _normalize(text: str) -> str:
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+def dedupe_hints(hints: Optional[Dict[str, Any]], text: str) -> Optional[Dict[str, Any]]:
+    """Drop pre-processed section contents that already appear in ``text``.
+
+    Section previews from ``FileParser.pre_process_resume`` are copied out
+    of the resume text, so sending both pays for the same tokens twice.
+    Section names and extracted contact fields are kept.
+    """
+    if not hints or not hints.get("sections"):
+        return hints
+    normalized_text = _normalize(text)
+    sections = {
+        name: content
+        for name, content in hints["sections"].items()
+        if content and _normalize(content) not in normalized_text
+    }
+    return {**hints, "sections": sections}
+
+
+def _prune_empty(value: Any) -> Any:
+    if isinstance(value, dict):
+        pruned = {k: _prune_empty(v) for k, v in value.items()}
+        return {k: v for k, v in pruned.items() if v not in (None, "", [], {})}
+    if isinstance(value, list):
+        return [_prune_empty(v) for v in value if v not in (None, "", [], {})]
+    return value
+
+
+def minify_json(data: Dict[str, Any]) -> str:
+    """Compact JSON with empty nested values removed; top-level keys are kept."""
+    pruned = {key: _prune_empty(value) for key, value in data.items()}
+    return json.dumps(pruned, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def fit_json(
+    data: Dict[str, Any],
+    max_tokens: int,
+    trim_order: Iterable[str],
+) -> str:
+    """Minify ``data`` and trim list sections until it fits in ``max_tokens``.
+
+    Sections in ``trim_order`` are trimmed in that order (lowest value
+    first), each from its last item backwards: an item's own list fields
+    (e.g. description bullets) are shortened before the item is dropped.
+    """
+    data = json.loads(minify_json(data))
+    encoded = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    for section in trim_order:
+        items = data.get(section)
+        while isinstance(items, list) and items and estimate_tokens(encoded) > max_tokens:
+            last = items[-1]
+            nested = [v for v in last.values() if isinstance(v, list) and v] if isinstance(last, dict) else []
+            if nested:
+                nested[-1].pop()
+            else:
+                items.pop()
+            encoded = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    if estimate_tokens(encoded) > max_tokens:
+        encoded = truncate_text(encoded, max_tokens)
+    return encoded
+
+
+def pack_by_budget(costs: List[int], budget: int, max_items: int) -> List[List[int]]:
+    """Group item indices greedily so each group's total cost fits ``budget``.
+
+    Items are placed first-fit in decreasing cost order; an item larger than
+    the budget gets a group of its own.
+    """
+    groups: List[List[int]] = []
+    totals: List[int] = []
+    for index in sorted(range(len(costs)), key=lambda i: costs[i], reverse=True):
+        for g, group in enumerate(groups):
+            if len(group) < max_items and totals[g] + costs[index] <= budget:
+                group.append(index)
+                totals[g] += costs[index]
+                break
+        else:
+            groups.append([index])
+            totals.append(costs[index])
+    return [sorted(group) for group in groups]
@@ -0,0 +1,122 @@
+"""
+Content-addressed cache for uploaded resume files.
+
+Uploads are identified by the SHA-256 of their bytes, so re-uploading the
+same document skips the pipeline stages that already ran for it:
+``extract`` (text extraction and pre-processing) and ``parse`` (the AI
+parse, additionally keyed on the AI prompt fingerprint). Entries are
+stored as zlib-compressed, base64-encoded JSON. Hits and misses are counted
+per stage in a Redis hash shared by all workers.
+
+The uploaded bytes themselves can be kept under the same digest
+(``put_file``), so background jobs carry only the digest in their payload.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import logging
+import zlib
+from typing import Any, Dict, Optional
+
+from core.config import settings
+from utils.redis_cache import cache, dumps, loads
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "upload"
+STATS_KEY = "upload_cache:stats"
+STAGES = ("extract", "parse")
+
+
+def content_digest(file_content: bytes) -> str:
+    return hashlib.sha256(file_content).hexdigest()
+
+
+def _encode_blob(value: Any) -> str:
+    return base64.b64encode(zlib.compress(dumps(value).encode("utf-8"))).decode("ascii")
+
+
+def _decode_blob(blob: str) -> Any:
+    return loads(zlib.decompress(base64.b64decode(blob)))
+
+
+class UploadCache:
+    """Per-stage results for uploaded files, keyed by content hash."""
+
+    def __init__(self, cache: Any, ttl: int) -> None:
+        self.cache = cache
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(digest: str, stage: str, variant: Optional[str] = None) -> str:
+        key = f"{KEY_PREFIX}:{digest}:{stage}"
+        if variant:
+            key += ":" + hashlib.sha256(variant.encode("utf-8")).hexdigest()[:16]
+        return key
+
+    async def get(self, digest: str, stage: str, variant: Optional[str] = None) -> Optional[Any]:
+        """Return the cached ``stage`` result for ``digest``, counting the lookup."""
+        redis_client = self.cache.redis_client
+        if redis_client is None:
+            return None
+        try:
+            blob = await redis_client.get(self._key(digest, stage, variant))
+            value = _decode_blob(blob) if blob else None
+            await redis_client.hincrby(STATS_KEY, f"{stage}:{'hit' if value is not None else 'miss'}", 1)
+            return value
+        except Exception as e:
+            logger.error(f"Upload cache get error for {digest}/{stage}: {e}")
+            return None
+
+    async def set(self, digest: str, stage: str, value: Any, variant: Optional[str] = None) -> None:
+        redis_client = self.cache.redis_client
+        if redis_client is None:
+            return
+        try:
+            await redis_client.setex(self._key(digest, stage, variant), self.ttl, _encode_blob(value))
+        except Exception as e:
+            logger.error(f"Upload cache set error for {digest}/{stage}: {e}")
+
+    async def put_file(self, digest: str, file_content: bytes, ttl: int) -> bool:
+        """Keep the uploaded bytes for ``ttl`` seconds; False if they could not be stored."""
+        redis_client = self.cache.redis_client
+        if redis_client is None:
+            return False
+        try:
+            blob = base64.b64encode(zlib.compress(file_content)).decode("ascii")
+            await redis_client.setex(self._key(digest, "file"), ttl, blob)
+            return True
+        except Exception as e:
+            logger.error(f"Upload cache put_file error for {digest}: {e}")
+            return False
+
+    async def get_file(self, digest: str) -> Optional[bytes]:
+        redis_client = self.cache.redis_client
+        if redis_client is None:
+            return None
+        try:
+            blob = await redis_client.get(self._key(digest, "file"))
+            return zlib.decompress(base64.b64decode(blob)) if blob else None
+        except Exception as e:
+            logger.error(f"Upload cache get_file error for {digest}: {e}")
+            return None
+
+    async def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counts per stage across all workers."""
+        counts: Dict[str, str] = {}
+        if self.cache.redis_client is not None:
+            try:
+                counts = await self.cache.redis_client.hgetall(STATS_KEY)
+            except Exception as e:
+                logger.error(f"Upload cache stats error: {e}")
+        return {
+            stage: {
+                "hits": int(counts.get(f"{stage}:hit", 0)),
+                "misses": int(counts.get(f"{stage}:miss", 0)),
+            }
+            for stage in STAGES
+        }
+
+
+upload_cache = UploadCache(cache, ttl=settings.upload_cache_ttl)
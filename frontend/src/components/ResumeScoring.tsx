@@ -28,13 +28,14 @@ export const ResumeScoring: React.FC = () => {
     return 'Needs Improvement';
   };
 
-  const handleScoreResume = async () => {
+  const handleScoreResume = async (includeAiFeedback: boolean = false) => {
     setIsLoading(true);
     try {
       console.log('Sending resume data for scoring:', resume);
       const scoringResult = await resumeService.scoreResume(
         resume,
-        jobDescription || undefined
+        jobDescription || undefined,
+        includeAiFeedback
       );
       setResult(scoringResult);
     } catch (error: any) {
@@ -80,12 +81,19 @@ export const ResumeScoring: React.FC = () => {
       )}
 
       <button
-        onClick={handleScoreResume}
+        onClick={() => handleScoreResume()}
         disabled={isLoading}
         className="w-full bg-blue-600 text-white py-2 px-4 rounded-md hover:bg-blue-700 disabled:opacity-50 disabled:cursor-not-allowed transition-colors"
       >
         {isLoading ? 'Analyzing...' : 'Analyze Resume'}
       </button>
+      <button
+        onClick={() => handleScoreResume(true)}
+        disabled={isLoading}
+        className="w-full mt-2 text-sm text-blue-600 hover:text-blue-800 disabled:opacity-50 disabled:cursor-not-allowed"
+      >
+        Get detailed AI feedback
+      </button>
 
       {result && (
         <div className="mt-6 space-y-4">
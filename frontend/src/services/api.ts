@@ -1,5 +1,5 @@
 import apiClient from './apiClient';
-import type { Resume, OptimizeResumeRequest, GenerateResumeRequest, Skill } from '../types';
+import type { Resume, OptimizeResumeRequest, GenerateResumeRequest, Skill, BackgroundJob } from '../types';
 import type { SignupRequest, LoginRequest, AuthResponse } from '../types/auth';
 
 // Helpers to map between backend <-> frontend skill shapes
@@ -85,6 +85,12 @@ const mapResumeToBackend = (resume: Resume) => {
   };
 };
 
+// Resume uploads are parsed by a background job that the client polls
+const JOB_POLL_INTERVAL_MS = 1500;
+const JOB_POLL_TIMEOUT_MS = 5 * 60 * 1000;
+
+const wait = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
 export const apiService = {
   // Signup
   signup: async (userData: SignupRequest): Promise<AuthResponse> => {
@@ -102,12 +108,26 @@ export const apiService = {
     const formData = new FormData();
     formData.append('file', file);
 
-    const response = await apiClient.post('/resumes/ai/parse-and-save-resume', formData, {
+    const submitted = await apiClient.post<BackgroundJob>('/resumes/ai/parse-resume-jobs', formData, {
       headers: {
         'Content-Type': 'multipart/form-data',
       },
     });
 
+    let job = submitted.data;
+    const deadline = Date.now() + JOB_POLL_TIMEOUT_MS;
+    while (job.status === 'queued' || job.status === 'running') {
+      if (Date.now() > deadline) {
+        throw new Error('Resume parsing is taking too long. Please try again.');
+      }
+      await wait(JOB_POLL_INTERVAL_MS);
+      const status = await apiClient.get<BackgroundJob>(`/resumes/ai/jobs/${job.job_id}`);
+      job = status.data;
+    }
+
+    // A failed job answers with its error in the response detail
+    const response = await apiClient.get(`/resumes/ai/jobs/${job.job_id}/result`);
+
     console.log('Raw response from parseAndSaveResume:', response.data);
     console.log('Skills in raw response:', response.data.skills);
     
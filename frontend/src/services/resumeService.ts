@@ -131,12 +131,17 @@ class ResumeService {
     };
   }
 
-  async scoreResume(resume: Resume, jobDescription?: string): Promise<{ score: number; feedback: string[]; suggestions: string[] }> {
+  async scoreResume(
+    resume: Resume,
+    jobDescription?: string,
+    includeAiFeedback: boolean = false
+  ): Promise<{ score: number; feedback: string[]; suggestions: string[] }> {
     const response: AxiosResponse<{ score: number; feedback: string[]; suggestions: string[] }> = await apiClient.post(
       '/resumes/score',
       { 
         resume: resume, 
-        job_description: jobDescription 
+        job_description: jobDescription,
+        include_ai_feedback: includeAiFeedback
       }
     );
     return response.data;
@@ -87,3 +87,13 @@ export interface GenerateResumeRequest {
   job_description: JobDescription;
   user_background?: string;
 }
+
+export interface BackgroundJob {
+  job_id: string;
+  job_type: string;
+  status: 'queued' | 'running' | 'succeeded' | 'failed';
+  error?: string | null;
+  error_code?: string | null;
+  created_at: string;
+  updated_at: string;
+}